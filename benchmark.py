@@ -0,0 +1,649 @@
+# Benchmark headless untuk Sistem Voting (tanpa Tk mainloop)
+# Contoh:
+#   python benchmark.py beban --pemilih 100000 --bandingkan benchmarks/baseline.json
+#   python benchmark.py store --suara 20000 --batch 1 10 100 1000
+#   python benchmark.py hash --iterasi 1000 10000 100000 600000 --impor 1000000
+#   python benchmark.py irv --surat 1000000 --kandidat 8
+#   python benchmark.py memori --jumlah 1000000 10000000
+#   python benchmark.py multistasiun --stasiun 8 --pemilih 200000
+#   python benchmark.py serangan --laju 1000 --banjir 1000000
+import argparse
+import csv
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from projectAkhir_Kelompok3_GUI import (
+    Admin, JurnalSuara, KlienKoordinator, Ketua, Kontes, LoginManager, PasanganKandidat,
+    PemilihStore, PengirimBatch, PilihanPeringkat, StatusAkses, StatusVote, VotingEngine, VotingSystem,
+    Wakil, hash_password,
+)
+
+SKRIP_APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "projectAkhir_Kelompok3_GUI.py")
+
+
+def buat_pasangan(jumlah=3):
+    return [PasanganKandidat(Ketua(f"Ketua{i}"), Wakil(f"Wakil{i}"), "Visi") for i in range(jumlah)]
+
+
+def buat_voting_system(store, pasangan):
+    vs = VotingSystem(store=store)
+    for p in pasangan:
+        vs.tambah_pasangan(p)
+    vs.pulihkan()
+    return vs
+
+
+# --- Benchmark penyimpanan suara (fsync batching) ---
+def bench_store(args):
+    pasangan = buat_pasangan()
+    print(f"{'fsync_batch':>11} {'suara/detik':>12} {'pulih (ms)':>11}")
+    for batch in args.batch:
+        folder = tempfile.mkdtemp(prefix="bench_store_", dir=args.dir)
+        try:
+            vs = buat_voting_system(JurnalSuara(folder, fsync_batch=batch), pasangan)
+            mulai = time.perf_counter()
+            for i in range(args.suara):
+                vs.catat_suara(f"pemilih{i}", pasangan[i % len(pasangan)])
+            vs.close()
+            durasi = time.perf_counter() - mulai
+
+            mulai = time.perf_counter()
+            vs = buat_voting_system(JurnalSuara(folder, fsync_batch=batch), pasangan)
+            durasi_pulih = time.perf_counter() - mulai
+            assert len(vs.get_log_voting()) == args.suara
+            vs.close()
+            print(f"{batch:>11} {args.suara / durasi:>12.0f} {durasi_pulih * 1000:>11.1f}")
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+
+
+# --- Benchmark beban: login, registrasi, voting, rekap ---
+def peak_rss_mb():
+    if resource is None:
+        return 0.0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+class Pengukur:
+    # Mengukur throughput seluruh loop; latensi diambil dari sampel (maks ~100k per fase)
+    def __init__(self, nama, jumlah_operasi, maks_sampel=100000):
+        self.nama = nama
+        self.jumlah_operasi = jumlah_operasi
+        self.setiap = max(1, jumlah_operasi // maks_sampel)
+        self.sampel = []
+
+    def jalankan(self, operasi):
+        rss_awal = peak_rss_mb()
+        setiap = self.setiap
+        catat = self.sampel.append
+        jam = time.perf_counter_ns
+        mulai = time.perf_counter()
+        for i in range(self.jumlah_operasi):
+            if i % setiap == 0:
+                t = jam()
+                operasi(i)
+                catat(jam() - t)
+            else:
+                operasi(i)
+        durasi = time.perf_counter() - mulai
+        self.sampel.sort()
+        return {
+            "operasi": self.jumlah_operasi,
+            "ops_per_detik": round(self.jumlah_operasi / durasi, 1) if durasi else 0.0,
+            "p50_us": round(self._persentil(0.50) / 1000, 3),
+            "p99_us": round(self._persentil(0.99) / 1000, 3),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+            "rss_naik_mb": round(peak_rss_mb() - rss_awal, 1),
+        }
+
+    def _persentil(self, p):
+        if not self.sampel:
+            return 0
+        return self.sampel[min(len(self.sampel) - 1, int(p * len(self.sampel)))]
+
+
+def ukur_beban(args):
+    # Satu putaran lengkap; data sintetis dibuat ulang dari seed yang sama
+    rng = random.Random(args.seed)
+    jumlah_pemilih = args.pemilih
+    jumlah_suara = min(args.suara if args.suara is not None else jumlah_pemilih, jumlah_pemilih)
+    pasangan = buat_pasangan(args.pasangan)
+    usernames = [f"p{i:08d}" for i in range(jumlah_pemilih)]
+    passwords = [f"{rng.getrandbits(32):08x}" for _ in range(jumlah_pemilih)]
+    pilihan = [rng.randrange(len(pasangan)) for _ in range(jumlah_suara)]
+
+    folder = tempfile.mkdtemp(prefix="bench_beban_") if args.jurnal else None
+    try:
+        store = JurnalSuara(folder, fsync_batch=args.fsync_batch) if folder else None
+        vs = buat_voting_system(store, pasangan)
+        # Hashing password diukur terpisah (perintah "hash"); di sini work factor dibuat minimal
+        lm = LoginManager([Admin("admin", "admin123")], admin_password="admin123", iterasi_hash=args.iterasi)
+        engine = VotingEngine(vs, lm)
+        hasil = {}
+
+        def register(i):
+            lm.register_pemilih(usernames[i], passwords[i])
+        hasil["register_pemilih"] = Pengukur("register_pemilih", jumlah_pemilih).jalankan(register)
+
+        jumlah_login = min(args.login, jumlah_pemilih)
+        acak = [rng.randrange(jumlah_pemilih) for _ in range(jumlah_login)]
+        def login(i):
+            j = acak[i]
+            # 10% percobaan dengan password salah
+            lm.login(usernames[j], passwords[j] if i % 10 else "salah")
+        hasil["login"] = Pengukur("login", jumlah_login).jalankan(login)
+
+        def cast_vote(i):
+            if engine.cast_vote(usernames[i], pilihan[i]) is not StatusVote.BERHASIL:
+                raise RuntimeError(f"suara {usernames[i]} ditolak")
+        hasil["cast_vote"] = Pengukur("cast_vote", jumlah_suara).jalankan(cast_vote)
+
+        vs_mentah = buat_voting_system(None, pasangan)
+        def tambah_suara(i):
+            vs_mentah.tambah_suara(pasangan[pilihan[i]])
+        hasil["tambah_suara"] = Pengukur("tambah_suara", jumlah_suara).jalankan(tambah_suara)
+
+        def get_hasil(i):
+            vs.get_hasil()
+        hasil["get_hasil"] = Pengukur("get_hasil", args.rekap).jalankan(get_hasil)
+        vs.close()
+    finally:
+        if folder:
+            shutil.rmtree(folder, ignore_errors=True)
+    return hasil, jumlah_pemilih, jumlah_suara, len(pasangan)
+
+
+def bench_beban(args):
+    # Median per fase dari --ulang putaran: satu putaran fase mikrodetik (tambah_suara,
+    # get_hasil) bisa meleset lebih dari toleransi hanya karena noise mesin.
+    # RSS diambil dari putaran pertama, karena peak RSS tidak turun di putaran berikutnya
+    putaran = [ukur_beban(args) for _ in range(max(1, args.ulang))]
+    _, jumlah_pemilih, jumlah_suara, jumlah_pasangan = putaran[0]
+    hasil = {}
+    for fase, pertama in putaran[0][0].items():
+        hasil[fase] = dict(pertama)
+        for kunci in ("ops_per_detik", "p50_us", "p99_us"):
+            hasil[fase][kunci] = statistics.median(p[0][fase][kunci] for p in putaran)
+
+    laporan = {
+        "meta": {
+            "pemilih": jumlah_pemilih,
+            "suara": jumlah_suara,
+            "pasangan": jumlah_pasangan,
+            "jurnal": bool(args.jurnal),
+            "iterasi_hash": args.iterasi,
+            "seed": args.seed,
+            "ulang": max(1, args.ulang),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "hasil": hasil,
+    }
+    print(f"{'fase':<17} {'operasi':>10} {'ops/detik':>12} {'p50 (us)':>10} {'p99 (us)':>10} {'RSS naik (MB)':>14}")
+    for fase, h in hasil.items():
+        print(f"{fase:<17} {h['operasi']:>10} {h['ops_per_detik']:>12.0f} {h['p50_us']:>10.2f} "
+              f"{h['p99_us']:>10.2f} {h['rss_naik_mb']:>14.1f}")
+    print(f"peak RSS: {peak_rss_mb():.1f} MB")
+
+    if args.simpan:
+        with open(args.simpan, "w", encoding="utf-8") as f:
+            json.dump(laporan, f, indent=2)
+            f.write("\n")
+    if args.bandingkan:
+        return bandingkan(laporan, args.bandingkan, args.toleransi, args.toleransi_p99)
+    return 0
+
+
+def bandingkan(laporan, path_baseline, toleransi, toleransi_p99):
+    # Toleransi p99 lebih longgar: latensi ekor panggilan mikrodetik didominasi jadwal OS
+    # dan GC, dan antar-putaran kode yang sama bisa berbeda ~50% (throughput ~15%)
+    with open(path_baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline["meta"]["pemilih"] != laporan["meta"]["pemilih"]:
+        print(f"peringatan: baseline memakai {baseline['meta']['pemilih']} pemilih")
+    regresi = []
+    for fase, h in laporan["hasil"].items():
+        b = baseline["hasil"].get(fase)
+        if not b:
+            continue
+        if h["ops_per_detik"] < b["ops_per_detik"] * (1 - toleransi):
+            regresi.append(f"{fase}: ops/detik {b['ops_per_detik']:.0f} -> {h['ops_per_detik']:.0f}")
+        if h["p99_us"] > b["p99_us"] * (1 + toleransi_p99):
+            regresi.append(f"{fase}: p99 {b['p99_us']:.2f}us -> {h['p99_us']:.2f}us")
+    for r in regresi:
+        print("REGRESI", r)
+    if not regresi:
+        print(f"tidak ada regresi dibanding {path_baseline} "
+              f"(toleransi ops/detik {toleransi:.0%}, p99 {toleransi_p99:.0%})")
+    return 1 if regresi else 0
+
+
+# --- Benchmark hash password dan impor DPT ---
+def bench_hash(args):
+    print(f"{'iterasi':>9} {'login/detik':>12} {'ms/login':>9}")
+    for iterasi in args.iterasi:
+        lm = LoginManager([], admin_password="admin123", iterasi_hash=iterasi)
+        lm.register_pemilih("pemilih", "rahasia")
+        jumlah = 0
+        mulai = time.perf_counter()
+        while jumlah < 5 or time.perf_counter() - mulai < args.durasi:
+            assert lm.login("pemilih", "rahasia")
+            jumlah += 1
+        durasi = time.perf_counter() - mulai
+        print(f"{iterasi:>9} {jumlah / durasi:>12.1f} {durasi / jumlah * 1000:>9.2f}")
+
+    if args.impor:
+        folder = tempfile.mkdtemp(prefix="bench_impor_")
+        try:
+            # Hash dibuat sekali lalu dipakai ulang: yang diukur adalah streaming impornya
+            path = os.path.join(folder, "pemilih.csv")
+            contoh_hash = hash_password("rahasia", 1000)
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["username", "password_hash"])
+                for i in range(args.impor):
+                    writer.writerow([f"p{i:08d}", contoh_hash])
+            lm = LoginManager([], admin_password="admin123")
+            rss_awal = peak_rss_mb()
+            mulai = time.perf_counter()
+            diimpor, dilewati = lm.import_pemilih_csv(path, batch=args.batch_impor)
+            durasi = time.perf_counter() - mulai
+            print(f"impor {diimpor} baris ({dilewati} dilewati): {diimpor / durasi:.0f} baris/detik, "
+                  f"RSS naik {peak_rss_mb() - rss_awal:.1f} MB")
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+
+
+# --- Benchmark memori DPT ---
+class _PemilihLama:
+    # Representasi sebelum PemilihStore: satu objek ber-__dict__ per pemilih
+    def __init__(self, username, password_hash):
+        self._username = username
+        self._password_hash = password_hash
+        self._Pemilih__sudah_memilih = False
+
+
+def _hash_sintetis(rng):
+    return f"pbkdf2_sha256$100000${rng.getrandbits(128):032x}${rng.getrandbits(256):064x}"
+
+
+def ukur_memori(buat):
+    gc.collect()
+    tracemalloc.start()
+    mulai = time.perf_counter()
+    objek = buat()
+    durasi = time.perf_counter() - mulai
+    terpakai, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objek
+    gc.collect()
+    return terpakai, durasi
+
+
+def bench_memori(args):
+    print(f"{'pemilih':>10} {'representasi':<14} {'MB':>9} {'byte/pemilih':>13} {'detik':>7}")
+    for jumlah in args.jumlah:
+        def lama():
+            rng = random.Random(args.seed)
+            return {f"p{i:08d}": _PemilihLama(f"p{i:08d}", _hash_sintetis(rng)) for i in range(jumlah)}
+
+        def ringkas():
+            rng = random.Random(args.seed)
+            store = PemilihStore()
+            for i in range(jumlah):
+                store.tambah(f"p{i:08d}", _hash_sintetis(rng))
+            return store
+
+        for nama, buat in (("objek+dict", lama), ("PemilihStore", ringkas)):
+            if args.hanya and nama != args.hanya:
+                continue
+            terpakai, durasi = ukur_memori(buat)
+            print(f"{jumlah:>10} {nama:<14} {terpakai / 2**20:>9.1f} {terpakai / jumlah:>13.1f} {durasi:>7.1f}")
+
+
+# --- Uji beban multi-stasiun (koordinator + banyak proses terminal) ---
+def _jalankan_stasiun(alamat, votes, jumlah_thread, ukuran_batch, keluaran):
+    klien = KlienKoordinator(alamat, ukuran_pool=max(1, jumlah_thread // 4))
+    pengirim = PengirimBatch(klien, ukuran=ukuran_batch)
+    status = {}
+    latensi = []
+    kunci = threading.Lock()
+    siap = threading.Barrier(jumlah_thread + 1)
+
+    def kerja(bagian):
+        # Login (membuka sesi pemilih) tidak ikut diukur: yang diukur hanya pengiriman suara
+        sesi = [(klien.panggil("login", username=username, password="rahasia")["sesi"], idx) for username, idx in bagian]
+        siap.wait()
+        lokal_status, lokal_latensi = {}, []
+        for s, idx in sesi:
+            t = time.perf_counter_ns()
+            st = pengirim.cast_vote(s, idx)
+            lokal_latensi.append(time.perf_counter_ns() - t)
+            lokal_status[st.value] = lokal_status.get(st.value, 0) + 1
+        with kunci:
+            for k, v in lokal_status.items():
+                status[k] = status.get(k, 0) + v
+            latensi.extend(lokal_latensi[::max(1, len(lokal_latensi) // 2000)])
+
+    threads = [threading.Thread(target=kerja, args=(votes[i::jumlah_thread],)) for i in range(jumlah_thread)]
+    for t in threads:
+        t.start()
+    siap.wait()
+    mulai = time.perf_counter()
+    for t in threads:
+        t.join()
+    keluaran.put((status, latensi, time.perf_counter() - mulai))
+    klien.close()
+
+
+def bench_multistasiun(args):
+    folder = tempfile.mkdtemp(prefix="bench_stasiun_")
+    koordinator = None
+    try:
+        path_dpt = os.path.join(folder, "pemilih.csv")
+        contoh_hash = hash_password("rahasia", 1)  # tiap pemilih login dulu (di luar pengukuran)
+        with open(path_dpt, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["username", "password_hash"])
+            for i in range(args.pemilih):
+                writer.writerow([f"p{i:08d}", contoh_hash])
+
+        alamat = args.alamat or f"unix:{os.path.join(folder, 'evote.sock')}"
+        koordinator = subprocess.Popen(
+            [sys.executable, SKRIP_APP, "koordinator", "--alamat", alamat, "--data", os.path.join(folder, "data"),
+             "--dpt", path_dpt, "--fsync-batch", str(args.fsync_batch)],
+            stdout=subprocess.PIPE, text=True)
+        for baris in koordinator.stdout:
+            if baris.startswith("Koordinator siap"):
+                break
+        else:
+            raise RuntimeError("koordinator gagal dijalankan")
+
+        # Setiap pemilih dicoba oleh dua stasiun: hanya satu yang boleh berhasil
+        rng = random.Random(args.seed)
+        per_stasiun = [[] for _ in range(args.stasiun)]
+        for i in range(args.pemilih):
+            s = i * args.stasiun // args.pemilih
+            idx = rng.randrange(3)
+            per_stasiun[s].append((f"p{i:08d}", idx))
+            per_stasiun[(s + 1) % args.stasiun].append((f"p{i:08d}", idx))
+        for votes in per_stasiun:
+            rng.shuffle(votes)
+
+        keluaran = multiprocessing.Queue()
+        proses = [multiprocessing.Process(target=_jalankan_stasiun,
+                                          args=(alamat, votes, args.thread, args.batch, keluaran))
+                  for votes in per_stasiun]
+        for p in proses:
+            p.start()
+        hasil = [keluaran.get() for _ in proses]
+        durasi = max(d for _, _, d in hasil)  # stasiun terlama, tanpa waktu login
+        for p in proses:
+            p.join()
+
+        status, latensi = {}, []
+        for st, lat, _ in hasil:
+            for k, v in st.items():
+                status[k] = status.get(k, 0) + v
+            latensi.extend(lat)
+        latensi.sort()
+        percobaan = sum(status.values())
+        klien = KlienKoordinator(alamat)
+        total_server = sum(klien.panggil("hasil")["suara"])
+        klien.close()
+
+        print(f"stasiun={args.stasiun} thread/stasiun={args.thread} batch={args.batch} fsync_batch={args.fsync_batch}")
+        print(f"percobaan: {percobaan}  berhasil: {status.get(StatusVote.BERHASIL.value, 0)}  "
+              f"ditolak (sudah memilih): {status.get(StatusVote.SUDAH_MEMILIH.value, 0)}")
+        print(f"throughput: {percobaan / durasi:.0f} percobaan/detik  "
+              f"p50: {latensi[len(latensi) // 2] / 1e6:.2f} ms  p99: {latensi[int(len(latensi) * 0.99)] / 1e6:.2f} ms")
+        ok = status.get(StatusVote.BERHASIL.value, 0) == args.pemilih == total_server
+        print(f"satu suara per pemilih: {'OK' if ok else 'GAGAL'} (total di koordinator: {total_server})")
+        return 0 if ok else 1
+    finally:
+        if koordinator is not None:
+            koordinator.send_signal(signal.SIGINT)
+            koordinator.wait(timeout=30)
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+# --- Latensi login sah saat diserang brute force ---
+def _serang(lm, usernames, laju, berhenti, hasil):
+    # Thread penyerang dengan laju tetap (percobaan/detik, 0 = secepatnya), bergiliran:
+    # menebak password 5 akun tertentu, password spraying ke banyak akun dari satu stasiun,
+    # dan banjir username acak dari stasiun yang selalu berganti
+    rng = random.Random(7)
+    status = {s: 0 for s in StatusAkses}
+    n = 0
+    mulai = time.perf_counter()
+    cpu_awal = time.thread_time()
+    while not berhenti.is_set():
+        jenis = n % 3
+        if jenis == 0:
+            username, stasiun = usernames[n % 5], "penyerang-1"
+        elif jenis == 1:
+            username, stasiun = usernames[rng.randrange(len(usernames))], "penyerang-2"
+        else:
+            username, stasiun = f"acak{n}", f"palsu-{n}"
+        status[lm.masuk(username, "tebakan", stasiun)[0]] += 1
+        n += 1
+        if laju and n % 50 == 0:
+            tidur = mulai + n / laju - time.perf_counter()
+            if tidur > 0:
+                time.sleep(tidur)
+    hasil.update(percobaan=n, detik=time.perf_counter() - mulai, cpu=time.thread_time() - cpu_awal, status=status)
+
+
+def bench_serangan(args):
+    folder = tempfile.mkdtemp(prefix="bench_serangan_")
+    try:
+        # Satu hash dipakai semua pemilih (seperti "hash --impor"): yang diukur adalah login-nya
+        path = os.path.join(folder, "pemilih.csv")
+        contoh_hash = hash_password("rahasia", args.iterasi)
+        usernames = [f"p{i:08d}" for i in range(args.pemilih)]
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["username", "password_hash"])
+            for username in usernames:
+                writer.writerow([username, contoh_hash])
+
+        # Pemilih sah login dari stasiun sendiri dan tidak termasuk 5 akun sasaran penebakan
+        sah = usernames[5:5 + args.login]
+        print(f"{'skenario':<26} {'p50 (ms)':>9} {'p99 (ms)':>9} {'serangan/detik':>15} "
+              f"{'dibatasi':>9} {'CPU penyerang':>14} {'entri':>7}")
+        for nama, diserang, dibatasi in (("tanpa serangan", False, True),
+                                         ("serangan, tanpa pembatas", True, False),
+                                         ("serangan, dengan pembatas", True, True)):
+            batas = {} if dibatasi else {"batas_username": None, "batas_stasiun": None, "batas_registrasi": None}
+            lm = LoginManager([], admin_password="admin123", iterasi_hash=args.iterasi, **batas)
+            lm.import_pemilih_csv(path)
+            berhenti = threading.Event()
+            serangan = {}
+            penyerang = threading.Thread(target=_serang, args=(lm, usernames, args.laju, berhenti, serangan))
+            if diserang:
+                penyerang.start()
+                time.sleep(0.2)  # biarkan penyerang menghabiskan jatah percobaannya dulu
+            latensi = []
+            for username in sah:
+                t = time.perf_counter()
+                if lm.masuk(username, "rahasia", "tps-sah")[0] is not StatusAkses.BERHASIL:
+                    raise RuntimeError(f"login sah {username} ditolak")
+                latensi.append(time.perf_counter() - t)
+            berhenti.set()
+            if diserang:
+                penyerang.join()
+            latensi.sort()
+            p50 = latensi[len(latensi) // 2] * 1000
+            p99 = latensi[min(len(latensi) - 1, int(0.99 * len(latensi)))] * 1000
+            if serangan:
+                laju = f"{serangan['percobaan'] / serangan['detik']:.0f}"
+                ditolak = f"{serangan['status'][StatusAkses.DIBATASI] / serangan['percobaan']:.1%}"
+                cpu = f"{serangan['cpu']:.2f} s"
+            else:
+                laju = ditolak = cpu = "-"
+            entri = len(lm._batas_username) + len(lm._batas_stasiun) if dibatasi else 0
+            print(f"{nama:<26} {p50:>9.2f} {p99:>9.2f} {laju:>15} {ditolak:>9} {cpu:>14} {entri:>7}")
+
+        if args.banjir:
+            # Jutaan kegagalan dengan username dan stasiun unik: username yang tidak ada tidak
+            # dicatat, tabel stasiun tetap dibatasi maks_kunci dan biaya per percobaan tidak naik
+            # seiring waktu. Login sah sesudahnya tidak boleh ikut dibatasi
+            lm = LoginManager([], admin_password="admin123", iterasi_hash=args.iterasi)
+            lm.register_pemilih(sah[0], "rahasia")
+            rss_awal = peak_rss_mb()
+            sepersepuluh = max(1, args.banjir // 10)
+            laju = []
+            for potongan in range(10):
+                mulai = time.perf_counter()
+                for i in range(potongan * sepersepuluh, (potongan + 1) * sepersepuluh):
+                    lm.masuk(f"acak{i}", "tebakan", f"palsu-{i}")
+                laju.append(sepersepuluh / (time.perf_counter() - mulai))
+            t = time.perf_counter()
+            status = lm.masuk(sah[0], "rahasia", "tps-sah")[0]
+            print(f"banjir {sepersepuluh * 10} percobaan unik: {laju[0]:.0f} -> {laju[-1]:.0f} percobaan/detik "
+                  f"(10% pertama -> terakhir), entri username/stasiun {len(lm._batas_username)}/"
+                  f"{len(lm._batas_stasiun)}, RSS naik {peak_rss_mb() - rss_awal:.1f} MB, "
+                  f"login sah sesudahnya: {status.value} dalam {(time.perf_counter() - t) * 1000:.2f} ms")
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+# --- Benchmark instant-runoff pada surat suara ringkas ---
+def cek_irv_seri():
+    # 4x(A), 3x(B,C), 3x(C,B): B dan C seri di posisi terbawah, tapi gabungannya melebihi A.
+    # Hanya satu yang boleh tersingkir (B, ID lebih kecil); C lalu menang 6 dari 10.
+    kontes = Kontes("IRV", PilihanPeringkat())
+    for p in buat_pasangan(3):
+        kontes.tambah_pasangan(p)
+    for peringkat, n in (((0,), 4), ((1, 2), 3), ((2, 1), 3)):
+        for _ in range(n):
+            kontes.tambah_surat(peringkat)
+    riwayat, pemenang = kontes.mesin.putaran(kontes)
+    assert riwayat == [{0: 4, 1: 3, 2: 3}, {0: 4, 2: 6}], riwayat
+    assert pemenang == (2,), pemenang
+
+def bench_irv(args):
+    cek_irv_seri()
+    mesin = PilihanPeringkat()
+    kontes = Kontes("IRV", mesin)
+    for p in buat_pasangan(args.kandidat):
+        kontes.tambah_pasangan(p)
+    rng = random.Random(args.seed)
+    # Preferensi condong ke kandidat awal agar butuh beberapa putaran eliminasi
+    bobot = [1 / (i + 2) for i in range(args.kandidat)]
+    mulai = time.perf_counter()
+    for _ in range(args.surat):
+        panjang = rng.randint(1, args.kandidat)
+        peringkat = []
+        while len(peringkat) < panjang:
+            c = rng.choices(range(args.kandidat), bobot)[0]
+            if c not in peringkat:
+                peringkat.append(c)
+        kontes.tambah_surat(tuple(peringkat))
+    durasi_isi = time.perf_counter() - mulai
+
+    mulai = time.perf_counter()
+    riwayat, pemenang = mesin.putaran(kontes)
+    durasi_hitung = time.perf_counter() - mulai
+    pola = len(kontes.surat_suara().kelompok())
+
+    surat = kontes.surat_suara()
+    print(f"surat: {len(surat)}  kandidat: {args.kandidat}  pola unik: {pola}")
+    print(f"memori surat: {surat.nbytes() / 2**20:.1f} MB ({surat.nbytes() / len(surat):.1f} byte/surat)")
+    print(f"isi: {durasi_isi:.2f} detik  hitung ({len(riwayat)} putaran): {durasi_hitung:.3f} detik")
+    for n, putaran in enumerate(riwayat, 1):
+        print(f"  putaran {n}: " + "  ".join(f"{i}={jumlah}" for i, jumlah in putaran.items()))
+    print(f"pemenang: {pemenang}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Sistem Voting")
+    sub = parser.add_subparsers(dest="perintah", required=True)
+
+    p = sub.add_parser("beban", help="throughput, latensi p50/p99 dan memori untuk login/registrasi/voting/rekap")
+    p.add_argument("--pemilih", type=int, default=100000, help="jumlah pemilih sintetis (mis. 100000 - 10000000)")
+    p.add_argument("--suara", type=int, default=None, help="jumlah suara (default: semua pemilih)")
+    p.add_argument("--login", type=int, default=100000, help="jumlah percobaan login")
+    p.add_argument("--rekap", type=int, default=10000, help="jumlah panggilan get_hasil")
+    p.add_argument("--pasangan", type=int, default=3)
+    p.add_argument("--seed", type=int, default=3)
+    p.add_argument("--jurnal", action="store_true", help="simpan suara ke JurnalSuara di folder sementara")
+    p.add_argument("--fsync-batch", type=int, default=1000)
+    p.add_argument("--iterasi", type=int, default=1, help="iterasi PBKDF2 untuk registrasi/login")
+    p.add_argument("--simpan", help="simpan hasil sebagai JSON (mis. benchmarks/baseline.json)")
+    p.add_argument("--bandingkan", help="bandingkan dengan baseline JSON, exit 1 jika regresi")
+    p.add_argument("--toleransi", type=float, default=0.25,
+                   help="batas noise: regresi jika ops/detik turun lebih dari pecahan ini")
+    p.add_argument("--toleransi-p99", type=float, default=0.6,
+                   help="batas noise: regresi jika latensi p99 naik lebih dari pecahan ini")
+    p.add_argument("--ulang", type=int, default=3, help="jumlah putaran; yang dilaporkan median per fase")
+    p.set_defaults(fungsi=bench_beban)
+
+    p = sub.add_parser("hash", help="login/detik per work factor PBKDF2 dan kecepatan impor CSV")
+    p.add_argument("--iterasi", type=int, nargs="+", default=[1000, 10000, 100000, 600000])
+    p.add_argument("--durasi", type=float, default=1.0, help="detik per setting")
+    p.add_argument("--impor", type=int, default=0, help="jumlah baris CSV sintetis untuk diimpor")
+    p.add_argument("--batch-impor", type=int, default=10000)
+    p.set_defaults(fungsi=bench_hash)
+
+    p = sub.add_parser("irv", help="waktu hitung instant-runoff untuk jutaan surat suara berperingkat")
+    p.add_argument("--surat", type=int, default=1000000)
+    p.add_argument("--kandidat", type=int, default=8)
+    p.add_argument("--seed", type=int, default=3)
+    p.set_defaults(fungsi=bench_irv)
+
+    p = sub.add_parser("memori", help="memori DPT: objek Pemilih per pemilih vs PemilihStore")
+    p.add_argument("--jumlah", type=int, nargs="+", default=[1000000, 10000000])
+    p.add_argument("--hanya", choices=["objek+dict", "PemilihStore"], help="ukur satu representasi saja")
+    p.add_argument("--seed", type=int, default=3)
+    p.set_defaults(fungsi=bench_memori)
+
+    p = sub.add_parser("multistasiun", help="uji beban banyak terminal ke satu koordinator")
+    p.add_argument("--stasiun", type=int, default=4)
+    p.add_argument("--thread", type=int, default=16, help="thread pemilih per stasiun")
+    p.add_argument("--pemilih", type=int, default=50000)
+    p.add_argument("--batch", type=int, default=64, help="ukuran batch PengirimBatch")
+    p.add_argument("--fsync-batch", type=int, default=1)
+    p.add_argument("--alamat", help="default: Unix socket di folder sementara")
+    p.add_argument("--seed", type=int, default=3)
+    p.set_defaults(fungsi=bench_multistasiun)
+
+    p = sub.add_parser("serangan", help="latensi login sah saat brute force, dengan dan tanpa pembatas percobaan")
+    p.add_argument("--pemilih", type=int, default=1000)
+    p.add_argument("--login", type=int, default=200, help="jumlah login sah yang diukur")
+    p.add_argument("--iterasi", type=int, default=10000, help="iterasi PBKDF2")
+    p.add_argument("--laju", type=int, default=1000, help="percobaan penyerang per detik (0 = secepatnya)")
+    p.add_argument("--banjir", type=int, default=1000000, help="percobaan unik untuk uji memori pembatas (0 = lewati)")
+    p.set_defaults(fungsi=bench_serangan)
+
+    p = sub.add_parser("store", help="suara/detik pada berbagai ukuran batch fsync")
+    p.add_argument("--suara", type=int, default=20000)
+    p.add_argument("--batch", type=int, nargs="+", default=[1, 10, 100, 1000])
+    p.add_argument("--dir", default=None, help="folder sementara (default: tempdir sistem)")
+    p.set_defaults(fungsi=bench_store)
+
+    args = parser.parse_args(argv)
+    return args.fungsi(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
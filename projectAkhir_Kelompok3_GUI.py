@@ -1,23 +1,91 @@
+import time
+_T_IMPOR = time.perf_counter()
 import tkinter as tk
-import os
 from tkinter import messagebox
-from tkinter import simpledialog
+_WAKTU_IMPOR = {"tkinter": (time.perf_counter() - _T_IMPOR) * 1000}
+import os
+import sys
+import argparse
+import base64
+import csv
+import hashlib
+import hmac
+import json
+import queue
+import random
+import socket
+import socketserver
+import struct
+import threading
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import Counter, OrderedDict, deque
+from itertools import count, islice
 from abc import ABC, abstractmethod
 from enum import Enum
-from PIL import Image, ImageTk
+try:
+    import fcntl
+except ImportError:  # Windows: tanpa kunci folder data (lihat JurnalSuara.kunci)
+    fcntl = None
+_WAKTU_IMPOR["stdlib"] = (time.perf_counter() - _T_IMPOR) * 1000 - _WAKTU_IMPOR["tkinter"]
+# PIL dan multiprocessing diimpor saat pertama dibutuhkan (lihat _pil dan import_pemilih_csv)
+
+def _pil():
+    mulai = time.perf_counter()
+    import PIL.Image
+    import PIL.ImageTk
+    _WAKTU_IMPOR.setdefault("PIL (lazy)", (time.perf_counter() - mulai) * 1000)
+    return PIL.Image, PIL.ImageTk
 
 # === Model & Logic ===
 class Role(Enum):
     ADMIN = "admin"
     PEMILIH = "pemilih"
 
+# --- Hash Password (PBKDF2-SHA256 + salt) ---
+ITERASI_HASH = 100_000  # work factor default; naikkan seiring hardware makin cepat
+ITERASI_MAKS = 10_000_000  # batas hash yang diterima saat impor: lebih dari ini satu login makan waktu detikan
+
+def hash_password(password, iterasi=None, salt=None):
+    iterasi = iterasi or ITERASI_HASH
+    salt = salt or os.urandom(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterasi)
+    return f"pbkdf2_sha256${iterasi}${salt.hex()}${digest.hex()}"
+
+def verifikasi_password(password_hash, password):
+    try:
+        algoritma, iterasi, salt, digest = password_hash.split("$")
+        if algoritma != "pbkdf2_sha256":
+            return False
+        hasil = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), bytes.fromhex(salt), int(iterasi))
+        digest = bytes.fromhex(digest)
+    except (ValueError, OverflowError):  # OverflowError: iterasi di luar batas pbkdf2_hmac
+        return False
+    return hmac.compare_digest(hasil, digest)
+
+def hash_sah(password_hash):
+    # Format yang bisa diverifikasi verifikasi_password (dicek saat impor DPT)
+    try:
+        algoritma, iterasi, salt, digest = password_hash.split("$")
+        bytes.fromhex(salt)
+        return algoritma == "pbkdf2_sha256" and 0 < int(iterasi) <= ITERASI_MAKS and len(bytes.fromhex(digest)) > 0
+    except ValueError:
+        return False
+
 class User(ABC):
-    def __init__(self, username, password):
+    __slots__ = ("_username", "_password_hash")
+
+    def __init__(self, username, password=None, password_hash=None, iterasi=None):
         self._username = username
-        self._password = password
+        self._password_hash = password_hash or hash_password(password, iterasi)
 
     def check_password(self, password):
-        return self._password == password
+        return verifikasi_password(self._password_hash, password)
+
+    @property
+    def password_hash(self):
+        return self._password_hash
 
     @abstractmethod
     def menu(self, app):
@@ -28,16 +96,20 @@ class User(ABC):
         return self._username
 
 class Admin(User):
+    __slots__ = ()
+
     def menu(self, app):
         app.show_admin_menu(self)
 
 class Pemilih(User):
-    def __init__(self, username, password):
-        super().__init__(username, password)
+    __slots__ = ("__sudah_memilih",)
+
+    def __init__(self, username, password=None, password_hash=None, iterasi=None):
+        super().__init__(username, password, password_hash, iterasi)
         self.__sudah_memilih = False
 
     def menu(self, app):
-        app.show_voter_menu(self, self.__sudah_memilih)
+        app.show_voter_menu(self, self.sudah_memilih())
 
     def set_sudah_memilih(self, val):
         self.__sudah_memilih = val
@@ -45,6 +117,103 @@ class Pemilih(User):
     def sudah_memilih(self):
         return self.__sudah_memilih
 
+# --- Penyimpanan Pemilih Ringkas ---
+class PemilihStore:
+    # DPT berukuran besar tanpa satu objek per pemilih: username di-intern -> nomor urut,
+    # salt+digest dalam satu bytearray (48 byte/pemilih), iterasi dalam array,
+    # dan status sudah memilih sebagai bitset.
+    UKURAN_SALT = 16
+    UKURAN_DIGEST = 32
+
+    def __init__(self):
+        self._indeks = {}
+        self._hash = bytearray()
+        self._iterasi = array("I")
+        self._sudah_memilih = bytearray()
+        self._hash_lain = {}  # format hash yang tidak muat di record tetap
+
+    def __len__(self):
+        return len(self._indeks)
+
+    def __contains__(self, username):
+        return username in self._indeks
+
+    def tambah(self, username, password_hash):
+        if username in self._indeks:
+            return None
+        i = len(self._indeks)
+        ukuran_record = self.UKURAN_SALT + self.UKURAN_DIGEST
+        try:
+            algoritma, iterasi, salt, digest = password_hash.split("$")
+            record = bytes.fromhex(salt) + bytes.fromhex(digest)
+            if algoritma != "pbkdf2_sha256" or len(record) != ukuran_record:
+                raise ValueError(password_hash)
+            self._iterasi.append(int(iterasi))
+        except (ValueError, OverflowError):  # OverflowError: iterasi tidak muat di array("I")
+            record = bytes(ukuran_record)
+            self._iterasi.append(0)
+            self._hash_lain[i] = password_hash
+        self._hash += record
+        if i % 8 == 0:
+            self._sudah_memilih.append(0)
+        self._indeks[sys.intern(username)] = i
+        return i
+
+    def get(self, username):
+        i = self._indeks.get(username)
+        if i is None:
+            return None
+        return PemilihRingkas(self, username, i)
+
+    def password_hash(self, i):
+        if i in self._hash_lain:
+            return self._hash_lain[i]
+        awal = i * (self.UKURAN_SALT + self.UKURAN_DIGEST)
+        salt = self._hash[awal:awal + self.UKURAN_SALT]
+        digest = self._hash[awal + self.UKURAN_SALT:awal + self.UKURAN_SALT + self.UKURAN_DIGEST]
+        return f"pbkdf2_sha256${self._iterasi[i]}${salt.hex()}${digest.hex()}"
+
+    def check_password(self, i, password):
+        if i in self._hash_lain:
+            return verifikasi_password(self._hash_lain[i], password)
+        awal = i * (self.UKURAN_SALT + self.UKURAN_DIGEST)
+        salt = bytes(self._hash[awal:awal + self.UKURAN_SALT])
+        digest = bytes(self._hash[awal + self.UKURAN_SALT:awal + self.UKURAN_SALT + self.UKURAN_DIGEST])
+        hasil = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, self._iterasi[i])
+        return hmac.compare_digest(hasil, digest)
+
+    def sudah_memilih(self, i):
+        return bool(self._sudah_memilih[i >> 3] & (1 << (i & 7)))
+
+    def set_sudah_memilih(self, i, val):
+        # Bukan operasi atomik per bit: pemanggil dari banyak thread harus memegang kunci yang sama
+        if val:
+            self._sudah_memilih[i >> 3] |= 1 << (i & 7)
+        else:
+            self._sudah_memilih[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+
+class PemilihRingkas(Pemilih):
+    # Tampilan Pemilih di atas PemilihStore; dibuat saat dibutuhkan, semua status ada di store
+    __slots__ = ("_store", "_i")
+
+    def __init__(self, store, username, i):
+        self._store = store
+        self._username = username
+        self._i = i
+
+    @property
+    def password_hash(self):
+        return self._store.password_hash(self._i)
+
+    def check_password(self, password):
+        return self._store.check_password(self._i, password)
+
+    def set_sudah_memilih(self, val):
+        self._store.set_sudah_memilih(self._i, val)
+
+    def sudah_memilih(self):
+        return self._store.sudah_memilih(self._i)
+
 class Kandidat(ABC):
     def __init__(self, nama):
         self._nama = nama
@@ -76,6 +245,18 @@ class PasanganKandidat:
     def nama_pasangan(self):
         return f"{self._ketua.nama} & {self._wakil.nama}"
 
+    @property
+    def ketua(self):
+        return self._ketua
+
+    @property
+    def wakil(self):
+        return self._wakil
+
+    @property
+    def visi(self):
+        return self._visi
+
     @property
     def gambar_path(self):
         return self._gambar_path
@@ -83,112 +264,2669 @@ class PasanganKandidat:
     def tampilkan_info(self):
         return f"{self._ketua.nama} (Ketua) & {self._wakil.nama} (Wakil)\nVisi: {self._visi}"
 
-class VotingSystem:
-    def __init__(self):
+# === Penghitungan Suara ===
+def _index_sah(index, jumlah):
+    return isinstance(index, int) and not isinstance(index, bool) and 0 <= index < jumlah
+
+class SuratSuara:
+    # Surat suara ringkas: satu array bilangan bulat datar, `lebar` slot per surat
+    # (slot kosong = -1). Surat yang identik dikelompokkan saat dihitung, jadi putaran
+    # eliminasi bekerja per pola surat, bukan per surat.
+    KOSONG = -1
+
+    def __init__(self, kode="h", lebar=1, data=None):
+        self._data = array(kode) if data is None else data
+        self._lebar = lebar
+
+    @property
+    def lebar(self):
+        return self._lebar
+
+    def __len__(self):
+        return len(self._data) // self._lebar
+
+    def nbytes(self):
+        return len(self._data) * self._data.itemsize
+
+    def tambah(self, slot):
+        if len(slot) > self._lebar:
+            self._lebarkan(len(slot))
+        self._data.extend(slot)
+        if len(slot) < self._lebar:
+            self._data.extend([self.KOSONG] * (self._lebar - len(slot)))
+
+    def _lebarkan(self, lebar):
+        # Jarang: surat yang lebih panjang dari semua surat sebelumnya (kandidat bertambah)
+        lama, self._data = self._data, array(self._data.typecode)
+        tambahan = [self.KOSONG] * (lebar - self._lebar)
+        for i in range(0, len(lama), self._lebar):
+            self._data.extend(lama[i:i + self._lebar])
+            self._data.extend(tambahan)
+        self._lebar = lebar
+
+    def kelompok(self):
+        # Counter {pola surat (tuple): jumlah}; zip + Counter berjalan di C
+        return Counter(zip(*[iter(self._data)] * self._lebar))
+
+    def ekspor(self):
+        return self.ekspor_tunda()()
+
+    def ekspor_tunda(self):
+        # Untuk snapshot latar: catat panjang sekarang, encode belakangan. Surat hanya
+        # ditambah di ujung (_lebarkan membuat array baru), jadi isi awal ini tidak berubah
+        data, lebar, panjang = self._data, self._lebar, len(self._data)
+        return lambda: {"kode": data.typecode, "lebar": lebar,
+                        "data": base64.b64encode(data[:panjang].tobytes()).decode("ascii")}
+
+    @classmethod
+    def impor(cls, data):
+        isi = array(data["kode"])
+        isi.frombytes(base64.b64decode(data["data"]))
+        return cls(data["kode"], data["lebar"], isi)
+
+class MesinPenghitung(ABC):
+    # Cara menghitung satu kontes; Kontes.get_hasil() mendelegasikan ke sini.
+    nama = ""
+    butuh_surat = True  # False: cukup suara langsung yang dipelihara bertahap oleh Kontes
+
+    @abstractmethod
+    def kodekan(self, pilihan, jumlah_kandidat):
+        # Pilihan pemilih -> tuple index kandidat, atau None jika tidak sah
+        pass
+
+    @abstractmethod
+    def suara_langsung(self, slot):
+        # Index kandidat yang langsung bertambah suaranya (tampilan live)
+        pass
+
+    @abstractmethod
+    def hitung(self, kontes):
+        # -> (hasil [(index, pasangan, nilai, persentase)], pemenang tuple index)
+        pass
+
+class Pluralitas(MesinPenghitung):
+    # Satu pilihan per pemilih; hasil langsung dari hitungan bertahap (O(jumlah kandidat))
+    nama = "pluralitas"
+    butuh_surat = False
+
+    def kodekan(self, pilihan, jumlah_kandidat):
+        if not isinstance(pilihan, int):
+            if len(pilihan) != 1:
+                return None
+            pilihan = pilihan[0]
+        return (pilihan,) if _index_sah(pilihan, jumlah_kandidat) else None
+
+    def suara_langsung(self, slot):
+        return slot
+
+    def hitung(self, kontes):
+        return kontes.hasil_langsung(kontes.get_total_suara())
+
+class PilihanPeringkat(MesinPenghitung):
+    # Instant-runoff: kandidat terlemah tersingkir tiap putaran dan suaranya pindah ke
+    # pilihan berikutnya yang masih aktif, sampai ada yang meraih mayoritas.
+    nama = "irv"
+
+    def kodekan(self, pilihan, jumlah_kandidat):
+        pilihan = (pilihan,) if isinstance(pilihan, int) else tuple(pilihan)
+        if not pilihan or len(set(pilihan)) != len(pilihan):
+            return None
+        if not all(_index_sah(i, jumlah_kandidat) for i in pilihan):
+            return None
+        return pilihan
+
+    def suara_langsung(self, slot):
+        return slot[:1]
+
+    def putaran(self, kontes):
+        # -> ([{index: suara} per putaran], pemenang)
+        # Tiap kandidat punya "ember" berisi pola surat yang sedang menunjuk kepadanya;
+        # saat tersingkir hanya embernya yang dipindah, jadi total kerja sebanding dengan
+        # jumlah pola x panjang peringkat, bukan jumlah surat x jumlah putaran.
+        surat = kontes.surat_suara()
+        jumlah = len(kontes.get_kandidat_list())
+        if surat is None or not jumlah:
+            return [], ()
+        hitungan = [0] * jumlah
+        ember = [[] for _ in range(jumlah)]
+        for pola, n in surat.kelompok().items():
+            hitungan[pola[0]] += n
+            ember[pola[0]].append((pola, 0, n))
+        aktif = set(range(jumlah))
+        riwayat = []
+        while True:
+            putaran = {i: hitungan[i] for i in sorted(aktif)}
+            riwayat.append(putaran)
+            total = sum(putaran.values())
+            if total == 0:
+                return riwayat, ()
+            terbanyak = max(putaran.values())
+            if terbanyak * 2 > total:
+                return riwayat, tuple(i for i, n in putaran.items() if n == terbanyak)
+            tersedikit = min(putaran.values())
+            kalah = [i for i, n in putaran.items() if n == tersedikit]
+            if len(kalah) == len(aktif):
+                return riwayat, tuple(kalah)  # semua sisa kandidat seri
+            # Yang seri di posisi terbawah hanya tersingkir bersama jika gabungan suaranya
+            # tetap di bawah kandidat berikutnya (urutan eliminasi tidak mengubah hasil).
+            # Selain itu satu per putaran: suara putaran sebelumnya paling sedikit, lalu ID terkecil.
+            berikutnya = min(n for n in putaran.values() if n > tersedikit)
+            if len(kalah) > 1 and tersedikit * len(kalah) >= berikutnya:
+                kalah = [min(kalah, key=lambda i: (tuple(r[i] for r in reversed(riwayat[:-1])), i))]
+            aktif.difference_update(kalah)
+            for i in kalah:
+                for pola, posisi, n in ember[i]:
+                    for p in range(posisi + 1, len(pola)):
+                        tujuan = pola[p]
+                        if tujuan == SuratSuara.KOSONG:
+                            break  # surat habis (tidak ada pilihan aktif lagi)
+                        if tujuan in aktif:
+                            hitungan[tujuan] += n
+                            ember[tujuan].append((pola, p, n))
+                            break
+                ember[i] = []
+                hitungan[i] = 0
+
+    def hitung(self, kontes):
+        riwayat, pemenang = self.putaran(kontes)
+        if not pemenang:
+            return [], ()
+        akhir = riwayat[-1]
+        total = sum(akhir.values())
+        hasil = [(i, pasangan, akhir.get(i, 0), akhir.get(i, 0) / total * 100)
+                 for i, pasangan in enumerate(kontes.get_kandidat_list())]
+        return hasil, pemenang
+
+class Persetujuan(MesinPenghitung):
+    # Approval: pemilih boleh menyetujui beberapa kandidat. Persetujuan per kandidat
+    # sudah dipelihara bertahap, jadi surat lengkap tidak perlu disimpan.
+    nama = "persetujuan"
+    butuh_surat = False
+
+    def kodekan(self, pilihan, jumlah_kandidat):
+        pilihan = (pilihan,) if isinstance(pilihan, int) else tuple(pilihan)
+        if len(set(pilihan)) != len(pilihan):
+            return None
+        if not all(_index_sah(i, jumlah_kandidat) for i in pilihan):
+            return None
+        return tuple(sorted(pilihan))
+
+    def suara_langsung(self, slot):
+        return slot
+
+    def hitung(self, kontes):
+        # Persentase terhadap jumlah surat (pemilih), bukan jumlah persetujuan
+        return kontes.hasil_langsung(kontes.get_jumlah_surat())
+
+MESIN_PENGHITUNG = {m.nama: m for m in (Pluralitas, PilihanPeringkat, Persetujuan)}
+
+class Kontes:
+    # Satu pemilihan di surat suara (mis. Ketua/Wakil, Sekretaris) dengan mesin penghitungnya.
+    # Registri pasangan: ID = posisi di _pasangan_kandidat dan tidak pernah berubah; pasangan
+    # tidak dihapus, hanya ditarik. Suara, surat dan log memakai ID, bukan nama pasangan.
+    # Suara langsung (pilihan pertama / persetujuan) dan pemimpinnya dipelihara bertahap;
+    # surat lengkap disimpan ringkas hanya jika mesin membutuhkannya.
+    def __init__(self, nama, mesin=None):
+        self._nama = nama
+        self._mesin = mesin if mesin is not None else Pluralitas()
         self._pasangan_kandidat = []
-        self._suara = {}
-        self._log_voting = {}
+        self._indeks_pasangan = {}  # pasangan -> ID
+        self._id_per_nama = {}  # nama pasangan -> ID (untuk data lama yang menyimpan nama)
+        self._ditarik = set()
+        self._revisi_kandidat = 0  # naik setiap registri berubah (tambah/ubah/tarik)
+        self._suara = []
+        self._total_suara = 0
+        self._suara_terbanyak = 0
+        self._pemimpin = set()
+        self._suara_lain = {}  # suara tersimpan untuk nama pasangan yang tidak terdaftar
+        self._jumlah_surat = 0
+        self._surat = SuratSuara() if self._mesin.butuh_surat else None
+
+    @property
+    def nama(self):
+        return self._nama
+
+    @property
+    def mesin(self):
+        return self._mesin
+
+    def ganti_mesin(self, mesin):
+        # Hanya sebelum ada suara: dipakai saat data yang dimuat menyimpan mesinnya sendiri
+        self._mesin = mesin
+        self._surat = SuratSuara() if mesin.butuh_surat else None
 
     def tambah_pasangan(self, pasangan: PasanganKandidat):
+        id_pasangan = len(self._pasangan_kandidat)
+        self._indeks_pasangan[pasangan] = id_pasangan
+        self._id_per_nama.setdefault(pasangan.nama_pasangan, id_pasangan)
         self._pasangan_kandidat.append(pasangan)
-        self._suara[pasangan.nama_pasangan] = 0
+        self._suara.append(0)
+        self._hitung_ulang_pemimpin()
+        self._revisi_kandidat += 1
+        return id_pasangan
+
+    def ubah_pasangan(self, id_pasangan, pasangan: PasanganKandidat):
+        # Ganti data pasangan; ID beserta suara dan log-nya tetap
+        lama = self._pasangan_kandidat[id_pasangan]
+        del self._indeks_pasangan[lama]
+        if self._id_per_nama.get(lama.nama_pasangan) == id_pasangan:
+            del self._id_per_nama[lama.nama_pasangan]
+        self._pasangan_kandidat[id_pasangan] = pasangan
+        self._indeks_pasangan[pasangan] = id_pasangan
+        self._id_per_nama.setdefault(pasangan.nama_pasangan, id_pasangan)
+        self._revisi_kandidat += 1
+
+    def tarik_pasangan(self, id_pasangan, ditarik=True):
+        # Pasangan yang ditarik tidak bisa dipilih lagi; suara yang sudah masuk tetap dihitung
+        if ditarik:
+            self._ditarik.add(id_pasangan)
+        else:
+            self._ditarik.discard(id_pasangan)
+        self._revisi_kandidat += 1
+
+    def pasangan_aktif(self, id_pasangan):
+        return 0 <= id_pasangan < len(self._pasangan_kandidat) and id_pasangan not in self._ditarik
+
+    def _hitung_ulang_pemimpin(self):
+        self._suara_terbanyak = max(self._suara, default=0)
+        if self._suara_terbanyak == 0:
+            self._pemimpin = set()
+        else:
+            self._pemimpin = {i for i, jumlah in enumerate(self._suara) if jumlah == self._suara_terbanyak}
 
     def get_kandidat_list(self):
         return self._pasangan_kandidat
 
+    def get_revisi_kandidat(self):
+        return self._revisi_kandidat
+
     def get_pasangan_by_index(self, index):
         if 0 <= index < len(self._pasangan_kandidat):
             return self._pasangan_kandidat[index]
         return None
 
-    def tambah_suara(self, pasangan: PasanganKandidat):
-        self._suara[pasangan.nama_pasangan] += 1
+    def get_index_pasangan(self, pasangan: PasanganKandidat):
+        return self._indeks_pasangan.get(pasangan)
+
+    def get_id_by_nama(self, nama):
+        return self._id_per_nama.get(nama)
+
+    def kodekan(self, pilihan):
+        slot = self._mesin.kodekan(pilihan, len(self._pasangan_kandidat))
+        if slot is None or (self._ditarik and not self._ditarik.isdisjoint(slot)):
+            return None
+        return slot
+
+    def kunci_log(self, slot):
+        # Nilai log untuk surat: ID pasangan, tuple ID (approval), atau None (tidak menyetujui siapa pun)
+        ids = self._mesin.suara_langsung(slot)
+        if len(ids) == 1:
+            return ids[0]
+        return tuple(ids) if ids else None
+
+    def nama_log(self, kunci):
+        # Nama yang ditampilkan untuk nilai log (ID, tuple ID, None, atau nama dari data lama)
+        if isinstance(kunci, int):
+            pasangan = self.get_pasangan_by_index(kunci)
+            return pasangan.nama_pasangan if pasangan is not None else f"#{kunci}"
+        if isinstance(kunci, tuple):
+            return ", ".join(self.nama_log(i) for i in kunci)
+        return "-" if kunci is None else kunci
+
+    def _tambah_langsung(self, index):
+        # O(1): suara hanya bertambah, jadi pemimpin cukup dibandingkan dengan suara terbanyak
+        jumlah = self._suara[index] + 1
+        self._suara[index] = jumlah
+        self._total_suara += 1
+        if jumlah > self._suara_terbanyak:
+            self._suara_terbanyak = jumlah
+            self._pemimpin = {index}
+        elif jumlah == self._suara_terbanyak:
+            self._pemimpin.add(index)
+
+    def tambah_suara_index(self, index):
+        if self._surat is not None:
+            self.tambah_surat((index,))
+            return
+        # Jalur cepat pluralitas, sama dengan _tambah_langsung
+        jumlah = self._suara[index] + 1
+        self._suara[index] = jumlah
+        self._total_suara += 1
+        self._jumlah_surat += 1
+        if jumlah > self._suara_terbanyak:
+            self._suara_terbanyak = jumlah
+            self._pemimpin = {index}
+        elif jumlah == self._suara_terbanyak:
+            self._pemimpin.add(index)
+
+    def tambah_surat(self, slot):
+        # slot dari kodekan(); mengembalikan index yang suara langsungnya bertambah
+        berubah = self._mesin.suara_langsung(slot)
+        for index in berubah:
+            self._tambah_langsung(index)
+        self._jumlah_surat += 1
+        if self._surat is not None:
+            self._surat.tambah(slot)
+        return berubah
+
+    def tambah_tersimpan(self, kunci):
+        # Putar ulang record jurnal [username, ID] (atau [username, nama] dari versi lama)
+        if isinstance(kunci, str):
+            kunci = self._id_per_nama.get(kunci, kunci)
+        if isinstance(kunci, int) and 0 <= kunci < len(self._suara):
+            self.tambah_suara_index(kunci)
+            return
+        self._suara_lain[str(kunci)] = self._suara_lain.get(str(kunci), 0) + 1
+        self._jumlah_surat += 1
+
+    def pulihkan_per_nama(self, suara):
+        # Snapshot lama: hitungan disimpan per nama pasangan
+        for nama, jumlah in suara.items():
+            if nama in self._id_per_nama:
+                self._suara[self._id_per_nama[nama]] = jumlah
+            else:
+                self._suara_lain[nama] = jumlah
+        self._total_suara = sum(self._suara)
+        self._jumlah_surat = self._total_suara + sum(self._suara_lain.values())
+        self._hitung_ulang_pemimpin()
+
+    def suara_per_kunci(self):
+        # {ID: suara} ditambah suara lama yang tidak cocok dengan pasangan mana pun {nama: suara}
+        suara = dict(enumerate(self._suara))
+        suara.update(self._suara_lain)
+        return suara
+
+    def suara_per_nama(self):
+        suara = dict(self._suara_lain)
+        for pasangan, jumlah in zip(self._pasangan_kandidat, self._suara):
+            suara[pasangan.nama_pasangan] = suara.get(pasangan.nama_pasangan, 0) + jumlah
+        return suara
+
+    def ekspor(self):
+        return self.ekspor_tunda()()
+
+    def ekspor_tunda(self):
+        # Hitungan (kecil) disalin sekarang; surat di-encode saat fungsi hasilnya dipanggil
+        data = {"nama": self._nama, "mesin": self._mesin.nama, "suara": list(self._suara),
+                "lain": dict(self._suara_lain), "jumlah_surat": self._jumlah_surat, "surat": None}
+        surat = self._surat.ekspor_tunda() if self._surat is not None else None
+        def selesai():
+            if surat is not None:
+                data["surat"] = surat()
+            return data
+        return selesai
+
+    def impor(self, data):
+        # Hitungan per ID; ID di luar registri (mis. registri hilang) disimpan sebagai "#ID"
+        for i, jumlah in enumerate(data["suara"]):
+            if i < len(self._suara):
+                self._suara[i] = jumlah
+            elif jumlah:
+                self._suara_lain[f"#{i}"] = jumlah
+        self._suara_lain.update(data.get("lain", {}))
+        self._total_suara = sum(self._suara)
+        self._hitung_ulang_pemimpin()
+        self._jumlah_surat = data["jumlah_surat"]
+        if self._surat is not None and data.get("surat"):
+            self._surat = SuratSuara.impor(data["surat"])
+
+    def surat_suara(self):
+        return self._surat
+
+    def get_jumlah_surat(self):
+        return self._jumlah_surat
+
+    def get_total_suara(self):
+        return self._total_suara
+
+    def get_jumlah_suara(self, index):
+        return self._suara[index]
+
+    def get_persentase(self, index):
+        if self._total_suara == 0:
+            return 0.0
+        return self._suara[index] / self._total_suara * 100
+
+    def get_pemenang(self):
+        # Tuple index pasangan dengan suara langsung terbanyak; lebih dari satu berarti seri
+        return tuple(sorted(self._pemimpin))
+
+    def hasil_langsung(self, penyebut):
+        # Hasil dari suara langsung, persentase terhadap penyebut
+        if penyebut == 0:
+            return [], ()
+        hasil = [(i, pasangan, jumlah, jumlah / penyebut * 100)
+                 for i, (pasangan, jumlah) in enumerate(zip(self._pasangan_kandidat, self._suara))]
+        return hasil, tuple(sorted(self._pemimpin))
+
+    def get_hasil(self):
+        # hasil: [(index, pasangan, nilai, persentase)], pemenang: tuple index (kosong jika belum ada suara)
+        return self._mesin.hitung(self)
+
+# === Penyimpanan Suara ===
+class DataTerkunci(Exception):
+    pass
+
+class JurnalSuara:
+    # Jurnal append-only (satu baris per suara, dengan CRC) + snapshot berkala.
+    # Startup = baca snapshot terakhir + putar ulang sisa jurnal saja.
+    # Snapshot: jalur suara hanya memutar jurnal ke generasi baru; isi snapshot ditulis di
+    # thread latar. Sampai snapshot itu selesai, jurnal generasi lama tetap disimpan dan
+    # ikut diputar ulang, jadi mati listrik di tengah snapshot tidak menghilangkan suara.
+    # fsync bersifat group commit: flush() boleh dipanggil dari thread mana pun dan tidak
+    # mengulang fsync untuk record yang sudah tercakup fsync thread lain.
+    VERSI = 1
+
+    def __init__(self, folder, fsync_batch=1, snapshot_minimal=1000, baca_saja=False):
+        self._folder = folder
+        self._fsync_batch = max(1, fsync_batch)
+        self._snapshot_minimal = snapshot_minimal
+        self._baca_saja = baca_saja  # True: pulihkan() tidak membuka/memotong/menghapus file (ekspor)
+        self._path_snapshot = os.path.join(folder, "suara.snapshot.json")
+        self._path_mesin = os.path.join(folder, "suara.mesin.json")
+        self._generasi = 0  # generasi jurnal yang sedang ditulis
+        self._fd = None
+        self._kunci_fsync = threading.Lock()  # menjaga fsync dan penukaran _fd
+        self._ditulis = 0  # jumlah record yang sudah di-write
+        self._tersinkron = 0  # ... dan yang sudah di-fsync
+        self._panjang_ekor = 0  # jumlah record jurnal sejak snapshot terakhir
+        self._thread_snapshot = None
+        self._fd_kunci = None  # file kunci yang di-flock selama folder ini dibuka untuk ditulis
+
+    def _path_jurnal(self, generasi):
+        return os.path.join(self._folder, f"suara.{generasi}.jurnal")
+
+    @staticmethod
+    def _encode(username, kunci, surat=None):
+        # kunci: nilai log (ID pasangan); versi lama menyimpan nama pasangan di sini
+        record = [username, kunci] if surat is None else [username, kunci, surat]
+        data = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return b"%08x %s\n" % (zlib.crc32(data), data)
+
+    def kunci(self):
+        # Kunci eksklusif atas folder data: dua proses yang menulis jurnal dan log audit yang
+        # sama saling merusak (offset, generasi, rantai hash). Kunci dilepas OS saat proses
+        # mati, jadi tidak ada kunci basi. Melempar DataTerkunci jika proses lain memegangnya.
+        if self._fd_kunci is not None or fcntl is None:
+            return
+        os.makedirs(self._folder, exist_ok=True)
+        fd = os.open(os.path.join(self._folder, "data.kunci"), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            pid = os.read(fd, 32).decode("ascii", "replace").strip() or "?"
+            os.close(fd)
+            raise DataTerkunci(f"Folder data {self._folder} sedang dipakai proses lain (pid {pid}). "
+                               "Hanya satu koordinator atau GUI lokal yang boleh membuka folder data yang sama; "
+                               "hentikan proses itu dulu.") from None
+        os.ftruncate(fd, 0)
+        os.write(fd, b"%d\n" % os.getpid())
+        self._fd_kunci = fd
+
+    def pulihkan(self):
+        # Mengembalikan (suara, log, kontes, ekor): hitungan dan data kontes dari snapshot,
+        # log lengkap, dan record jurnal sesudah snapshot sebagai [(kunci, surat/None)]
+        if not self._baca_saja:
+            self.kunci()
+        suara, log, kontes, ekor = {}, {}, None, []
+        generasi_snapshot = 0
+        if os.path.exists(self._path_snapshot):
+            with open(self._path_snapshot, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            generasi_snapshot = snapshot["generasi"]
+            suara = snapshot["suara"]
+            log = snapshot["log"]
+            kontes = snapshot.get("kontes")
+
+        # Jurnal generasi snapshot dan semua sesudahnya (ada lebih dari satu jika proses
+        # berhenti sebelum snapshot latar selesai); yang terakhir dilanjutkan
+        self._generasi = generasi_snapshot
+        while os.path.exists(self._path_jurnal(self._generasi + 1)):
+            self._generasi += 1
+        self._panjang_ekor = 0
+        offset_valid = 0
+        for generasi in range(generasi_snapshot, self._generasi + 1):
+            path = self._path_jurnal(generasi)
+            offset_valid = 0
+            if not os.path.exists(path):
+                continue
+            with open(path, "rb") as f:
+                for baris in f:
+                    # Baris terakhir bisa terpotong saat listrik mati -> berhenti di situ
+                    if not baris.endswith(b"\n") or len(baris) < 10:
+                        break
+                    crc, data = baris[:8], baris[9:-1]
+                    try:
+                        if int(crc, 16) != zlib.crc32(data):
+                            break
+                        record = json.loads(data)
+                    except ValueError:
+                        break
+                    username, kunci = record[0], record[1]
+                    ekor.append((kunci, record[2] if len(record) > 2 else None))
+                    log[username] = kunci
+                    offset_valid += len(baris)
+                    self._panjang_ekor += 1
+        if self._baca_saja:
+            return suara, log, kontes, ekor
+        self._fd = os.open(self._path_jurnal(self._generasi), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        if os.fstat(self._fd).st_size != offset_valid:
+            os.ftruncate(self._fd, offset_valid)
+            os.fsync(self._fd)
+        self._hapus_jurnal_lama(generasi_snapshot)
+        return suara, log, kontes, ekor
+
+    def baca_mesin(self):
+        # Nama mesin penghitung per kontes yang dipakai data ini, atau None untuk data baru.
+        # Data lama tanpa suara.mesin.json memakai mesin yang tercatat di snapshot.
+        if os.path.exists(self._path_mesin):
+            with open(self._path_mesin, "r", encoding="utf-8") as f:
+                return json.load(f)["mesin"]
+        if os.path.exists(self._path_snapshot):
+            with open(self._path_snapshot, "r", encoding="utf-8") as f:
+                kontes = json.load(f).get("kontes")
+            if kontes:
+                return [k["mesin"] for k in kontes]
+        return None
+
+    def simpan_mesin(self, mesin):
+        if self._baca_saja:
+            return
+        tmp = self._path_mesin + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"versi": self.VERSI, "mesin": mesin}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._path_mesin)
+        self._fsync_folder()
+
+    def tulis(self, username, kunci, surat=None):
+        # Satu penulis dalam satu waktu (pemanggil memegang kunci tulis engine)
+        os.write(self._fd, self._encode(username, kunci, surat))
+        self._panjang_ekor += 1
+        self._ditulis += 1
+        if self._ditulis - self._tersinkron >= self._fsync_batch:
+            self.flush()
+
+    def flush(self):
+        # fsync semua record yang sudah di-write saat flush() dipanggil
+        target = self._ditulis
+        with self._kunci_fsync:
+            if self._fd is None or self._tersinkron >= target:
+                return
+            ditulis = self._ditulis
+            os.fsync(self._fd)
+            self._tersinkron = ditulis
+
+    def perlu_snapshot(self, jumlah_log):
+        # Snapshot hanya jika ekor jurnal sudah sebanding dengan isi snapshot,
+        # sehingga biaya snapshot tetap O(1) per suara (diamortisasi), dan tidak
+        # selama snapshot sebelumnya masih ditulis
+        if self._thread_snapshot is not None and self._thread_snapshot.is_alive():
+            return False
+        return self._panjang_ekor >= max(self._snapshot_minimal, jumlah_log // 2)
+
+    def snapshot(self, buat_data):
+        # Di jalur suara hanya: fsync + buka jurnal generasi baru. buat_data() dipanggil di
+        # thread latar dan harus mengembalikan (suara, log, kontes) sesuai keadaan saat ini
+        generasi_baru = self._generasi + 1
+        fd_baru = os.open(self._path_jurnal(generasi_baru), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        with self._kunci_fsync:
+            if self._tersinkron < self._ditulis:
+                os.fsync(self._fd)
+                self._tersinkron = self._ditulis
+            fd_lama, self._fd = self._fd, fd_baru
+        os.close(fd_lama)
+        self._generasi = generasi_baru
+        self._panjang_ekor = 0
+        self._thread_snapshot = threading.Thread(target=self._tulis_snapshot, args=(generasi_baru, buat_data),
+                                                 name="snapshot-suara", daemon=True)
+        self._thread_snapshot.start()
+
+    def _tulis_snapshot(self, generasi, buat_data):
+        suara, log, kontes = buat_data()
+        tmp = self._path_snapshot + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            data = {"versi": self.VERSI, "generasi": generasi, "suara": suara, "log": log}
+            if kontes is not None:
+                data["kontes"] = kontes
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._path_snapshot)
+        self._fsync_folder()
+        self._hapus_jurnal_lama(generasi)
+
+    def _hapus_jurnal_lama(self, generasi_snapshot):
+        for nama in os.listdir(self._folder):
+            if nama.startswith("suara.") and nama.endswith(".jurnal"):
+                try:
+                    generasi = int(nama.split(".")[1])
+                except ValueError:
+                    continue
+                if generasi < generasi_snapshot:
+                    os.remove(os.path.join(self._folder, nama))
+
+    def _fsync_folder(self):
+        try:
+            fd = os.open(self._folder, os.O_RDONLY)
+        except OSError:
+            return  # tidak didukung di Windows
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def close(self):
+        if self._thread_snapshot is not None:
+            self._thread_snapshot.join()
+        if self._fd is not None:
+            self.flush()
+            os.close(self._fd)
+            self._fd = None
+        if self._fd_kunci is not None:
+            os.close(self._fd_kunci)  # melepas flock
+            self._fd_kunci = None
+
+PESAN_AUDIT_PUTUS = ("Rantai log audit tidak utuh sejak checkpoint terakhir (entri diubah, disisipkan atau "
+                     "dihapus). Suara baru tetap dicatat; periksa dengan 'audit --penuh'.")
+
+class LogAudit:
+    # Log audit append-only berantai hash. Satu baris per suara:
+    #   <no> <waktu UTC> <hash entri sebelumnya> <hash entri ini> <record JSON>
+    # Mengubah, menyisipkan atau menghapus satu entri memutus rantai sesudahnya.
+    # Tiap `checkpoint_setiap` entri, nomor, posisi byte dan hash entri terakhir dicatat
+    # di audit.checkpoint (ditandatangani HMAC jika ada kunci), sehingga pembukaan ulang dan
+    # verifikasi inkremental cukup membaca log sejak checkpoint terakhir.
+    AWAL = b"0" * 64
+
+    def __init__(self, folder, fsync_batch=1, checkpoint_setiap=1000, kunci=None):
+        self._folder = folder
+        self._path = os.path.join(folder, "audit.log")
+        self._path_checkpoint = os.path.join(folder, "audit.checkpoint")
+        self._fsync_batch = max(1, fsync_batch)
+        self._checkpoint_setiap = max(1, checkpoint_setiap)
+        self._kunci = kunci.encode("utf-8") if isinstance(kunci, str) else kunci
+        self._fd = None
+        self._fd_checkpoint = None
+        self._kunci_fsync = threading.Lock()  # group commit, lihat JurnalSuara.flush
+        self._ditulis = 0
+        self._tersinkron = 0
+        self._no = 0
+        self._hash = self.AWAL
+        self._offset = 0
+
+    @staticmethod
+    def _hash_entri(no, waktu, sebelumnya, data):
+        return hashlib.sha256(b"%d %s %s %s" % (no, waktu, sebelumnya, data)).hexdigest().encode("ascii")
+
+    @staticmethod
+    def _waktu():
+        sekarang = time.time()
+        detik = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sekarang)).encode("ascii")
+        return b"%s.%06dZ" % (detik, int(sekarang % 1 * 1_000_000))
+
+    @staticmethod
+    def _parse(baris):
+        # -> (no, waktu, sebelumnya, hash, data), atau None untuk baris rusak/terpotong
+        if not baris.endswith(b"\n"):
+            return None
+        bagian = baris[:-1].split(b" ", 4)
+        if len(bagian) != 5 or len(bagian[2]) != 64 or len(bagian[3]) != 64:
+            return None
+        try:
+            return int(bagian[0]), bagian[1], bagian[2], bagian[3], bagian[4]
+        except ValueError:
+            return None
+
+    def _mac(self, no, awal, hash_entri):
+        return hmac.new(self._kunci, b"%d %d %s" % (no, awal, hash_entri), hashlib.sha256).hexdigest()
+
+    def _checkpoints(self):
+        # Stream checkpoint dari file (baris terakhir yang terpotong diabaikan)
+        if not os.path.exists(self._path_checkpoint):
+            return
+        with open(self._path_checkpoint, "rb") as f:
+            for baris in f:
+                if not baris.endswith(b"\n"):
+                    return
+                try:
+                    yield json.loads(baris)
+                except ValueError:
+                    return
+
+    def _checkpoint_terakhir(self):
+        if not os.path.exists(self._path_checkpoint):
+            return None
+        with open(self._path_checkpoint, "rb") as f:
+            f.seek(max(0, os.fstat(f.fileno()).st_size - 4096))
+            ekor = f.read().split(b"\n")[:-1]  # elemen terakhir: sisa baris terpotong atau kosong
+        for baris in reversed(ekor):
+            try:
+                return json.loads(baris)
+            except ValueError:
+                continue
+        return None
+
+    def buka(self):
+        # Lanjutkan rantai dari checkpoint terakhir; ekor yang terpotong (mati listrik) dibuang.
+        # Mengembalikan False jika rantai sejak checkpoint ternyata tidak utuh
+        # (log tetap dibiarkan apa adanya agar auditor bisa menunjukkan kerusakannya).
+        os.makedirs(self._folder, exist_ok=True)
+        checkpoint = self._checkpoint_terakhir()
+        if checkpoint is not None:
+            self._no, self._hash, self._offset = checkpoint["no"], checkpoint["hash"].encode("ascii"), checkpoint["akhir"]
+        utuh = True
+        if os.path.exists(self._path):
+            with open(self._path, "rb") as f:
+                f.seek(self._offset)
+                for baris in f:
+                    entri = self._parse(baris)
+                    if entri is None:
+                        if not baris.endswith(b"\n"):
+                            break
+                        utuh = False
+                        self._offset += len(baris)
+                        continue
+                    no, waktu, sebelumnya, hash_entri, data = entri
+                    if (no != self._no + 1 or sebelumnya != self._hash
+                            or self._hash_entri(no, waktu, sebelumnya, data) != hash_entri):
+                        utuh = False
+                    self._no, self._hash = no, hash_entri
+                    self._offset += len(baris)
+        self._fd = os.open(self._path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        ukuran = os.fstat(self._fd).st_size
+        if ukuran > self._offset:
+            os.ftruncate(self._fd, self._offset)
+            os.fsync(self._fd)
+        elif ukuran < self._offset:
+            utuh = False  # log lebih pendek dari checkpoint terakhir
+            self._offset = ukuran
+        self._fd_checkpoint = os.open(self._path_checkpoint, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        return utuh
+
+    def catat(self, username, kunci, surat=None):
+        record = [username, kunci] if surat is None else [username, kunci, surat]
+        data = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        no = self._no + 1
+        waktu = self._waktu()
+        hash_entri = self._hash_entri(no, waktu, self._hash, data)
+        baris = b"%d %s %s %s %s\n" % (no, waktu, self._hash, hash_entri, data)
+        os.write(self._fd, baris)
+        awal = self._offset
+        self._no, self._hash, self._offset = no, hash_entri, self._offset + len(baris)
+        self._ditulis += 1
+        if self._ditulis - self._tersinkron >= self._fsync_batch:
+            self.flush()
+        if no % self._checkpoint_setiap == 0:
+            self._checkpoint(awal)
+
+    def _checkpoint(self, awal):
+        # Checkpoint hanya menunjuk entri yang sudah di-fsync
+        self.flush()
+        checkpoint = {"no": self._no, "awal": awal, "akhir": self._offset, "hash": self._hash.decode("ascii")}
+        if self._kunci:
+            checkpoint["mac"] = self._mac(self._no, awal, self._hash)
+        os.write(self._fd_checkpoint, json.dumps(checkpoint, separators=(",", ":")).encode("ascii") + b"\n")
+        os.fsync(self._fd_checkpoint)
+
+    def flush(self):
+        target = self._ditulis
+        with self._kunci_fsync:
+            if self._fd is None or self._tersinkron >= target:
+                return
+            ditulis = self._ditulis
+            os.fsync(self._fd)
+            self._tersinkron = ditulis
+
+    def close(self):
+        if self._fd is not None:
+            self.flush()
+            with self._kunci_fsync:
+                os.close(self._fd)
+                os.close(self._fd_checkpoint)
+                self._fd = self._fd_checkpoint = None
+
+    def verifikasi(self, penuh=False):
+        # Periksa rantai secara streaming (memori tetap, berapa pun besar log).
+        # penuh=False: mulai dari checkpoint terakhir (entri checkpoint itu sendiri ikut diperiksa);
+        # penuh=True: dari entri pertama, sekaligus mencocokkan setiap checkpoint.
+        # Mengembalikan (ok, jumlah_entri_diperiksa, pesan)
+        if not os.path.exists(self._path):
+            return True, 0, "log audit belum ada"
+        no, hash_sebelumnya, offset = 0, self.AWAL, 0
+        checkpoints = iter(())
+        checkpoint = None
+        if penuh:
+            checkpoints = self._checkpoints()
+            checkpoint = next(checkpoints, None)
+        else:
+            checkpoint = self._checkpoint_terakhir()
+            if checkpoint is not None:
+                no, offset = checkpoint["no"] - 1, checkpoint["awal"]
+                hash_sebelumnya = None  # diambil dari entri checkpoint itu sendiri
+        diperiksa = 0
+        with open(self._path, "rb", buffering=1 << 20) as f:
+            f.seek(offset)
+            for baris in f:
+                entri = self._parse(baris)
+                if entri is None:
+                    if not baris.endswith(b"\n"):
+                        break  # entri yang sedang ditulis
+                    return False, diperiksa, f"entri ke-{no + 1} (byte {offset}) rusak"
+                no_entri, waktu, sebelumnya, hash_entri, data = entri
+                if no_entri != no + 1:
+                    return False, diperiksa, f"byte {offset}: nomor entri {no_entri}, seharusnya {no + 1}"
+                if hash_sebelumnya is not None and sebelumnya != hash_sebelumnya:
+                    return False, diperiksa, f"entri {no_entri}: rantai putus (hash sebelumnya tidak cocok)"
+                if self._hash_entri(no_entri, waktu, sebelumnya, data) != hash_entri:
+                    return False, diperiksa, f"entri {no_entri}: isi tidak cocok dengan hash-nya"
+                if checkpoint is not None and checkpoint["no"] == no_entri:
+                    pesan = self._cek_checkpoint(checkpoint, offset, hash_entri)
+                    if pesan:
+                        return False, diperiksa, pesan
+                    checkpoint = next(checkpoints, None)
+                no, hash_sebelumnya = no_entri, hash_entri
+                offset += len(baris)
+                diperiksa += 1
+        if checkpoint is not None:
+            return False, diperiksa, f"checkpoint {checkpoint['no']} menunjuk entri yang tidak ada (log terpotong)"
+        return True, diperiksa, f"rantai utuh sampai entri {no}"
+
+    def _cek_checkpoint(self, checkpoint, awal, hash_entri):
+        if checkpoint["awal"] != awal or checkpoint["hash"].encode("ascii") != hash_entri:
+            return f"checkpoint {checkpoint['no']} tidak cocok dengan log"
+        if self._kunci and not hmac.compare_digest(checkpoint.get("mac", ""), self._mac(checkpoint["no"], awal, hash_entri)):
+            return f"checkpoint {checkpoint['no']}: tanda tangan HMAC tidak sah"
+        return None
+
+class LogView:
+    # Potongan log voting (baca-saja). Baris diambil per halaman, tanpa menyalin seluruh log.
+    # Log menyimpan ID pasangan; nama_log mengubahnya menjadi nama saat ditampilkan.
+    def __init__(self, log, usernames, mulai=0, panjang=None, posisi=None, nama_log=str):
+        self._log = log
+        self._nama_log = nama_log
+        self._usernames = usernames
+        self._mulai = mulai
+        self._posisi = posisi  # array index ke usernames (filter per pasangan)
+        if panjang is None:
+            panjang = len(posisi) if posisi is not None else len(usernames) - mulai
+        self._panjang = panjang  # dibekukan saat view dibuat
+
+    def __len__(self):
+        return self._panjang
+
+    def ambil_kunci(self, mulai, jumlah):
+        # [(username, ID pasangan)]
+        hasil = []
+        for i in range(max(0, mulai), min(self._panjang, mulai + jumlah)):
+            if self._posisi is not None:
+                username = self._usernames[self._posisi[i]]
+            else:
+                username = self._usernames[self._mulai + i]
+            hasil.append((username, self._log[username]))
+        return hasil
 
-    def log_voting(self, username, pasangan_nama):
-        self._log_voting[username] = pasangan_nama
+    def ambil(self, mulai, jumlah):
+        # [(username, nama pasangan)]
+        return [(username, self._nama_log(kunci)) for username, kunci in self.ambil_kunci(mulai, jumlah)]
+
+class VotingSystem:
+    # Kontes pertama adalah kontes utama (yang ditampilkan GUI); kontes lain opsional
+    # dan diisi lewat surat multi-kontes (kodekan_surat + catat_surat).
+    def __init__(self, store=None, mesin=None, audit=None):
+        self._utama = Kontes("Utama", mesin)
+        self._kontes = [self._utama]
+        self._log_voting = {}
+        # Indeks log: urutan masuk, posisi per pasangan, dan username terurut (untuk cari awalan)
+        self._log_urutan = []
+        self._log_per_pasangan = {}
+        self._log_terurut = []
+        self._log_belum_terurut = []
+        # Pencarian log bisa berjalan di thread lain (koordinator) bersamaan dengan penulis:
+        # _kunci_log menjaga append/penukaran _log_belum_terurut, _kunci_gabung menyerialkan
+        # penggabungan ke _log_terurut (penulis tidak ikut menunggu pengurutan)
+        self._kunci_log = threading.Lock()
+        self._kunci_gabung = threading.Lock()
+        self._store = store
+        self._audit = audit  # LogAudit opsional: setiap suara juga dicatat di rantai hash
+        self._audit_utuh = True
+        self._pendengar = ()  # callback(index) dipanggil setiap suara kontes utama masuk
+        self._tambah_utama = self._utama.tambah_suara_index
+
+    def tambah_pendengar(self, callback):
+        self._pendengar = self._pendengar + (callback,)
+
+    def hapus_pendengar(self, callback):
+        self._pendengar = tuple(c for c in self._pendengar if c is not callback)
+
+    def tambah_pasangan(self, pasangan: PasanganKandidat):
+        return self._utama.tambah_pasangan(pasangan)
+
+    def ubah_pasangan(self, id_pasangan, pasangan: PasanganKandidat):
+        self._utama.ubah_pasangan(id_pasangan, pasangan)
+
+    def tarik_pasangan(self, id_pasangan, ditarik=True):
+        self._utama.tarik_pasangan(id_pasangan, ditarik)
+
+    def pasangan_aktif(self, id_pasangan):
+        return self._utama.pasangan_aktif(id_pasangan)
+
+    def get_revisi_kandidat(self):
+        return self._utama.get_revisi_kandidat()
+
+    def tambah_kontes(self, kontes):
+        self._kontes.append(kontes)
+        return kontes
+
+    def get_kontes_list(self):
+        return self._kontes
+
+    def get_kontes_tambahan(self):
+        # Kontes selain kontes utama; layar voting menampilkannya sebagai pilihan opsional
+        return self._kontes[1:]
+
+    def pulihkan(self):
+        # Muat suara yang sudah tersimpan (dipanggil setelah semua kontes dan pasangan ditambahkan)
+        if self._audit is not None:
+            self._audit_utuh = self._audit.buka()
+        if self._store is None:
+            return
+        suara, log, kontes, ekor = self._store.pulihkan()
+        # Mesin ikut data, bukan opsi saat dijalankan: surat yang sudah tercatat harus
+        # diputar ulang dan dihitung dengan mesin yang sama seperti saat dicatat
+        mesin = self._store.baca_mesin() or []
+        if len(mesin) < len(self._kontes):
+            # Data baru, atau kontes tambahan baru didaftarkan: mesinnya ikut disimpan
+            mesin = mesin + [k.mesin.nama for k in self._kontes[len(mesin):]]
+            self._store.simpan_mesin(mesin)
+        for k, nama in zip(self._kontes, mesin):
+            if k.mesin.nama != nama:
+                k.ganti_mesin(MESIN_PENGHITUNG[nama]())
+        if kontes:
+            for k, data in zip(self._kontes, kontes):
+                k.impor(data)
+        else:
+            self._utama.pulihkan_per_nama(suara)
+        for kunci, surat in ekor:
+            if surat is None:
+                self._utama.tambah_tersimpan(kunci)
+            else:
+                self._terapkan_surat([tuple(slot) if slot is not None else None for slot in surat])
+        for username, kunci in log.items():
+            if isinstance(kunci, list):
+                kunci = tuple(kunci)
+            elif isinstance(kunci, str):  # log lama menyimpan nama pasangan
+                id_pasangan = self._utama.get_id_by_nama(kunci)
+                kunci = kunci if id_pasangan is None else id_pasangan
+            self._log_voting[username] = kunci
+        self._bangun_indeks_log()
+
+    def audit_utuh(self):
+        # False jika saat pulihkan() rantai log audit sejak checkpoint terakhir ternyata putus;
+        # entri baru tetap ditambahkan, jadi pemanggil harus memberi tahu operator
+        return self._audit_utuh
+
+    def get_kandidat_list(self):
+        return self._utama.get_kandidat_list()
+
+    def get_pasangan_by_index(self, index):
+        return self._utama.get_pasangan_by_index(index)
+
+    def get_index_pasangan(self, pasangan: PasanganKandidat):
+        return self._utama.get_index_pasangan(pasangan)
+
+    def tambah_suara(self, pasangan: PasanganKandidat):
+        self.tambah_suara_index(self._utama.get_index_pasangan(pasangan))
+
+    def tambah_suara_index(self, index):
+        self._tambah_utama(index)
+        for callback in self._pendengar:
+            callback(index)
+
+    def log_voting(self, username, kunci):
+        # kunci: ID pasangan (tuple ID untuk approval)
+        if username not in self._log_voting:
+            self._log_voting[username] = kunci
+            self._indeks_log_per_pasangan(kunci, len(self._log_urutan))
+            self._log_urutan.append(username)
+            with self._kunci_log:
+                self._log_belum_terurut.append(username)
+        elif self._log_voting[username] != kunci:
+            self._log_voting[username] = kunci
+            self._bangun_indeks_log()  # jarang: entri log ditimpa
+
+    def _indeks_log_per_pasangan(self, kunci, posisi):
+        for id_pasangan in kunci if isinstance(kunci, tuple) else (kunci,):
+            self._log_per_pasangan.setdefault(id_pasangan, array("l")).append(posisi)
+
+    def _bangun_indeks_log(self):
+        self._log_urutan = list(self._log_voting)
+        self._log_per_pasangan = {}
+        for posisi, kunci in enumerate(self._log_voting.values()):
+            self._indeks_log_per_pasangan(kunci, posisi)
+        with self._kunci_gabung:
+            with self._kunci_log:
+                self._log_belum_terurut = []
+            self._log_terurut = sorted(self._log_urutan)
+
+    def _username_terurut(self):
+        with self._kunci_gabung:
+            if self._log_belum_terurut:
+                with self._kunci_log:
+                    baru, self._log_belum_terurut = self._log_belum_terurut, []
+                baru.sort()
+                # Dua run yang sudah terurut -> timsort cukup menggabungkan dalam O(n)
+                self._log_terurut = sorted(self._log_terurut + baru)
+            return self._log_terurut
+
+    def cari_log(self, awalan="", id_pasangan=None):
+        # LogView sesuai filter awalan username dan/atau ID pasangan
+        nama_log = self._utama.nama_log
+        if not awalan:
+            if id_pasangan is None:
+                return LogView(self._log_voting, self._log_urutan, nama_log=nama_log)
+            return LogView(self._log_voting, self._log_urutan, nama_log=nama_log,
+                           posisi=self._log_per_pasangan.get(id_pasangan, array("l")))
+        terurut = self._username_terurut()
+        lo = bisect_left(terurut, awalan)
+        hi = bisect_left(terurut, awalan + "\U0010ffff")
+        if id_pasangan is None:
+            return LogView(self._log_voting, terurut, mulai=lo, panjang=hi - lo, nama_log=nama_log)
+        cocok = [u for u in terurut[lo:hi] if self._log_voting[u] == id_pasangan
+                 or (isinstance(self._log_voting[u], tuple) and id_pasangan in self._log_voting[u])]
+        return LogView(self._log_voting, cocok, nama_log=nama_log)
+
+    def catat_suara(self, username, pasangan: PasanganKandidat):
+        # tambah_suara + log_voting sebagai satu record jurnal (ditulis lebih dulu)
+        id_pasangan = self._utama.get_index_pasangan(pasangan)
+        if self._utama.mesin.butuh_surat or len(self._kontes) > 1:
+            self.catat_surat(username, [self._utama.kodekan(id_pasangan)] + [None] * (len(self._kontes) - 1))
+            return
+        if self._store is not None:
+            self._store.tulis(username, id_pasangan)
+        if self._audit is not None:
+            self._audit.catat(username, id_pasangan)
+        self.tambah_suara_index(id_pasangan)
+        self.log_voting(username, id_pasangan)
+        self._snapshot_jika_perlu()
+
+    def kodekan_surat(self, pilihan):
+        # pilihan per kontes (urutan get_kontes_list, None = tidak memilih di kontes itu;
+        # kontes utama wajib diisi) -> list slot per kontes, atau None jika ada yang tidak sah
+        if len(pilihan) != len(self._kontes) or pilihan[0] is None:
+            return None
+        surat = []
+        for kontes, p in zip(self._kontes, pilihan):
+            slot = None if p is None else kontes.kodekan(p)
+            if p is not None and slot is None:
+                return None
+            surat.append(slot)
+        return surat
+
+    def catat_surat(self, username, surat):
+        # Surat multi-kontes dari kodekan_surat: satu record jurnal untuk semua kontes
+        kunci = self._utama.kunci_log(surat[0])
+        if self._store is not None:
+            self._store.tulis(username, kunci, surat)
+        if self._audit is not None:
+            self._audit.catat(username, kunci, surat)
+        self._terapkan_surat(surat)
+        self.log_voting(username, kunci)
+        self._snapshot_jika_perlu()
+
+    def _terapkan_surat(self, surat):
+        for kontes, slot in zip(self._kontes, surat):
+            if slot is None:
+                continue
+            berubah = kontes.tambah_surat(slot)
+            if kontes is self._utama:
+                for index in berubah:
+                    for callback in self._pendengar:
+                        callback(index)
+
+    def _snapshot_jika_perlu(self):
+        # Di jalur suara hanya diambil hitungan dan panjang log; isi log dibaca di thread
+        # snapshot. Entri log tidak pernah dihapus dan urutan hanya ditambah (dibangun ulang
+        # sebagai list baru), jadi n entri pertama tetap sama
+        if self._store is None or not self._store.perlu_snapshot(len(self._log_voting)):
+            return
+        suara = self._utama.suara_per_nama()
+        kontes = [k.ekspor_tunda() for k in self._kontes]
+        log, urutan, n = self._log_voting, self._log_urutan, len(self._log_urutan)
+        def buat_data():
+            return suara, {username: log[username] for username in islice(urutan, n)}, [k() for k in kontes]
+        self._store.snapshot(buat_data)
+
+    def flush(self):
+        # fsync jurnal dan log audit; aman dipanggil di luar kunci tulis (group commit)
+        if self._store is not None:
+            self._store.flush()
+        if self._audit is not None:
+            self._audit.flush()
+
+    def close(self):
+        # Audit ditutup dulu: menutup store melepas kunci folder data
+        if self._audit is not None:
+            self._audit.close()
+        if self._store is not None:
+            self._store.close()
 
     def get_log_voting(self):
         return self._log_voting
 
+    def sudah_tercatat(self, username):
+        return username in self._log_voting
+
+    def get_total_suara(self):
+        return self._utama.get_total_suara()
+
+    def get_jumlah_suara(self, index):
+        return self._utama.get_jumlah_suara(index)
+
+    def get_persentase(self, index):
+        return self._utama.get_persentase(index)
+
+    def get_pemenang(self):
+        return self._utama.get_pemenang()
+
     def get_hasil(self):
-        total_suara = sum(self._suara.values())
-        hasil = []
-        if total_suara == 0:
-            return hasil, None
-        pemenang = max(self._suara, key=self._suara.get)
-        for nama, jumlah in self._suara.items():  # <-- diperbaiki unpacking
-            persentase = (jumlah / total_suara) * 100
-            hasil.append((nama, jumlah, persentase))
-        return hasil, pemenang
+        # Hasil kontes utama menurut mesin penghitungnya (lihat Kontes.get_hasil)
+        return self._utama.get_hasil()
+
+def _hash_baris_csv(baris):
+    # Dipakai worker multiprocessing saat impor: (username, password, hash, iterasi) -> (username, hash)
+    username, password, password_hash, iterasi = baris
+    return username, password_hash or hash_password(password, iterasi)
+
+# --- Pembatas Percobaan Login ---
+class StatusAkses(Enum):
+    BERHASIL = "berhasil"
+    GAGAL = "gagal"  # password salah / username sudah dipakai
+    DIBATASI = "dibatasi"  # terlalu banyak percobaan, coba lagi setelah beberapa detik
+
+class PembatasPercobaan:
+    # Token bucket per kunci (username atau stasiun): paling banyak `kapasitas` kegagalan
+    # beruntun, lalu token terisi lagi kapasitas/detik per detik. Setelah habis, kunci terkunci
+    # sampai token berikutnya terisi dan pulih penuh paling lama `detik` detik kemudian.
+    # Per kunci hanya disimpan satu float: waktu ember penuh lagi (GCRA). Hanya kunci yang
+    # pernah gagal yang disimpan, urut menurut pembaruan terakhir; entri di depan yang sudah
+    # penuh dibuang saat ada kegagalan baru (amortized O(1)). Jumlah entri dibatasi maks_kunci,
+    # tetapi entri yang masih aktif tidak pernah dibuang (membuangnya akan membuka kunci akun
+    # yang sedang diserang). Saat tabel penuh entri aktif, kegagalan kunci baru tidak dicatat:
+    # kunci itu hanya dibatasi pembatas lain (stasiun), bukan dikunci bersama kunci lain.
+    PANJANG_KUNCI = 64  # username/stasiun sepanjang apa pun tidak menambah memori
+
+    def __init__(self, kapasitas, detik, maks_kunci=100000):
+        self._detik = detik
+        self._per_token = detik / kapasitas
+        self._batas_kunci = detik - self._per_token  # selisih penuh-sekarang saat token < 1
+        self._maks_kunci = maks_kunci
+        self._penuh = OrderedDict()  # kunci -> waktu (monotonic) ember penuh lagi
+        self._kunci = threading.Lock()
+
+    def tunggu(self, kunci):
+        # 0.0 jika kunci boleh mencoba, selain itu detik sampai percobaan berikutnya.
+        # Tanpa lock: kunci yang belum pernah gagal cukup satu lookup dict
+        penuh = self._penuh.get(kunci[:self.PANJANG_KUNCI])
+        if penuh is None:
+            return 0.0
+        sisa = penuh - time.monotonic() - self._batas_kunci
+        return sisa if sisa > 0 else 0.0
+
+    def catat(self, kunci):
+        # Satu percobaan gagal: ambil satu token
+        kunci = kunci[:self.PANJANG_KUNCI]
+        with self._kunci:
+            sekarang = time.monotonic()
+            daftar = self._penuh
+            putar = 0
+            while daftar:
+                tertua = next(iter(daftar))
+                if daftar[tertua] <= sekarang:
+                    del daftar[tertua]
+                elif len(daftar) >= self._maks_kunci and putar < 8:
+                    # Tabel penuh: entri aktif di depan diputar ke belakang agar entri yang
+                    # sudah pulih di belakangnya tetap terjangkau
+                    daftar.move_to_end(tertua)
+                    putar += 1
+                else:
+                    break
+            if kunci not in daftar and len(daftar) >= self._maks_kunci:
+                return
+            penuh = max(daftar.get(kunci, sekarang), sekarang) + self._per_token
+            daftar[kunci] = min(penuh, sekarang + self._detik)
+            daftar.move_to_end(kunci)
+
+    def lupakan(self, kunci):
+        kunci = kunci[:self.PANJANG_KUNCI]
+        if kunci in self._penuh:
+            with self._kunci:
+                self._penuh.pop(kunci, None)
+
+    def __len__(self):
+        return len(self._penuh)
 
 class LoginManager:
-    def __init__(self, users, admin_password):
+    # Batas bawaan (percobaan, detik): 5 password salah per username lalu 1 percobaan/menit;
+    # per stasiun 30 password salah per menit dan 10 registrasi per menit. None = tanpa batas.
+    BATAS_USERNAME = (5, 300)
+    BATAS_STASIUN = (30, 60)
+    BATAS_REGISTRASI = (10, 60)
+
+    def __init__(self, users, admin_password, iterasi_hash=None, batas_username=BATAS_USERNAME,
+                 batas_stasiun=BATAS_STASIUN, batas_registrasi=BATAS_REGISTRASI):
+        # Objek User eksplisit (admin, akun bawaan) + DPT ringkas untuk pemilih hasil registrasi/impor
         self._users = {user.username: user for user in users}
+        self._pemilih = PemilihStore()
         self._admin_password = admin_password
+        self._iterasi_hash = iterasi_hash
+        self._batas_username = PembatasPercobaan(*batas_username) if batas_username else None
+        self._batas_stasiun = PembatasPercobaan(*batas_stasiun) if batas_stasiun else None
+        self._batas_registrasi = PembatasPercobaan(*batas_registrasi) if batas_registrasi else None
+
+    def masuk(self, username, password, stasiun=None):
+        # -> (StatusAkses, user atau None, detik tunggu). Percobaan yang dibatasi ditolak
+        # sebelum hashing password, jadi serangan tidak menghabiskan CPU koordinator.
+        # Batas per stasiun hanya berlaku jika stasiun diketahui.
+        batas_stasiun = self._batas_stasiun if stasiun is not None else None
+        tunggu = max(batas_stasiun.tunggu(stasiun) if batas_stasiun is not None else 0.0,
+                     self._batas_username.tunggu(username) if self._batas_username is not None else 0.0)
+        if tunggu:
+            return StatusAkses.DIBATASI, None, tunggu
+        user = self.get_user(username)
+        if user and user.check_password(password):
+            if self._batas_username is not None:
+                self._batas_username.lupakan(username)
+            return StatusAkses.BERHASIL, user, 0.0
+        # Hanya username yang ada yang dicatat: banjir username acak cukup ditahan batas stasiun
+        # dan tidak memenuhi tabel username (akun sungguhan yang diserang tetap punya tempat)
+        if user is not None and self._batas_username is not None:
+            self._batas_username.catat(username)
+        if batas_stasiun is not None:
+            batas_stasiun.catat(stasiun)
+        return StatusAkses.GAGAL, None, 0.0
+
+    def login(self, username, password, stasiun=None):
+        return self.masuk(username, password, stasiun)[1]
+
+    def tambah_user(self, user):
+        self._users[user.username] = user
+
+    def _terdaftar(self, username):
+        return username in self._users or username in self._pemilih
+
+    def daftar_pemilih(self, username, password, stasiun=None):
+        # -> (StatusAkses, detik tunggu); setiap percobaan dari stasiun yang sama dihitung
+        if stasiun is not None and self._batas_registrasi is not None:
+            tunggu = self._batas_registrasi.tunggu(stasiun)
+            if tunggu:
+                return StatusAkses.DIBATASI, tunggu
+            self._batas_registrasi.catat(stasiun)
+        if self._terdaftar(username):
+            return StatusAkses.GAGAL, 0.0
+        self._pemilih.tambah(username, hash_password(password, self._iterasi_hash))
+        return StatusAkses.BERHASIL, 0.0
+
+    def register_pemilih(self, username, password, stasiun=None):
+        return self.daftar_pemilih(username, password, stasiun)[0] is StatusAkses.BERHASIL
+
+    def import_pemilih_csv(self, path, batch=10000, proses=None):
+        # Impor DPT dari CSV secara streaming (kolom: username, password atau password_hash).
+        # Hanya satu batch yang ada di memori; hashing dibagi ke beberapa proses jika proses > 1.
+        # Mengembalikan (jumlah diimpor, jumlah dilewati).
+        diimpor = dilewati = 0
+        pool = None
+        if proses and proses > 1:
+            from multiprocessing import Pool
+            pool = Pool(proses)
+        try:
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                reader = csv.DictReader(f)
+                while True:
+                    baris = []
+                    dibaca = 0
+                    for row in islice(reader, batch):
+                        dibaca += 1
+                        username = (row.get("username") or "").strip()
+                        password = row.get("password") or ""
+                        password_hash = row.get("password_hash") or None
+                        if not username or (not password and not password_hash) or self._terdaftar(username):
+                            dilewati += 1
+                            continue
+                        if password_hash is not None and not hash_sah(password_hash):
+                            # Hash rusak / iterasi di luar batas: akun tidak akan pernah bisa login
+                            print(f"{path}:{reader.line_num}: password_hash {username!r} tidak sah, dilewati", file=sys.stderr)
+                            dilewati += 1
+                            continue
+                        baris.append((username, password, password_hash, self._iterasi_hash))
+                    if pool:
+                        hasil = pool.map(_hash_baris_csv, baris, chunksize=max(1, len(baris) // (proses * 4)))
+                    else:
+                        hasil = map(_hash_baris_csv, baris)
+                    for username, password_hash in hasil:
+                        if self._pemilih.tambah(username, password_hash) is None:  # duplikat di file yang sama
+                            dilewati += 1
+                            continue
+                        diimpor += 1
+                    if dibaca < batch:
+                        break
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+        return diimpor, dilewati
 
-    def login(self, username, password):
+    def get_user(self, username):
         user = self._users.get(username)
-        if user and user.check_password(password):
-            return user
+        if user is None:
+            user = self._pemilih.get(username)
+        return user
+
+    def jumlah_pemilih(self):
+        return len(self._pemilih) + sum(1 for user in self._users.values() if isinstance(user, Pemilih))
+
+# === Engine Voting (tanpa GUI) ===
+class StatusVote(Enum):
+    BERHASIL = "berhasil"
+    USER_TIDAK_DITEMUKAN = "user_tidak_ditemukan"
+    BUKAN_PEMILIH = "bukan_pemilih"
+    SUDAH_MEMILIH = "sudah_memilih"
+    PASANGAN_TIDAK_VALID = "pasangan_tidak_valid"
+    SESI_TIDAK_VALID = "sesi_tidak_valid"  # mode koordinator: belum login / sesi kedaluwarsa atau sudah dipakai
+
+class VotingEngine:
+    # Lapisan layanan tanpa Tk: cek suara ganda, tambah suara, dan log dalam satu langkah.
+    # thread_safe=True: kunci per-username (di-stripe) untuk cek suara ganda,
+    # ditambah satu kunci pendek di sekitar penulisan ke VotingSystem dan bitset DPT.
+    def __init__(self, voting_system, login_manager, thread_safe=False, jumlah_kunci=64):
+        self._voting_system = voting_system
+        self._login_manager = login_manager
+        if thread_safe:
+            self._kunci_pemilih = [threading.Lock() for _ in range(jumlah_kunci)]
+            self._kunci_tulis = threading.Lock()
+        else:
+            self._kunci_pemilih = None
+            self._kunci_tulis = None
+
+    @property
+    def voting_system(self):
+        return self._voting_system
+
+    @property
+    def login_manager(self):
+        return self._login_manager
+
+    def pulihkan(self):
+        # Muat suara tersimpan lalu tandai pemilih yang sudah memilih
+        self._voting_system.pulihkan()
+        self.sinkronkan_pemilih()
+
+    def sinkronkan_pemilih(self):
+        # Dipanggil lagi setelah pemilih baru dimuat (mis. DPT diimpor setelah pemulihan)
+        for username in self._voting_system.get_log_voting():
+            user = self._login_manager.get_user(username)
+            if isinstance(user, Pemilih):
+                user.set_sudah_memilih(True)
+
+    def _cek(self, username, pilihan):
+        # pilihan: index pasangan kontes utama, atau list pilihan per kontes (surat multi-kontes)
+        if isinstance(pilihan, int):
+            surat = self._voting_system.get_pasangan_by_index(pilihan) if self._voting_system.pasangan_aktif(pilihan) else None
+        else:
+            surat = self._voting_system.kodekan_surat(pilihan)
+        if surat is None:
+            return StatusVote.PASANGAN_TIDAK_VALID, None, None
+        user = self._login_manager.get_user(username)
+        if user is None:
+            return StatusVote.USER_TIDAK_DITEMUKAN, None, None
+        if not isinstance(user, Pemilih):
+            return StatusVote.BUKAN_PEMILIH, None, None
+        if user.sudah_memilih() or self._voting_system.sudah_tercatat(username):
+            return StatusVote.SUDAH_MEMILIH, None, None
+        return StatusVote.BERHASIL, user, surat
+
+    def _catat(self, username, surat):
+        if isinstance(surat, PasanganKandidat):
+            self._voting_system.catat_suara(username, surat)
+        else:
+            self._voting_system.catat_surat(username, surat)
+
+    def _kunci_untuk(self, username):
+        return self._kunci_pemilih[hash(username) % len(self._kunci_pemilih)]
+
+    def cast_vote(self, username, pilihan):
+        if self._kunci_pemilih is None:
+            status, user, surat = self._cek(username, pilihan)
+            if status is StatusVote.BERHASIL:
+                self._catat(username, surat)
+                user.set_sudah_memilih(True)
+            return status
+
+        with self._kunci_untuk(username):
+            status, user, surat = self._cek(username, pilihan)
+            if status is StatusVote.BERHASIL:
+                with self._kunci_tulis:
+                    self._catat(username, surat)
+                    user.set_sudah_memilih(True)
+            return status
+
+    def cast_votes(self, votes):
+        # Versi batch untuk front-end jaringan: [(username, pilihan), ...] -> [StatusVote, ...]
+        # Group commit: satu fsync untuk seluruh batch sebelum membalas, di luar kunci tulis
+        # sehingga batch lain bisa menumpang fsync yang sama
+        if self._kunci_pemilih is None:
+            hasil = [self.cast_vote(username, pilihan) for username, pilihan in votes]
+            self._voting_system.flush()
+            return hasil
+
+        hasil = [None] * len(votes)
+        # Ambil kunci dalam urutan tetap agar tidak deadlock dengan batch lain
+        kunci = [k for _, k in sorted({id(k): k for k in (self._kunci_untuk(u) for u, _ in votes)}.items())]
+        for k in kunci:
+            k.acquire()
+        try:
+            diterima = set()
+            siap = []
+            for i, (username, pilihan) in enumerate(votes):
+                status, user, surat = self._cek(username, pilihan)
+                if status is StatusVote.BERHASIL and username in diterima:
+                    status = StatusVote.SUDAH_MEMILIH
+                hasil[i] = status
+                if status is StatusVote.BERHASIL:
+                    diterima.add(username)
+                    siap.append((user, surat))
+            with self._kunci_tulis:
+                for user, surat in siap:
+                    self._catat(user.username, surat)
+                    user.set_sudah_memilih(True)
+        finally:
+            for k in kunci:
+                k.release()
+        if siap:
+            self._voting_system.flush()
+        return hasil
+
+# === Data Bawaan ===
+def buat_akun_bawaan():
+    return [
+        Admin("admin", "admin123"),
+        Pemilih("dina", "111"),
+        Pemilih("eko", "222"),
+        Pemilih("sari", "333")
+    ]
+
+def tambah_pasangan_bawaan(voting_system):
+    # Tambahkan path gambar sesuai file gambar Anda
+    voting_system.tambah_pasangan(PasanganKandidat(Ketua("Andi"), Wakil("Dewi"), "Transparan dan adil", "andi_dewi.png"))
+    voting_system.tambah_pasangan(PasanganKandidat(Ketua("Budi"), Wakil("Eka"), "Amanah dan tegas", "budi_eka.png"))
+    voting_system.tambah_pasangan(PasanganKandidat(Ketua("Candra"), Wakil("Fajar"), "Bersatu dan maju", "candra_fajar.png"))
+
+# --- Registri Kandidat (data/kandidat.json) ---
+def data_kandidat(kontes):
+    # Satu entri per ID pasangan, termasuk yang ditarik (juga format op "kandidat" koordinator)
+    return [{"id": i, "ketua": p.ketua.nama, "wakil": p.wakil.nama, "visi": p.visi,
+             "gambar_path": p.gambar_path, "ditarik": not kontes.pasangan_aktif(i)}
+            for i, p in enumerate(kontes.get_kandidat_list())]
+
+def _muat_pasangan(kontes, data):
+    for k in sorted(data, key=lambda k: k["id"]):
+        # ID yang hilang dari file diisi pasangan kosong yang ditarik agar ID sesudahnya tidak bergeser
+        while len(kontes.get_kandidat_list()) < k["id"]:
+            kontes.tarik_pasangan(kontes.tambah_pasangan(PasanganKandidat(Ketua("?"), Wakil("?"), "")))
+        id_pasangan = kontes.tambah_pasangan(
+            PasanganKandidat(Ketua(k["ketua"]), Wakil(k["wakil"]), k["visi"], k.get("gambar_path")))
+        if k.get("ditarik"):
+            kontes.tarik_pasangan(id_pasangan)
+
+def simpan_kandidat(voting_system, path):
+    # List pasangan kontes utama; jika ada kontes tambahan (surat multi-kontes):
+    # {"kandidat": [...], "kontes": [{"nama", "mesin", "kandidat": [...]}, ...]}. Ditulis atomik
+    kontes = voting_system.get_kontes_list()
+    data = data_kandidat(kontes[0])
+    if len(kontes) > 1:
+        data = {"kandidat": data, "kontes": [{"nama": k.nama, "mesin": k.mesin.nama, "kandidat": data_kandidat(k)}
+                                             for k in kontes[1:]]}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def muat_kandidat(voting_system, path):
+    # Mengembalikan False jika file belum ada
+    if not os.path.exists(path):
+        return False
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        data = {"kandidat": data}
+    _muat_pasangan(voting_system, data["kandidat"])
+    for k in data.get("kontes", []):
+        kontes = voting_system.tambah_kontes(Kontes(k["nama"], MESIN_PENGHITUNG[k.get("mesin", Pluralitas.nama)]()))
+        _muat_pasangan(kontes, k["kandidat"])
+    return True
+
+def siapkan_kandidat(voting_system, path):
+    # Registri dari file; saat pertama kali diisi pasangan bawaan lalu disimpan
+    if not muat_kandidat(voting_system, path):
+        tambah_pasangan_bawaan(voting_system)
+        simpan_kandidat(voting_system, path)
+
+# === Ekspor & Rekonsiliasi ===
+KOLOM_HASIL = ["kontes", "mesin", "id", "pasangan", "suara", "persentase", "pemenang", "ditarik"]
+KOLOM_LOG = ["username", "id_pasangan", "nama_pasangan"]
+
+class _PenulisBaris:
+    # Satu baris per record ke CSV (dengan header) atau JSON Lines
+    def __init__(self, f, format, kolom):
+        self._f = f
+        self._kolom = kolom
+        self._csv = None
+        if format == "csv":
+            self._csv = csv.writer(f)
+            self._csv.writerow(kolom)
+
+    def tulis(self, nilai):
+        if self._csv is not None:
+            self._csv.writerow(nilai)
         else:
+            self._f.write(json.dumps(dict(zip(self._kolom, nilai)), ensure_ascii=False) + "\n")
+
+def ekspor_hasil(voting_system, f, format="csv"):
+    # Hasil resmi setiap kontes (menurut mesin penghitungnya); mengembalikan jumlah baris
+    penulis = _PenulisBaris(f, format, KOLOM_HASIL)
+    jumlah = 0
+    for kontes in voting_system.get_kontes_list():
+        hasil, pemenang = kontes.get_hasil()
+        for i, pasangan, nilai, persen in hasil:
+            penulis.tulis([kontes.nama, kontes.mesin.nama, i, pasangan.nama_pasangan, nilai, round(persen, 4),
+                           i in pemenang, not kontes.pasangan_aktif(i)])
+            jumlah += 1
+    return jumlah
+
+def ekspor_log(voting_system, f, format="csv", halaman=10000):
+    # Log voting per halaman LogView: tidak ada salinan log kedua di memori.
+    # id_pasangan: ID, beberapa ID dipisah ";" (approval), atau kosong untuk log lama tanpa ID
+    penulis = _PenulisBaris(f, format, KOLOM_LOG)
+    nama_log = voting_system.get_kontes_list()[0].nama_log
+    view = voting_system.cari_log()
+    for mulai in range(0, len(view), halaman):
+        for username, kunci in view.ambil_kunci(mulai, halaman):
+            if isinstance(kunci, tuple):
+                id_pasangan = ";".join(map(str, kunci))
+            else:
+                id_pasangan = kunci if isinstance(kunci, int) else None
+            penulis.tulis([username, id_pasangan, nama_log(kunci)])
+    return len(view)
+
+def _hitung_potongan(tugas):
+    # Worker rekonsiliasi: hitung suara per ID pasangan pada rentang byte [mulai, akhir).
+    # Baris yang dimulai di dalam rentang milik potongan ini, meskipun berakhir sesudahnya.
+    path, mulai, akhir, format = tugas
+    hitungan = Counter()
+    baris_dibaca = 0
+    with open(path, "rb") as f:
+        if mulai > 0:
+            f.seek(mulai - 1)
+            f.readline()  # sisa baris milik potongan sebelumnya
+        elif format == "csv":
+            f.readline()  # header
+        while f.tell() < akhir:
+            baris = f.readline()
+            if not baris:
+                break
+            teks = baris.decode("utf-8").rstrip("\r\n")
+            if not teks:
+                continue
+            if format == "csv":
+                # Tanpa tanda kutip, split biasa cukup (jauh lebih cepat dari csv.reader per baris)
+                _, id_pasangan, nama = teks.split(",", 2) if '"' not in teks else next(csv.reader([teks]))
+            else:
+                record = json.loads(teks)
+                id_pasangan, nama = record["id_pasangan"], record["nama_pasangan"]
+            if id_pasangan is None or id_pasangan == "":
+                if nama != "-":  # "-": surat approval tanpa persetujuan, tidak menambah suara siapa pun
+                    hitungan[nama] += 1  # log lama tanpa ID
+            elif isinstance(id_pasangan, int):
+                hitungan[id_pasangan] += 1
+            else:
+                for bagian in id_pasangan.split(";"):
+                    hitungan[int(bagian)] += 1
+            baris_dibaca += 1
+    return hitungan, baris_dibaca
+
+def hitung_ulang_log(path, format=None, proses=None):
+    # Hitung ulang ekspor log (CSV/JSONL) per ID pasangan, dibagi per rentang byte ke
+    # beberapa proses. Mengandalkan satu record per baris (tidak ada newline di dalam nilai).
+    # Mengembalikan (Counter per ID -- atau per nama untuk log lama --, jumlah baris).
+    format = format or ("jsonl" if path.endswith((".jsonl", ".json")) else "csv")
+    ukuran = os.path.getsize(path)
+    proses = proses or os.cpu_count() or 1
+    bagian = max(1, min(proses * 4, ukuran // (1 << 20) + 1))
+    batas = [ukuran * i // bagian for i in range(bagian + 1)]
+    tugas = [(path, batas[i], batas[i + 1], format) for i in range(bagian)]
+    if proses > 1 and bagian > 1:
+        from multiprocessing import Pool
+        with Pool(min(proses, bagian)) as pool:
+            hasil = pool.map(_hitung_potongan, tugas)
+    else:
+        hasil = map(_hitung_potongan, tugas)
+    total, jumlah_baris = Counter(), 0
+    for hitungan, n in hasil:
+        total.update(hitungan)
+        jumlah_baris += n
+    return total, jumlah_baris
+
+def rekonsiliasi(voting_system, hitungan):
+    # Bandingkan hitungan ulang log dengan hitungan tersimpan kontes utama.
+    # -> [(kunci, nama, tersimpan, hitung_ulang)]; cocok jika keduanya sama di semua baris
+    kontes = voting_system.get_kontes_list()[0]
+    tersimpan = kontes.suara_per_kunci()
+    kunci = sorted(set(tersimpan) | set(hitungan), key=lambda k: (isinstance(k, str), str(k).zfill(12)))
+    return [(k, kontes.nama_log(k), tersimpan.get(k, 0), hitungan.get(k, 0)) for k in kunci]
+
+# === Multi-Stasiun: Koordinator & Klien ===
+# Satu proses koordinator memegang VotingSystem/LoginManager; terminal adalah klien tipis.
+# Protokol: satu objek JSON per baris ({"op": ...} -> {"ok": ...}) di atas Unix socket
+# ("unix:/path/evote.sock") atau TCP localhost ("127.0.0.1:8765").
+class KoordinatorError(Exception):
+    pass
+
+def _parse_alamat(alamat):
+    if alamat.startswith("unix:"):
+        return socket.AF_UNIX, alamat[len("unix:"):]
+    host, _, port = alamat.rpartition(":")
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+class Koordinator:
+    # Umur sesi (detik) sejak login. Sesi pemilih hanya berlaku untuk satu suara
+    UMUR_SESI = {Role.PEMILIH: 900, Role.ADMIN: 1800}
+
+    def __init__(self, engine, token=None, token_stasiun=None):
+        self._engine = engine
+        self._token = token  # token bersama; stasiun = alamat/proses pengirim
+        self._token_stasiun = dict(token_stasiun or {})  # token per terminal -> nama stasiun
+        self._kunci_registrasi = threading.Lock()
+        # token sesi -> [username, kedaluwarsa, status cast]; per role agar urutan kedaluwarsa = urutan sisip
+        self._sesi = {role: OrderedDict() for role in Role}
+        self._kunci_sesi = threading.Lock()
+
+    @property
+    def terbuka(self):
+        # Tanpa token sama sekali: semua koneksi diterima tanpa "halo"
+        return self._token is None and not self._token_stasiun
+
+    def autentikasi(self, token):
+        # -> (diterima, nama stasiun jika token milik satu terminal, selain itu None)
+        token = str(token or "")
+        for milik, nama in self._token_stasiun.items():
+            if hmac.compare_digest(token, milik):
+                return True, nama
+        if self._token is None:
+            return self.terbuka, None
+        return hmac.compare_digest(token, self._token), None
+
+    def _buka_sesi(self, role, username):
+        sesi = os.urandom(16).hex()
+        with self._kunci_sesi:
+            daftar = self._sesi[role]
+            sekarang = time.monotonic()
+            while daftar and next(iter(daftar.values()))[1] <= sekarang:
+                daftar.popitem(last=False)
+            daftar[sesi] = [username, sekarang + self.UMUR_SESI[role], None]
+        return sesi
+
+    def _entri_sesi(self, role, sesi):
+        # Panggil dengan _kunci_sesi dipegang; None jika sesi tidak ada / kedaluwarsa
+        entri = self._sesi[role].get(sesi)
+        return entri if entri is not None and entri[1] > time.monotonic() else None
+
+    def _user_sesi(self, role, sesi):
+        with self._kunci_sesi:
+            entri = self._entri_sesi(role, sesi)
+        return entri[0] if entri is not None else None
+
+    def _cast(self, votes):
+        # Satu sesi pemilih = satu suara. Sesi diklaim sebelum suara dicatat dan status akhirnya
+        # disimpan di klaim itu ([Event, status]), jadi "cast" yang diulang klien setelah koneksi
+        # putus mendapat status yang sama tanpa mencatat ulang. Pilihan tidak valid melepas klaim.
+        status = [None] * len(votes)
+        sisa = list(range(len(votes)))
+        while sisa:
+            klaim, tunggu = [], []
+            with self._kunci_sesi:
+                for i in sisa:
+                    entri = self._entri_sesi(Role.PEMILIH, votes[i][0])
+                    if entri is None:
+                        status[i] = StatusVote.SESI_TIDAK_VALID
+                    elif entri[2] is None:
+                        entri[2] = [threading.Event(), None]
+                        klaim.append((i, entri, entri[2]))
+                    else:
+                        tunggu.append((i, entri[2]))  # sedang/sudah diproses permintaan lain
+            hasil = []
+            try:
+                if klaim:
+                    hasil = self._engine.cast_votes([(entri[0], votes[i][1]) for i, entri, _ in klaim])
+            finally:
+                # Juga saat cast_votes gagal (hasil kosong): klaim dilepas dan yang menunggu dibangunkan
+                with self._kunci_sesi:
+                    for (i, _, k), st in zip(klaim, hasil):
+                        status[i] = k[1] = st
+                    for _, entri, k in klaim:
+                        if k[1] is None or k[1] is StatusVote.PASANGAN_TIDAK_VALID:
+                            entri[2] = None
+                for _, _, k in klaim:
+                    k[0].set()
+            sisa = []
+            for i, k in tunggu:
+                k[0].wait()
+                if k[1] is None:
+                    sisa.append(i)  # permintaan sebelumnya gagal sebelum mencatat: klaim ulang
+                else:
+                    status[i] = k[1]
+        return status
+
+    def _tutup_sesi(self, sesi):
+        with self._kunci_sesi:
+            for daftar in self._sesi.values():
+                daftar.pop(sesi, None)
+
+    def tangani(self, req, stasiun=None):
+        # stasiun: identitas terminal pengirim, untuk pembatasan login/registrasi per stasiun
+        op = req["op"]
+        vs = self._engine.voting_system
+        lm = self._engine.login_manager
+        if op == "login":
+            status, user, tunggu = lm.masuk(req["username"], req["password"], stasiun)
+            if user is None:
+                return {"ok": False, "status": status.value, "tunggu": tunggu}
+            role = Role.PEMILIH if isinstance(user, Pemilih) else Role.ADMIN
+            return {"ok": True, "status": status.value, "role": role.value, "sesi": self._buka_sesi(role, user.username)}
+        if op == "logout":
+            self._tutup_sesi(req.get("sesi"))
+            return {"ok": True}
+        if op == "register":
+            with self._kunci_registrasi:
+                status, tunggu = lm.daftar_pemilih(req["username"], req["password"], stasiun)
+            return {"ok": status is StatusAkses.BERHASIL, "status": status.value, "tunggu": tunggu}
+        if op == "sudah_memilih":
+            # Hanya untuk diri sendiri: siapa yang sudah memilih tidak dibuka ke sembarang klien
+            username = self._user_sesi(Role.PEMILIH, req.get("sesi"))
+            if username is None:
+                raise KoordinatorError("sesi pemilih tidak valid")
+            user = lm.get_user(username)
+            return {"ok": True, "sudah_memilih": bool(user and (user.sudah_memilih() or vs.sudah_tercatat(username)))}
+        if op == "cast":
+            # votes: [sesi, pilihan]; pilihan: index pasangan, atau list pilihan per kontes (surat multi-kontes)
+            votes = [(sesi, p if isinstance(p, list) else int(p)) for sesi, p in req["votes"]]
+            return {"ok": True, "status": [st.value for st in self._cast(votes)]}
+        if op == "kandidat":
+            return {"ok": True, "kandidat": data_kandidat(vs),
+                    "kontes": [{"nama": k.nama, "mesin": k.mesin.nama, "kandidat": data_kandidat(k)}
+                               for k in vs.get_kontes_tambahan()]}
+        if op == "hasil":
+            # suara: suara langsung kontes utama (live); kontes: hasil resmi tiap kontes menurut
+            # mesinnya (urutan get_kontes_list), pemenang: pemenang resmi kontes utama
+            kontes = []
+            for k in vs.get_kontes_list():
+                hasil, pemenang = k.get_hasil()
+                kontes.append({"hasil": [[i, nilai, persen] for i, _, nilai, persen in hasil], "pemenang": list(pemenang)})
+            return {"ok": True, "suara": [vs.get_jumlah_suara(i) for i in range(len(vs.get_kandidat_list()))],
+                    "pemenang": kontes[0]["pemenang"], "kontes": kontes}
+        if op == "rekap":
+            # Hasil resmi tiap kontes menurut mesin penghitungnya
+            rekap = []
+            for kontes in vs.get_kontes_list():
+                hasil, pemenang = kontes.get_hasil()
+                rekap.append({"nama": kontes.nama, "mesin": kontes.mesin.nama,
+                              "kandidat": [p.nama_pasangan for p in kontes.get_kandidat_list()],
+                              "ditarik": [i for i in range(len(kontes.get_kandidat_list())) if not kontes.pasangan_aktif(i)],
+                              "hasil": [[i, nilai, persen] for i, _, nilai, persen in hasil],
+                              "pemenang": list(pemenang)})
+            return {"ok": True, "kontes": rekap}
+        if op == "log":
+            # Siapa memilih siapa: hanya untuk terminal yang login sebagai admin
+            if self._user_sesi(Role.ADMIN, req.get("sesi")) is None:
+                raise KoordinatorError("log voting hanya untuk admin")
+            view = vs.cari_log(req.get("awalan", ""), req.get("id_pasangan"))
+            return {"ok": True, "total": len(view), "entri": view.ambil(int(req.get("mulai", 0)), min(int(req.get("jumlah", 50)), 500))}
+        raise KoordinatorError(f"op tidak dikenal: {op}")
+
+class _HandlerKoordinator(socketserver.StreamRequestHandler):
+    def setup(self):
+        super().setup()
+        if self.request.family == socket.AF_INET:
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _stasiun_pengirim(self):
+        if self.request.family == socket.AF_INET:
+            return self.client_address[0]
+        # Socket Unix tidak punya alamat pengirim: pakai PID proses klien (Linux), selain itu
+        # tiap koneksi dihitung sebagai stasiun tersendiri
+        if hasattr(socket, "SO_PEERCRED"):
+            ukuran = struct.calcsize("3i")
+            pid, _, _ = struct.unpack("3i", self.request.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, ukuran))
+            return f"unix-pid:{pid}"
+        return f"unix-koneksi:{next(self.server.nomor_koneksi)}"
+
+    def handle(self):
+        koordinator = self.server.koordinator
+        terautentikasi = koordinator.terbuka
+        # Stasiun (kunci batas login/registrasi) selalu ditentukan koordinator, tidak pernah
+        # dari nama kiriman klien: nama terminal pemilik token (--token-stasiun), atau
+        # alamat/proses pengirim
+        pengirim = stasiun = self._stasiun_pengirim()
+        for baris in self.rfile:
+            try:
+                req = json.loads(baris)
+                if req.get("op") == "halo":
+                    terautentikasi, nama = koordinator.autentikasi(req.get("token"))
+                    stasiun = f"token:{nama}" if nama is not None else pengirim
+                    resp = {"ok": terautentikasi}
+                elif not terautentikasi:
+                    resp = {"ok": False, "error": "token salah"}
+                else:
+                    resp = koordinator.tangani(req, stasiun)
+            except (ValueError, KeyError, TypeError, KoordinatorError) as e:
+                resp = {"ok": False, "error": str(e)}
+            self.wfile.write(json.dumps(resp, ensure_ascii=False).encode("utf-8") + b"\n")
+
+class _ServerTCP(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+if hasattr(socketserver, "UnixStreamServer"):
+    class _ServerUnix(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+def jalankan_koordinator(koordinator, alamat):
+    family, target = _parse_alamat(alamat)
+    if family == socket.AF_UNIX:
+        if os.path.exists(target):
+            os.remove(target)  # socket sisa proses sebelumnya
+        server = _ServerUnix(target, _HandlerKoordinator)
+    else:
+        server = _ServerTCP(target, _HandlerKoordinator)
+    server.koordinator = koordinator
+    server.nomor_koneksi = count()
+    return server
+
+class KlienKoordinator:
+    # Klien dengan pool koneksi persisten; aman dipakai dari banyak thread
+    def __init__(self, alamat, ukuran_pool=4, token=None, timeout=10.0):
+        self._family, self._target = _parse_alamat(alamat)
+        self._token = token
+        self.sesi = None  # sesi user yang sedang login di terminal ini (diisi LoginManagerRemote)
+        self._timeout = timeout
+        self._pool = queue.LifoQueue()
+        self._slot = threading.BoundedSemaphore(ukuran_pool)
+
+    def _sambung(self):
+        sock = socket.socket(self._family, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self._timeout)
+            sock.connect(self._target)
+            if self._family == socket.AF_INET:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            koneksi = (sock, sock.makefile("rb"))
+            if not self._kirim(koneksi, {"op": "halo", "token": self._token}).get("ok"):
+                raise KoordinatorError("ditolak koordinator (token salah?)")
+        except BaseException:
+            sock.close()
+            raise
+        return koneksi
+
+    @staticmethod
+    def _tutup(koneksi):
+        sock, rfile = koneksi
+        rfile.close()
+        sock.close()
+
+    @staticmethod
+    def _kirim(koneksi, req):
+        sock, rfile = koneksi
+        sock.sendall(json.dumps(req, ensure_ascii=False).encode("utf-8") + b"\n")
+        baris = rfile.readline()
+        if not baris:
+            raise ConnectionError("koneksi ke koordinator terputus")
+        return json.loads(baris)
+
+    def panggil(self, op, **data):
+        data["op"] = op
+        with self._slot:
+            try:
+                koneksi, dari_pool = self._pool.get_nowait(), True
+            except queue.Empty:
+                koneksi, dari_pool = self._sambung(), False
+            try:
+                resp = self._kirim(koneksi, data)
+            except OSError:
+                self._tutup(koneksi)
+                if not dari_pool:
+                    raise
+                # Koneksi dari pool mungkin sudah basi: coba sekali lagi dengan koneksi baru.
+                # Aman juga untuk "cast": koordinator menyimpan status per sesi pemilih, jadi
+                # suara yang ternyata sudah tercatat tidak dicatat ulang (lihat Koordinator._cast)
+                koneksi = self._sambung()
+                try:
+                    resp = self._kirim(koneksi, data)
+                except BaseException:
+                    self._tutup(koneksi)
+                    raise
+            except BaseException:
+                # Balasan rusak/terpotong: sisa baris di koneksi ini tidak bisa dipercaya lagi
+                self._tutup(koneksi)
+                raise
+            self._pool.put(koneksi)
+        if "error" in resp:
+            raise KoordinatorError(resp["error"])
+        return resp
+
+    def cast_votes(self, votes):
+        status = self.panggil("cast", votes=[[sesi, i] for sesi, i in votes])["status"]
+        return [StatusVote(st) for st in status]
+
+    def close(self):
+        while True:
+            try:
+                koneksi = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            self._tutup(koneksi)
+
+class PengirimBatch:
+    # Menggabungkan cast_vote dari banyak thread menjadi satu permintaan "cast"
+    # (maks. ukuran suara atau setelah jeda_ms); tiap pemanggil tetap menunggu statusnya sendiri.
+    def __init__(self, klien, ukuran=64, jeda_ms=2):
+        self._klien = klien
+        self._ukuran = ukuran
+        self._jeda = jeda_ms / 1000
+        self._kondisi = threading.Condition()
+        self._antrian = []
+        self._thread = threading.Thread(target=self._kirim_terus, name="pengirim-batch", daemon=True)
+        self._thread.start()
+
+    def cast_vote(self, sesi, pair_index):
+        item = [sesi, pair_index, threading.Event(), None]
+        with self._kondisi:
+            self._antrian.append(item)
+            if len(self._antrian) == 1 or len(self._antrian) >= self._ukuran:
+                self._kondisi.notify()
+        item[2].wait()
+        if isinstance(item[3], Exception):
+            raise item[3]
+        return item[3]
+
+    def _kirim_terus(self):
+        while True:
+            with self._kondisi:
+                while not self._antrian:
+                    self._kondisi.wait()
+                if len(self._antrian) < self._ukuran:
+                    self._kondisi.wait(self._jeda)
+                batch, self._antrian = self._antrian[:self._ukuran], self._antrian[self._ukuran:]
+            try:
+                hasil = self._klien.cast_votes([(u, i) for u, i, _, _ in batch])
+                if len(hasil) != len(batch):
+                    raise KoordinatorError("jumlah status tidak sesuai batch")
+            except Exception as e:  # error apa pun diteruskan ke pemanggil; thread ini tetap hidup
+                hasil = [e] * len(batch)
+            for item, status in zip(batch, hasil):
+                item[3] = status
+                item[2].set()
+
+# --- Adaptor klien tipis untuk VotingApp ---
+class PemilihRemote(Pemilih):
+    __slots__ = ("_klien", "_sesi")
+
+    def __init__(self, klien, username, sesi):
+        self._klien = klien
+        self._username = username
+        self._sesi = sesi
+        self._password_hash = "-"  # password hanya diperiksa di koordinator
+
+    def set_sudah_memilih(self, val):
+        pass  # status dipegang koordinator
+
+    def sudah_memilih(self):
+        return self._klien.panggil("sudah_memilih", sesi=self._sesi)["sudah_memilih"]
+
+class LoginManagerRemote:
+    # Pembatasan percobaan dilakukan koordinator (stasiun ditentukan koordinator, bukan klien)
+    def __init__(self, klien):
+        self._klien = klien
+
+    def masuk(self, username, password, stasiun=None):
+        self.keluar()  # login berikutnya di terminal ini menutup sesi sebelumnya
+        resp = self._klien.panggil("login", username=username, password=password)
+        if not resp["ok"]:
+            return StatusAkses(resp["status"]), None, resp["tunggu"]
+        self._klien.sesi = resp["sesi"]
+        if resp["role"] == Role.PEMILIH.value:
+            return StatusAkses.BERHASIL, PemilihRemote(self._klien, username, resp["sesi"]), 0.0
+        return StatusAkses.BERHASIL, Admin(username, password_hash="-"), 0.0
+
+    def keluar(self):
+        sesi, self._klien.sesi = self._klien.sesi, None
+        if sesi is not None:
+            self._klien.panggil("logout", sesi=sesi)
+
+    def login(self, username, password, stasiun=None):
+        return self.masuk(username, password)[1]
+
+    def daftar_pemilih(self, username, password, stasiun=None):
+        resp = self._klien.panggil("register", username=username, password=password)
+        return StatusAkses(resp["status"]), resp["tunggu"]
+
+    def register_pemilih(self, username, password, stasiun=None):
+        return self.daftar_pemilih(username, password)[0] is StatusAkses.BERHASIL
+
+class VotingEngineRemote:
+    def __init__(self, klien):
+        self._klien = klien
+
+    def cast_vote(self, username, pilihan):
+        # Koordinator mengenali pemilih dari sesi login terminal ini, bukan dari username
+        return self._klien.cast_votes([(self._klien.sesi, pilihan)])[0]
+
+class LogViewRemote:
+    def __init__(self, klien, awalan, id_pasangan):
+        self._klien = klien
+        self._filter = {"awalan": awalan, "id_pasangan": id_pasangan, "sesi": klien.sesi}
+        self._total = self._klien.panggil("log", mulai=0, jumlah=0, **self._filter)["total"]
+
+    def __len__(self):
+        return self._total
+
+    def ambil(self, mulai, jumlah):
+        return [tuple(e) for e in self._klien.panggil("log", mulai=mulai, jumlah=jumlah, **self._filter)["entri"]]
+
+class KontesRemote:
+    # Registri satu kontes (diambil sekali saat terhubung); hasil dari cache VotingSystemRemote
+    def __init__(self, sistem, posisi, nama, kandidat):
+        self._sistem = sistem
+        self._posisi = posisi  # urutan di get_kontes_list koordinator
+        self._nama = nama
+        self._pasangan = [PasanganKandidat(Ketua(k["ketua"]), Wakil(k["wakil"]), k["visi"], k["gambar_path"])
+                          for k in kandidat]
+        self._ditarik = {k["id"] for k in kandidat if k["ditarik"]}
+
+    @property
+    def nama(self):
+        return self._nama
+
+    def get_kandidat_list(self):
+        return self._pasangan
+
+    def get_pasangan_by_index(self, index):
+        if 0 <= index < len(self._pasangan):
+            return self._pasangan[index]
+        return None
+
+    def pasangan_aktif(self, id_pasangan):
+        return 0 <= id_pasangan < len(self._pasangan) and id_pasangan not in self._ditarik
+
+    def get_hasil(self):
+        data = self._sistem._hasil()["kontes"][self._posisi]
+        return [(i, self._pasangan[i], nilai, persen) for i, nilai, persen in data["hasil"]], tuple(data["pemenang"])
+
+class VotingSystemRemote:
+    # Antarmuka baca VotingSystem yang dipakai layar GUI, dilayani koordinator.
+    # Hasil di-cache sebentar agar satu redraw = satu permintaan; pendengar dilayani dengan polling.
+    def __init__(self, klien, umur_cache=0.2, jeda_poll=0.5):
+        self._klien = klien
+        resp = klien.panggil("kandidat")
+        self._utama = KontesRemote(self, 0, "Utama", resp["kandidat"])
+        self._tambahan = [KontesRemote(self, i + 1, k["nama"], k["kandidat"]) for i, k in enumerate(resp["kontes"])]
+        self._umur_cache = umur_cache
+        self._jeda_poll = jeda_poll
+        self._cache = None
+        self._waktu_cache = 0.0
+        self._pendengar = ()
+        self._poller = None
+
+    def _hasil(self):
+        if self._cache is None or time.monotonic() - self._waktu_cache > self._umur_cache:
+            self._cache = self._klien.panggil("hasil")
+            self._waktu_cache = time.monotonic()
+        return self._cache
+
+    def get_kandidat_list(self):
+        return self._utama.get_kandidat_list()
+
+    def get_pasangan_by_index(self, index):
+        return self._utama.get_pasangan_by_index(index)
+
+    def pasangan_aktif(self, id_pasangan):
+        return self._utama.pasangan_aktif(id_pasangan)
+
+    def get_revisi_kandidat(self):
+        return 0  # registri diambil sekali saat terhubung
+
+    def get_kontes_list(self):
+        return [self._utama] + self._tambahan
+
+    def get_kontes_tambahan(self):
+        return self._tambahan
+
+    def get_total_suara(self):
+        return sum(self._hasil()["suara"])
+
+    def get_jumlah_suara(self, index):
+        return self._hasil()["suara"][index]
+
+    def get_hasil(self):
+        return self._utama.get_hasil()
+
+    def cari_log(self, awalan="", id_pasangan=None):
+        return LogViewRemote(self._klien, awalan, id_pasangan)
+
+    def tambah_pendengar(self, callback):
+        self._pendengar = self._pendengar + (callback,)
+        if self._poller is None:
+            self._poller = threading.Thread(target=self._poll, name="poll-hasil", daemon=True)
+            self._poller.start()
+
+    def hapus_pendengar(self, callback):
+        self._pendengar = tuple(c for c in self._pendengar if c is not callback)
+
+    def _poll(self):
+        sebelumnya = None
+        while True:
+            time.sleep(self._jeda_poll)
+            if not self._pendengar:
+                continue
+            try:
+                suara = self._klien.panggil("hasil")["suara"]
+            except (OSError, KoordinatorError):
+                continue
+            if sebelumnya is not None:
+                for i, (a, b) in enumerate(zip(sebelumnya, suara)):
+                    if a != b:
+                        for callback in self._pendengar:
+                            callback(i)
+            sebelumnya = suara
+
+    def close(self):
+        self._klien.close()
+
+# === Cache Gambar ===
+_PATH_GAMBAR = {}
+
+def cari_gambar(path):
+    # Path gambar yang benar-benar ada tanpa peduli huruf besar/kecil nama file (aset dikirim
+    # sebagai .PNG, data menyebut .png). Path relatif dicari dari folder kerja lalu folder
+    # program. None jika tidak ditemukan.
+    if not path:
+        return None
+    hasil = _PATH_GAMBAR.get(path)
+    if hasil is not None and os.path.exists(hasil):
+        return hasil
+    calon = [path] if os.path.isabs(path) else [path, os.path.join(os.path.dirname(os.path.abspath(__file__)), path)]
+    for p in calon:
+        if os.path.isfile(p):
+            hasil = p
+            break
+        folder, nama = os.path.split(p)
+        try:
+            isi = os.listdir(folder or ".")
+        except OSError:
+            continue
+        cocok = [n for n in isi if n.lower() == nama.lower()]
+        if cocok:
+            hasil = os.path.join(folder, cocok[0])
+            break
+    else:
+        return None
+    _PATH_GAMBAR[path] = hasil
+    return hasil
+
+class ThumbnailCache:
+    # Cache thumbnail kandidat: PhotoImage di memori (LRU) + varian yang sudah
+    # diperkecil di disk, dikunci dengan (path, mtime, ukuran file, ukuran thumbnail)
+    def __init__(self, cache_dir, kapasitas=32):
+        self._cache_dir = cache_dir
+        self._kapasitas = kapasitas
+        self._memori = OrderedDict()
+
+    def _kunci(self, path, ukuran):
+        st = os.stat(path)
+        return (os.path.abspath(path), st.st_mtime_ns, st.st_size, tuple(ukuran))
+
+    def _path_disk(self, kunci):
+        path, mtime, size, (w, h) = kunci
+        prefix = f"{hashlib.sha1(path.encode('utf-8')).hexdigest()[:16]}_{w}x{h}_"
+        versi = hashlib.sha1(f"{mtime}:{size}".encode("ascii")).hexdigest()[:12]
+        return os.path.join(self._cache_dir, prefix + versi + ".png"), prefix
+
+    def _buat_varian(self, kunci):
+        path_disk, prefix = self._path_disk(kunci)
+        Image, _ = _pil()
+        if os.path.exists(path_disk):
+            try:
+                img = Image.open(path_disk)
+                img.load()
+                return img
+            except OSError:
+                pass  # file cache rusak, buat ulang dari gambar asli
+        img = Image.open(kunci[0]).resize(kunci[3])
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            # Hapus varian lama dari gambar yang sama (mtime/ukuran file berubah)
+            for nama in os.listdir(self._cache_dir):
+                if nama.startswith(prefix):
+                    os.remove(os.path.join(self._cache_dir, nama))
+            tmp = path_disk + ".tmp"
+            img.save(tmp, format="PNG")
+            os.replace(tmp, path_disk)
+        except OSError:
+            pass  # cache disk hanya optimasi, gambar tetap ditampilkan
+        return img
+
+    def _simpan(self, kunci, img):
+        # Harus di thread Tk: PhotoImage hanya boleh dibuat di sana
+        img_tk = _pil()[1].PhotoImage(img)
+        self._memori[kunci] = img_tk
+        if len(self._memori) > self._kapasitas:
+            self._memori.popitem(last=False)
+        return img_tk
+
+    def _dari_memori(self, path, ukuran):
+        path = cari_gambar(path)
+        if not path:
+            return None, None
+        try:
+            kunci = self._kunci(path, ukuran)
+        except OSError:
+            return None, None
+        img_tk = self._memori.get(kunci)
+        if img_tk is not None:
+            self._memori.move_to_end(kunci)
+        return kunci, img_tk
+
+    def get(self, path, ukuran):
+        kunci, img_tk = self._dari_memori(path, ukuran)
+        if kunci is None or img_tk is not None:
+            return img_tk
+        try:
+            return self._simpan(kunci, self._buat_varian(kunci))
+        except OSError:
             return None
 
-    def register_pemilih(self, username, password):
-        if username in self._users:
+    def get_async(self, path, ukuran, pemuat, callback):
+        # Decode/resize di thread latar; callback(PhotoImage) dipanggil di thread Tk.
+        # Mengembalikan True jika gambar akan tersedia (langsung atau menyusul).
+        kunci, img_tk = self._dari_memori(path, ukuran)
+        if kunci is None:
             return False
-        new_user = Pemilih(username, password)
-        self._users[username] = new_user
+        if img_tk is not None:
+            callback(img_tk)
+        else:
+            pemuat.jalankan(lambda: self._buat_varian(kunci), lambda img: callback(self._simpan(kunci, img)))
         return True
 
-    def get_user(self, username):
-        return self._users.get(username)
+    def __len__(self):
+        return len(self._memori)
+
+# === Penjadwal Animasi ===
+class PenjadwalAnimasi:
+    # Satu timer `after` dengan tick tetap untuk semua pekerjaan berkala UI.
+    # Tugas milik layar (layar=True) dibatalkan sekaligus lewat batal_layar().
+    def __init__(self, widget, tick_ms=30):
+        self._widget = widget
+        self._tick_ms = tick_ms
+        self._tugas = {}  # id -> [periode (tick), sisa tick, fungsi, milik layar]
+        self._id_berikut = 0
+        self._after_id = None
+
+    def tambah(self, periode_ms, fungsi, layar=True):
+        # fungsi() dipanggil tiap periode_ms; kembalikan False untuk berhenti
+        periode = max(1, round(periode_ms / self._tick_ms))
+        self._id_berikut += 1
+        self._tugas[self._id_berikut] = [periode, periode, fungsi, layar]
+        if self._after_id is None:
+            self._after_id = self._widget.after(self._tick_ms, self._tick)
+        return self._id_berikut
+
+    def batal(self, id_tugas):
+        self._tugas.pop(id_tugas, None)
+
+    def batal_layar(self):
+        for id_tugas in [i for i, t in self._tugas.items() if t[3]]:
+            del self._tugas[id_tugas]
+
+    def berhenti(self):
+        self._tugas.clear()
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    @property
+    def jumlah_aktif(self):
+        return len(self._tugas)
+
+    def _tick(self):
+        try:
+            for id_tugas, tugas in list(self._tugas.items()):
+                tugas[1] -= 1
+                if tugas[1] > 0:
+                    continue
+                tugas[1] = tugas[0]
+                try:
+                    lanjut = tugas[2]()
+                except tk.TclError:
+                    lanjut = False  # widget sudah dihancurkan
+                except Exception as e:
+                    # Hanya tugas ini yang dihentikan; tugas lain (mis. pemuat latar) tetap berjalan
+                    print(f"Tugas animasi gagal: {e!r}", file=sys.stderr)
+                    lanjut = False
+                if lanjut is False:
+                    self._tugas.pop(id_tugas, None)
+        finally:
+            # Timer hanya berjalan selama masih ada tugas
+            self._after_id = self._widget.after(self._tick_ms, self._tick) if self._tugas else None
+
+# === Pemuat Latar ===
+class PemuatLatar:
+    # Satu thread latar untuk pekerjaan berat (decode gambar, impor DPT).
+    # Hasil diserahkan ke thread Tk lewat PenjadwalAnimasi, bukan memanggil Tk dari thread lain.
+    def __init__(self, penjadwal):
+        self._penjadwal = penjadwal
+        self._antrian = queue.Queue()
+        self._hasil = queue.Queue()
+        self._tertunda = 0
+        self._id_poll = None
+        self._thread = None
+
+    def jalankan(self, kerja, selesai=None, gagal=None):
+        # selesai(hasil) jika kerja() berhasil, gagal(exception) jika tidak; keduanya di thread Tk
+        self._tertunda += 1
+        self._antrian.put((kerja, selesai, gagal))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="pemuat-latar", daemon=True)
+            self._thread.start()
+        if self._id_poll is None:
+            self._id_poll = self._penjadwal.tambah(30, self._poll, layar=False)
+
+    def _worker(self):
+        while True:
+            kerja, selesai, gagal = self._antrian.get()
+            try:
+                self._hasil.put((selesai, kerja()))
+            except Exception as e:  # diteruskan ke thread Tk
+                self._hasil.put((gagal, e))
+
+    def _poll(self):
+        while True:
+            try:
+                callback, hasil = self._hasil.get_nowait()
+            except queue.Empty:
+                break
+            self._tertunda -= 1
+            try:
+                if callback is not None:
+                    callback(hasil)
+                elif isinstance(hasil, Exception):
+                    print(f"Pemuat latar gagal: {hasil!r}", file=sys.stderr)
+            except Exception as e:  # callback yang gagal tidak boleh menahan hasil berikutnya
+                print(f"Callback pemuat latar gagal: {e!r}", file=sys.stderr)
+        if self._tertunda == 0:
+            self._id_poll = None
+            return False
+        return True
+
+# === Manajer Layar ===
+def _path_widget(widget):
+    # Path Tk semua turunan widget, lewat dict `children` Tkinter (tanpa panggilan ke Tcl)
+    hasil = []
+    tumpukan = list(widget.children.values())
+    while tumpukan:
+        w = tumpukan.pop()
+        hasil.append(w._w)
+        tumpukan.extend(w.children.values())
+    return hasil
+
+class ManajerLayar:
+    # Setiap layar dibangun sekali di frame-nya sendiri: bangun(frame) -> perbarui(*args).
+    # Pindah layar hanya menyembunyikan frame lama (pack_forget); saat tampil lagi cukup
+    # perbarui(*args) yang mengisi ulang data ke widget yang sudah ada.
+    # Per layar dicatat: berapa kali dibangun/ditampilkan, jumlah widget yang dibuat (saat
+    # dibangun maupun sesudahnya) dan latensi navigasi sampai Tk idle (layar sudah digambar).
+    def __init__(self, induk, saat_sembunyi=None, sampel=100):
+        self._induk = induk
+        self._saat_sembunyi = saat_sembunyi
+        self._sampel = sampel
+        self._pembangun = {}
+        self._layar = {}  # nama -> (frame, perbarui)
+        self.aktif = None
+        self.metrik = {}
+
+    def daftar(self, nama, bangun):
+        self._pembangun[nama] = bangun
+        self.metrik[nama] = {"dibangun": 0, "ditampilkan": 0, "widget_dibuat": 0,
+                             "latensi_ms": deque(maxlen=self._sampel)}
+
+    def tampilkan(self, nama, *args):
+        metrik = self.metrik[nama]
+        layar = self._layar.get(nama)
+        sebelum = set(_path_widget(layar[0])) if layar is not None else set()
+        mulai = time.perf_counter()
+        if self.aktif is not None:
+            self._layar[self.aktif][0].pack_forget()
+            if self._saat_sembunyi is not None:
+                self._saat_sembunyi(self.aktif)
+        if layar is None:
+            frame = tk.Frame(self._induk, bg=self._induk.cget("bg"))
+            layar = self._layar[nama] = (frame, self._pembangun[nama](frame))
+            metrik["dibangun"] += 1
+        frame, perbarui = layar
+        self.aktif = nama
+        if perbarui is not None:
+            perbarui(*args)
+        frame.pack(fill="both", expand=True)
+        frame.focus_set()  # fokus keyboard tidak tertinggal di entry layar yang disembunyikan
+        metrik["ditampilkan"] += 1
+        metrik["widget_dibuat"] += len(set(_path_widget(frame)) - sebelum)
+        self._induk.after_idle(lambda: metrik["latensi_ms"].append((time.perf_counter() - mulai) * 1000))
+
+    def jumlah_widget(self, nama=None):
+        # Widget yang sedang hidup di satu layar, atau di semua layar yang sudah dibangun
+        nama_layar = [nama] if nama is not None else list(self._layar)
+        return sum(len(_path_widget(self._layar[n][0])) for n in nama_layar if n in self._layar)
+
+    def laporan(self):
+        baris = [f"{'layar':<16} {'dibangun':>8} {'tampil':>7} {'widget dibuat':>14} {'hidup':>6} {'p50 ms':>8} {'maks ms':>8}"]
+        for nama, m in self.metrik.items():
+            if not m["ditampilkan"]:
+                continue
+            latensi = sorted(m["latensi_ms"])
+            p50 = latensi[len(latensi) // 2] if latensi else 0.0
+            maks = latensi[-1] if latensi else 0.0
+            baris.append(f"{nama:<16} {m['dibangun']:>8} {m['ditampilkan']:>7} {m['widget_dibuat']:>14} "
+                         f"{self.jumlah_widget(nama):>6} {p50:>8.2f} {maks:>8.2f}")
+        return "\n".join(baris)
 
 # === GUI Section ===
 class VotingApp(tk.Tk):
-    def __init__(self):
+    HASIL_REDRAW_PER_DETIK = 4  # batas redraw layar hasil live
+    STASIUN_LOKAL = "lokal"  # kunci batas percobaan per stasiun (mode remote: ditentukan koordinator)
+    QUOTES = [
+        "🌟 Satu suara Anda sangat berarti!",
+        "💡 Jadilah bagian dari perubahan!",
+        "🔥 Voting hari ini, untuk masa depan esok!",
+        "😃 Jangan lupa tersenyum saat memilih!"
+    ]
+
+    def __init__(self, profile_startup=False, koordinator=None, token=None, profile_layar=False):
+        # Metrik startup: waktu (ms sejak __init__) per tahap, sampai frame pertama tampil
+        self._t_mulai = time.perf_counter()
+        self.metrik_startup = {}
+        self._profile_startup = profile_startup
+        self._profile_layar = profile_layar
         super().__init__()
+        self.catat_startup("tk_init")
         self.title("Sistem Voting - GUI")
         self.geometry("800x600")
         self.resizable(False, False)
+        self.cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
 
         # --- Background Gradient ---
         self.bg_canvas = tk.Canvas(self, width=800, height=600, highlightthickness=0)
         self.bg_canvas.pack(fill="both", expand=True)
         self.draw_gradient("#e0eafc", "#cfdef3")
+        self.catat_startup("gradient")
 
         # --- Main Frame ---
         self.main_frame = tk.Frame(self.bg_canvas, bg="#ffffff")
         self.main_frame.place(relx=0.5, rely=0.5, anchor="center", width=700, height=520)
 
         # Data
-        self.users = [
-            Admin("admin", "admin123"),
-            Pemilih("dina", "111"),
-            Pemilih("eko", "222"),
-            Pemilih("sari", "333")
-        ]
-        self.login_manager = LoginManager(self.users, admin_password="admin123")
-        self.voting_system = VotingSystem()
-        # Tambahkan path gambar sesuai file gambar Anda
-        self.voting_system.tambah_pasangan(PasanganKandidat(Ketua("Andi"), Wakil("Dewi"), "Transparan dan adil", "andi_dewi.png"))
-        self.voting_system.tambah_pasangan(PasanganKandidat(Ketua("Budi"), Wakil("Eka"), "Amanah dan tegas", "budi_eka.png"))
-        self.voting_system.tambah_pasangan(PasanganKandidat(Ketua("Candra"), Wakil("Fajar"), "Bersatu dan maju", "candra_fajar.png"))
+        self.users = []
+        self.data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+        self.remote = koordinator is not None
+        self.data_gagal = None  # pesan error jika data pemilih gagal dimuat (lihat _pemilih_gagal)
+        if self.remote:
+            # Terminal klien tipis: semua data dan aturan satu-suara ada di koordinator
+            klien = KlienKoordinator(koordinator, token=token)
+            self.login_manager = LoginManagerRemote(klien)
+            self.voting_system = VotingSystemRemote(klien)
+            self.engine = VotingEngineRemote(klien)
+            self.data_siap = True
+        else:
+            # Akun (hashing PBKDF2) dan DPT dimuat di thread latar setelah window tampil; lihat _muat_pemilih
+            self.login_manager = LoginManager(self.users, admin_password="admin123")
+            self.data_siap = False
+            store = JurnalSuara(self.data_dir)
+            try:
+                store.kunci()
+            except DataTerkunci as e:
+                messagebox.showerror("Data Terkunci", str(e))
+                self.destroy()
+                raise
+            self.voting_system = VotingSystem(store=store, audit=LogAudit(self.data_dir))
+            siapkan_kandidat(self.voting_system, os.path.join(self.data_dir, "kandidat.json"))
+            self.engine = VotingEngine(self.voting_system, self.login_manager)
+            self.engine.pulihkan()
+        self.protocol("WM_DELETE_WINDOW", self.keluar)
+        self.catat_startup("data")
 
         self.current_user = None
         self.logo_img = None
-        self.kandidat_imgs = []  # Untuk menyimpan referensi gambar kandidat
+        self._saat_bersih = []  # Dipanggil saat layar disembunyikan (misalnya melepas pendengar suara)
+        self.animasi = PenjadwalAnimasi(self)
+        self.layar = ManajerLayar(self.main_frame, saat_sembunyi=self._sembunyikan_layar)
+        for nama, bangun in [("menu_utama", self._bangun_menu_utama), ("login", self._bangun_login),
+                             ("registrasi", self._bangun_registrasi), ("menu_admin", self._bangun_menu_admin),
+                             ("menu_pemilih", self._bangun_menu_pemilih), ("kandidat", self._bangun_kandidat),
+                             ("voting", self._bangun_voting), ("hasil", self._bangun_hasil),
+                             ("log", self._bangun_log), ("kelola_kandidat", self._bangun_kelola_kandidat),
+                             ("form_kandidat", self._bangun_form_kandidat)]:
+            self.layar.daftar(nama, bangun)
+        self.pemuat = PemuatLatar(self.animasi)
+        self.thumbnail_cache = ThumbnailCache(os.path.join(self.cache_dir, "thumbnail"))
+        self._logo_kosong = tk.PhotoImage(width=120, height=120)  # placeholder selama logo dimuat
         self.show_main_menu()
-
-    def draw_gradient(self, color1, color2):
-        # Simple vertical gradient
-        for i in range(0, 600):  # <-- diperbaiki agar sesuai tinggi window
+        self.catat_startup("menu_utama")
+        self.bind("<Map>", self._saat_tampil, add="+")
+
+    # --- Metrik Startup ---
+    def _saat_tampil(self, event):
+        if event.widget is not self or "frame_pertama" in self.metrik_startup:
+            return
+        # Idle pertama setelah window di-map = frame pertama sudah digambar
+        self.after_idle(self._frame_pertama)
+
+    def _frame_pertama(self):
+        self.catat_startup("frame_pertama")
+        if self._profile_startup:
+            print(self.laporan_startup(), flush=True)
+        # Pekerjaan yang tidak dibutuhkan untuk frame pertama
+        if not self.remote:
+            self.pemuat.jalankan(self._muat_pemilih, self._pemilih_siap, self._pemilih_gagal)
+            if not self.voting_system.audit_utuh():
+                messagebox.showwarning("Log Audit", PESAN_AUDIT_PUTUS)
+        for pasangan in self.voting_system.get_kandidat_list():
+            for ukuran in ((70, 70), (60, 60)):
+                self.thumbnail_cache.get_async(pasangan.gambar_path, ukuran, self.pemuat, lambda img: None)
+
+    def _muat_pemilih(self):
+        # Thread latar: hanya menyentuh LoginManager, bukan widget
+        for user in buat_akun_bawaan():
+            self.users.append(user)
+            self.login_manager.tambah_user(user)
+        # DPT tambahan (opsional): data/pemilih.csv, sebaiknya sudah berisi kolom password_hash
+        path_dpt = os.path.join(self.data_dir, "pemilih.csv")
+        if os.path.exists(path_dpt):
+            self.login_manager.import_pemilih_csv(path_dpt)
+
+    def _pemilih_siap(self, _):
+        self.engine.sinkronkan_pemilih()
+        self.data_siap = True
+        self.catat_startup("data_pemilih_siap")
+
+    def _pemilih_gagal(self, e):
+        # Mis. pemilih.csv bukan UTF-8. Akun yang sudah termuat tetap bisa login, tetapi
+        # registrasi ditutup: username DPT yang belum termuat tidak boleh diambil orang lain
+        self.engine.sinkronkan_pemilih()
+        self.data_gagal = f"{type(e).__name__}: {e}"
+        self.data_siap = True
+        self.catat_startup("data_pemilih_gagal")
+        messagebox.showerror("Data Pemilih", f"Data pemilih gagal dimuat ({self.data_gagal}).\n"
+                             "Registrasi dinonaktifkan; perbaiki data/pemilih.csv lalu buka ulang aplikasi.")
+
+    def catat_startup(self, tahap):
+        self.metrik_startup[tahap] = (time.perf_counter() - self._t_mulai) * 1000
+        if self._profile_startup and "frame_pertama" in self.metrik_startup and tahap != "frame_pertama":
+            print(f"  {tahap:<18} {self.metrik_startup[tahap]:8.1f}  (latar)", flush=True)
+
+    def laporan_startup(self):
+        baris = ["Impor modul (ms):"]
+        for nama, ms in _WAKTU_IMPOR.items():
+            baris.append(f"  {nama:<18} {ms:8.1f}")
+        baris.append("Startup VotingApp (ms sejak __init__):")
+        sebelumnya = 0.0
+        for tahap, ms in self.metrik_startup.items():
+            baris.append(f"  {tahap:<18} {ms:8.1f}  (+{ms - sebelumnya:.1f})")
+            sebelumnya = ms
+        return "\n".join(baris)
+
+    def draw_gradient(self, color1, color2, lebar=800, tinggi=600):
+        # Gradien vertikal dirender sekali jadi gambar (di-cache di disk per warna & ukuran),
+        # lalu digambar sebagai satu item canvas
+        nama = hashlib.sha1(f"{color1}:{color2}:{lebar}x{tinggi}".encode("ascii")).hexdigest()[:16]
+        path = os.path.join(self.cache_dir, f"gradient_{nama}.png")
+        img = None
+        if os.path.exists(path):
+            try:
+                img = tk.PhotoImage(file=path)
+            except tk.TclError:
+                img = None  # file cache rusak, buat ulang
+        if img is None:
             r1, g1, b1 = self.winfo_rgb(color1)
             r2, g2, b2 = self.winfo_rgb(color2)
-            r = int(r1 + (r2 - r1) * i / 600) >> 8
-            g = int(g1 + (g2 - g1) * i / 600) >> 8
-            b = int(b1 + (b2 - b1) * i / 600) >> 8
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            self.bg_canvas.create_line(0, i, 800, i, fill=color)
+            warna = []
+            for i in range(tinggi):
+                r = int(r1 + (r2 - r1) * i / tinggi) >> 8
+                g = int(g1 + (g2 - g1) * i / tinggi) >> 8
+                b = int(b1 + (b2 - b1) * i / tinggi) >> 8
+                warna.append(f"{{#{r:02x}{g:02x}{b:02x}}}")
+            # Satu kolom 1 x tinggi diisi sekaligus, lalu diperlebar
+            kolom = tk.PhotoImage(width=1, height=tinggi)
+            kolom.put(" ".join(warna))
+            img = kolom.zoom(lebar, 1)
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp = path + ".tmp"
+                img.write(tmp, format="png")
+                os.replace(tmp, path)
+            except (OSError, tk.TclError):
+                pass  # cache disk hanya optimasi
+        self.gradient_img = img
+        self.bg_canvas.create_image(0, 0, image=img, anchor="nw")
 
     # --- Animasi Marquee (lebih smooth) ---
     def marquee(self, label, text, delay=60):
@@ -196,9 +2934,14 @@ class VotingApp(tk.Tk):
             marquee_text = label.cget("text")
             marquee_text = marquee_text[1:] + marquee_text[0]
             label.config(text=marquee_text)
-            label.after(delay, scroll)
         label.config(text=text)
         scroll()
+        self.animasi.tambah(delay, scroll)
+
+    @property
+    def jumlah_timer_aktif(self):
+        # Untuk monitoring kiosk: jumlah animasi/pekerjaan berkala yang sedang terjadwal
+        return self.animasi.jumlah_aktif
 
     # --- Utility: Entry dengan Placeholder ---
     def entry_with_placeholder(self, parent, placeholder, show=None):
@@ -217,6 +2960,12 @@ class VotingApp(tk.Tk):
         entry.bind("<FocusOut>", on_focus_out)
         return entry
 
+    def reset_placeholder(self, entry, placeholder):
+        # Kosongkan entry_with_placeholder saat layarnya ditampilkan lagi
+        entry.delete(0, tk.END)
+        entry.insert(0, placeholder)
+        entry.config(fg="#b2bec3", show="")
+
     # --- Utility: Button Style Modern ---
     def styled_button(self, parent, text, command, icon=None):
         btn = tk.Button(parent, text=f"{icon+' ' if icon else ''}{text}", width=28, font=("Segoe UI", 13, "bold"),
@@ -228,45 +2977,51 @@ class VotingApp(tk.Tk):
 
     # --- Main Menu ---
     def show_main_menu(self):
-        self.clear_frame()
-        logo_path = os.path.join(os.path.dirname(__file__), "logo.png")
-        if os.path.exists(logo_path):
-            img = Image.open(logo_path).resize((120, 120))
-            self.logo_img = ImageTk.PhotoImage(img)
-            tk.Label(self.main_frame, image=self.logo_img, bg="#ffffff").pack(pady=(28, 10))
+        self.layar.tampilkan("menu_utama")
+
+    def _bangun_menu_utama(self, frame):
+        logo_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logo.png")
+        logo_label = tk.Label(frame, image=self.logo_img or self._logo_kosong, bg="#ffffff")
+        def pasang_logo(img_tk):
+            self.logo_img = img_tk
+            if logo_label.winfo_exists():
+                logo_label.config(image=img_tk)
+        if self.logo_img or self.thumbnail_cache.get_async(logo_path, (120, 120), self.pemuat, pasang_logo):
+            logo_label.pack(pady=(28, 10))
         else:
-            tk.Label(self.main_frame, text="🗳️", font=("Segoe UI", 70), bg="#ffffff").pack(pady=(28, 10))
+            logo_label.destroy()
+            tk.Label(frame, text="🗳️", font=("Segoe UI", 70), bg="#ffffff").pack(pady=(28, 10))
 
-        title = tk.Label(self.main_frame, text="SISTEM VOTING", font=("Poppins", 24, "bold"),
+        title = tk.Label(frame, text="SISTEM VOTING", font=("Poppins", 24, "bold"),
                          bg="#ffffff", fg="#2e86c1")
         title.pack(pady=(0, 10))
 
         # Animasi teks berjalan
-        marquee_label = tk.Label(self.main_frame, font=("Segoe UI", 12), bg="#ffffff", fg="#117864")
+        marquee_label = tk.Label(frame, font=("Segoe UI", 12), bg="#ffffff", fg="#117864")
         marquee_label.pack()
-        self.marquee(marquee_label, "   Selamat datang di Sistem Voting Kelompok 3! Pilih pemimpin favoritmu dengan semangat! 🎉   ")
 
         # Tambahkan quote random
-        import random
-        quotes = [
-            "🌟 Satu suara Anda sangat berarti!",
-            "💡 Jadilah bagian dari perubahan!",
-            "🔥 Voting hari ini, untuk masa depan esok!",
-            "😃 Jangan lupa tersenyum saat memilih!"
-        ]
-        tk.Label(self.main_frame, text=random.choice(quotes), font=("Segoe UI", 11, "italic"), bg="#ffffff", fg="#636e72").pack(pady=(0, 8))
-
-        self.styled_button(self.main_frame, "Login", self.show_login, icon="🔑").pack(pady=12)
-        self.styled_button(self.main_frame, "Registrasi Pemilih", self.show_register, icon="📝").pack(pady=12)
-        self.styled_button(self.main_frame, "Keluar", self.quit, icon="❌").pack(pady=12)
+        quote_label = tk.Label(frame, font=("Segoe UI", 11, "italic"), bg="#ffffff", fg="#636e72")
+        quote_label.pack(pady=(0, 8))
+
+        self.styled_button(frame, "Login", self.show_login, icon="🔑").pack(pady=12)
+        self.styled_button(frame, "Registrasi Pemilih", self.show_register, icon="📝").pack(pady=12)
+        self.styled_button(frame, "Keluar", self.keluar, icon="❌").pack(pady=12)
+
+        def perbarui():
+            self.marquee(marquee_label, "   Selamat datang di Sistem Voting Kelompok 3! Pilih pemimpin favoritmu dengan semangat! 🎉   ")
+            quote_label.config(text=random.choice(self.QUOTES))
+        return perbarui
 
     # --- Login Window ---
     def show_login(self):
-        self.clear_frame()
-        tk.Label(self.main_frame, text="Login", font=("Poppins", 18, "bold"), bg="#ffffff").pack(pady=18)
-        entry_user = self.entry_with_placeholder(self.main_frame, "Username")
+        self.layar.tampilkan("login")
+
+    def _bangun_login(self, frame):
+        tk.Label(frame, text="Login", font=("Poppins", 18, "bold"), bg="#ffffff").pack(pady=18)
+        entry_user = self.entry_with_placeholder(frame, "Username")
         entry_user.pack(pady=4)
-        entry_pass = self.entry_with_placeholder(self.main_frame, "Password", show="*")
+        entry_pass = self.entry_with_placeholder(frame, "Password", show="*")
         entry_pass.pack(pady=4)
 
         def do_login():
@@ -274,24 +3029,36 @@ class VotingApp(tk.Tk):
             password = entry_pass.get()
             if username == "Username": username = ""
             if password == "Password": password = ""
-            user = self.login_manager.login(username, password)
+            if not self.data_siap:
+                messagebox.showinfo("Tunggu", "Data pemilih masih dimuat, coba lagi sebentar.")
+                return
+            status, user, tunggu = self.login_manager.masuk(username, password, stasiun=self.STASIUN_LOKAL)
             if user:
                 self.current_user = user
                 messagebox.showinfo("Sukses", f"Login berhasil sebagai {user.username}")
                 user.menu(self)
+            elif status is StatusAkses.DIBATASI:
+                messagebox.showerror("Gagal", f"Terlalu banyak percobaan. Coba lagi dalam {int(tunggu) + 1} detik.")
             else:
                 messagebox.showerror("Gagal", "Username atau password salah.")
 
-        self.styled_button(self.main_frame, "Login", do_login, icon="🔑").pack(pady=10)
-        self.styled_button(self.main_frame, "Kembali", self.show_main_menu, icon="⬅️").pack()
+        self.styled_button(frame, "Login", do_login, icon="🔑").pack(pady=10)
+        self.styled_button(frame, "Kembali", self.show_main_menu, icon="⬅️").pack()
+
+        def perbarui():
+            self.reset_placeholder(entry_user, "Username")
+            self.reset_placeholder(entry_pass, "Password")
+        return perbarui
 
     # --- Register Window ---
     def show_register(self):
-        self.clear_frame()
-        tk.Label(self.main_frame, text="Registrasi Pemilih", font=("Poppins", 18, "bold"), bg="#ffffff").pack(pady=18)
-        entry_user = self.entry_with_placeholder(self.main_frame, "Username")
+        self.layar.tampilkan("registrasi")
+
+    def _bangun_registrasi(self, frame):
+        tk.Label(frame, text="Registrasi Pemilih", font=("Poppins", 18, "bold"), bg="#ffffff").pack(pady=18)
+        entry_user = self.entry_with_placeholder(frame, "Username")
         entry_user.pack(pady=4)
-        entry_pass = self.entry_with_placeholder(self.main_frame, "Password", show="*")
+        entry_pass = self.entry_with_placeholder(frame, "Password", show="*")
         entry_pass.pack(pady=4)
 
         def do_register():
@@ -302,163 +3069,550 @@ class VotingApp(tk.Tk):
             if not username or not password:
                 messagebox.showwarning("Peringatan", "Username dan password harus diisi.")
                 return
-            if self.login_manager.register_pemilih(username, password):
+            if not self.data_siap:
+                messagebox.showinfo("Tunggu", "Data pemilih masih dimuat, coba lagi sebentar.")
+                return
+            if self.data_gagal:
+                messagebox.showerror("Gagal", f"Registrasi dinonaktifkan: data pemilih gagal dimuat ({self.data_gagal}).")
+                return
+            status, tunggu = self.login_manager.daftar_pemilih(username, password, stasiun=self.STASIUN_LOKAL)
+            if status is StatusAkses.BERHASIL:
                 messagebox.showinfo("Sukses", "Registrasi berhasil. Silakan login.")
                 self.show_login()
+            elif status is StatusAkses.DIBATASI:
+                messagebox.showerror("Gagal", f"Terlalu banyak registrasi dari terminal ini. Coba lagi dalam {int(tunggu) + 1} detik.")
             else:
                 messagebox.showerror("Gagal", "Username sudah digunakan.")
 
-        self.styled_button(self.main_frame, "Daftar", do_register, icon="📝").pack(pady=10)
-        self.styled_button(self.main_frame, "Kembali", self.show_main_menu, icon="⬅️").pack()
+        self.styled_button(frame, "Daftar", do_register, icon="📝").pack(pady=10)
+        self.styled_button(frame, "Kembali", self.show_main_menu, icon="⬅️").pack()
+
+        def perbarui():
+            self.reset_placeholder(entry_user, "Username")
+            self.reset_placeholder(entry_pass, "Password")
+        return perbarui
 
     # --- Admin Menu ---
     def show_admin_menu(self, user):
-        self.clear_frame()
-        tk.Label(self.main_frame, text=f"Menu Admin ({user.username})", font=("Poppins", 16, "bold"), bg="#ffffff").pack(pady=18)
-        self.styled_button(self.main_frame, "Lihat Kandidat", self.show_kandidat, icon="👥").pack(pady=7)
-        self.styled_button(self.main_frame, "Lihat Hasil Voting", self.show_hasil, icon="📊").pack(pady=7)
-        self.styled_button(self.main_frame, "Lihat Log Voting", self.show_log, icon="📝").pack(pady=7)
-        self.styled_button(self.main_frame, "Logout", self.logout, icon="⬅️").pack(pady=14)
+        self.layar.tampilkan("menu_admin", user)
+
+    def _bangun_menu_admin(self, frame):
+        judul = tk.Label(frame, font=("Poppins", 16, "bold"), bg="#ffffff")
+        judul.pack(pady=18)
+        self.styled_button(frame, "Lihat Kandidat", self.show_kandidat, icon="👥").pack(pady=7)
+        self.styled_button(frame, "Kelola Kandidat", self.show_kelola_kandidat, icon="🛠️").pack(pady=7)
+        self.styled_button(frame, "Lihat Hasil Voting", self.show_hasil, icon="📊").pack(pady=7)
+        self.styled_button(frame, "Lihat Log Voting", self.show_log, icon="📝").pack(pady=7)
+        self.styled_button(frame, "Logout", self.logout, icon="⬅️").pack(pady=14)
+
+        def perbarui(user):
+            judul.config(text=f"Menu Admin ({user.username})")
+        return perbarui
 
     # --- Pemilih Menu ---
     def show_voter_menu(self, user, sudah_memilih):
-        self.clear_frame()
-        tk.Label(self.main_frame, text=f"Menu Pemilih ({user.username})", font=("Poppins", 16, "bold"), bg="#ffffff").pack(pady=18)
-        btn_vote = self.styled_button(self.main_frame, "Voting", lambda: self.show_voting(user), icon="🗳️")
+        self.layar.tampilkan("menu_pemilih", user, sudah_memilih)
+
+    def _bangun_menu_pemilih(self, frame):
+        judul = tk.Label(frame, font=("Poppins", 16, "bold"), bg="#ffffff")
+        judul.pack(pady=18)
+        state = {"user": None}
+        btn_vote = self.styled_button(frame, "Voting", lambda: self.show_voting(state["user"]), icon="🗳️")
         btn_vote.pack(pady=7)
-        if sudah_memilih:
-            btn_vote.config(state="disabled")
-            tk.Label(self.main_frame, text="Anda sudah melakukan voting.", fg="red", bg="#ffffff", font=("Segoe UI", 10, "italic")).pack()
-        self.styled_button(self.main_frame, "Logout", self.logout, icon="⬅️").pack(pady=14)
+        info_sudah = tk.Label(frame, text="Anda sudah melakukan voting.", fg="red", bg="#ffffff", font=("Segoe UI", 10, "italic"))
+        btn_logout = self.styled_button(frame, "Logout", self.logout, icon="⬅️")
+        btn_logout.pack(pady=14)
+
+        def perbarui(user, sudah_memilih):
+            state["user"] = user
+            judul.config(text=f"Menu Pemilih ({user.username})")
+            btn_vote.config(state="disabled" if sudah_memilih else "normal")
+            if sudah_memilih:
+                info_sudah.pack(before=btn_logout)
+            else:
+                info_sudah.pack_forget()
+        return perbarui
 
     # --- Kandidat List (Card Style) ---
     def show_kandidat(self):
-        self.clear_frame()
-        tk.Label(self.main_frame, text="Daftar Pasangan Kandidat", font=("Poppins", 14, "bold"), bg="#ffffff").pack(pady=18)
-        self.kandidat_imgs = []
-
-        for i, pasangan in enumerate(self.voting_system.get_kandidat_list()):
-            card = self.create_card(self.main_frame, "#f4f8fb")
-            card.pack(anchor="w", padx=30, pady=8, fill="x")
-            if pasangan.gambar_path and os.path.exists(pasangan.gambar_path):
-                img = Image.open(pasangan.gambar_path).resize((70, 70))
-                img_tk = ImageTk.PhotoImage(img)
-                self.kandidat_imgs.append(img_tk)
-                tk.Label(card, image=img_tk, bg="#f4f8fb").pack(side="left", padx=10)
-            else:
-                tk.Label(card, text="🧑‍🤝‍🧑", font=("Segoe UI", 38), bg="#f4f8fb").pack(side="left", padx=10)
-            info = pasangan.tampilkan_info()
-            tk.Label(card, text=f"{i+1}. {info}", bg="#f4f8fb", justify="left", anchor="w", font=("Segoe UI", 12)).pack(side="left", padx=8)
-
-        self.styled_button(self.main_frame, "Kembali", lambda: self.current_user.menu(self), icon="⬅️").pack(pady=14)
+        self.layar.tampilkan("kandidat")
+
+    def _bangun_kandidat(self, frame):
+        tk.Label(frame, text="Daftar Pasangan Kandidat", font=("Poppins", 14, "bold"), bg="#ffffff").pack(pady=18)
+        wadah = tk.Frame(frame, bg="#ffffff")
+        wadah.pack(fill="x")
+        self.styled_button(frame, "Kembali", lambda: self.current_user.menu(self), icon="⬅️").pack(pady=14)
+        gambar = []  # referensi PhotoImage kartu
+
+        def bangun_kartu():
+            gambar.clear()
+            for i, pasangan in enumerate(self.voting_system.get_kandidat_list()):
+                if not self.voting_system.pasangan_aktif(i):
+                    continue
+                card = self.create_card(wadah, "#f4f8fb")
+                card.pack(anchor="w", padx=30, pady=8, fill="x")
+                img_tk = self.thumbnail_cache.get(pasangan.gambar_path, (70, 70))
+                if img_tk:
+                    gambar.append(img_tk)
+                    tk.Label(card, image=img_tk, bg="#f4f8fb").pack(side="left", padx=10)
+                else:
+                    tk.Label(card, text="🧑‍🤝‍🧑", font=("Segoe UI", 38), bg="#f4f8fb").pack(side="left", padx=10)
+                info = pasangan.tampilkan_info()
+                tk.Label(card, text=f"{i+1}. {info}", bg="#f4f8fb", justify="left", anchor="w", font=("Segoe UI", 12)).pack(side="left", padx=8)
+        return self._perbarui_jika_kandidat_berubah(wadah, bangun_kartu)
 
     # --- Voting Window (Card Style) ---
     def show_voting(self, user):
-        self.clear_frame()
-        tk.Label(self.main_frame, text="Voting", font=("Poppins", 14, "bold"), bg="#ffffff").pack(pady=18)
-        kandidat_list = self.voting_system.get_kandidat_list()
+        self.layar.tampilkan("voting", user)
+
+    def _bangun_voting(self, frame):
+        tk.Label(frame, text="Voting", font=("Poppins", 14, "bold"), bg="#ffffff").pack(pady=18)
+        wadah = tk.Frame(frame, bg="#ffffff")
+        wadah.pack(fill="x")
         var = tk.IntVar(value=-1)
-        self.kandidat_imgs = []
-
-        for i, pasangan in enumerate(kandidat_list):
-            card = self.create_card(self.main_frame, "#f4f8fb")
-            card.pack(anchor="w", padx=30, pady=8, fill="x")
-            if pasangan.gambar_path and os.path.exists(pasangan.gambar_path):
-                img = Image.open(pasangan.gambar_path).resize((70, 70))
-                img_tk = ImageTk.PhotoImage(img)
-                self.kandidat_imgs.append(img_tk)
-                tk.Label(card, image=img_tk, bg="#f4f8fb").pack(side="left", padx=10)
-            else:
-                tk.Label(card, text="🧑‍🤝‍🧑", font=("Segoe UI", 38), bg="#f4f8fb").pack(side="left", padx=10)
-            info = pasangan.tampilkan_info()
-            tk.Radiobutton(card, text=info, variable=var, value=i, bg="#f4f8fb", anchor="w", justify="left", font=("Segoe UI", 13)).pack(side="left", padx=8)
+        state = {"user": None}
+        gambar = []
+
+        def bangun_kartu():
+            gambar.clear()
+            for i, pasangan in enumerate(self.voting_system.get_kandidat_list()):
+                if not self.voting_system.pasangan_aktif(i):
+                    continue  # radio bernilai ID pasangan, jadi yang ditarik cukup dilewati
+                card = self.create_card(wadah, "#f4f8fb")
+                card.pack(anchor="w", padx=30, pady=8, fill="x")
+                img_tk = self.thumbnail_cache.get(pasangan.gambar_path, (70, 70))
+                if img_tk:
+                    gambar.append(img_tk)
+                    tk.Label(card, image=img_tk, bg="#f4f8fb").pack(side="left", padx=10)
+                else:
+                    tk.Label(card, text="🧑‍🤝‍🧑", font=("Segoe UI", 38), bg="#f4f8fb").pack(side="left", padx=10)
+                info = pasangan.tampilkan_info()
+                tk.Radiobutton(card, text=info, variable=var, value=i, bg="#f4f8fb", anchor="w", justify="left", font=("Segoe UI", 13)).pack(side="left", padx=8)
+        perbarui_kartu = self._perbarui_jika_kandidat_berubah(wadah, bangun_kartu)
+
+        # Kontes tambahan (surat multi-kontes): satu pilihan per kontes, boleh tidak memilih.
+        # Registrinya tetap selama aplikasi berjalan, jadi cukup dibangun sekali
+        var_tambahan = []
+        for kontes in self.voting_system.get_kontes_tambahan():
+            baris_kontes = tk.Frame(frame, bg="#ffffff")
+            baris_kontes.pack(anchor="w", padx=30, pady=2)
+            tk.Label(baris_kontes, text=f"{kontes.nama}:", font=("Segoe UI", 11, "bold"), bg="#ffffff").pack(side="left")
+            var_kontes = tk.IntVar(value=-1)
+            tk.Radiobutton(baris_kontes, text="Tidak memilih", variable=var_kontes, value=-1, bg="#ffffff").pack(side="left")
+            for i, pasangan in enumerate(kontes.get_kandidat_list()):
+                if kontes.pasangan_aktif(i):
+                    tk.Radiobutton(baris_kontes, text=pasangan.nama_pasangan, variable=var_kontes, value=i,
+                                   bg="#ffffff", font=("Segoe UI", 11)).pack(side="left")
+            var_tambahan.append(var_kontes)
 
         def submit_vote():
+            user = state["user"]
             idx = var.get()
             if idx == -1:
                 messagebox.showwarning("Peringatan", "Pilih salah satu pasangan kandidat. Semangat memilih! 💪")
                 return
+            pilihan = idx
+            if var_tambahan:
+                pilihan = [idx] + [v.get() if v.get() >= 0 else None for v in var_tambahan]
+            status = self.engine.cast_vote(user.username, pilihan)
+            if status is StatusVote.SUDAH_MEMILIH:
+                messagebox.showerror("Gagal", "Anda sudah melakukan voting.")
+                self.show_voter_menu(user, True)
+                return
+            if status is StatusVote.PASANGAN_TIDAK_VALID:
+                messagebox.showerror("Gagal", "Pasangan ini sudah tidak dapat dipilih.")
+                self.show_voting(user)
+                return
+            if status is StatusVote.SESI_TIDAK_VALID:
+                messagebox.showerror("Gagal", "Sesi login sudah berakhir. Silakan login kembali.")
+                self.logout()
+                return
+            if status is not StatusVote.BERHASIL:
+                messagebox.showerror("Gagal", "Suara tidak dapat dicatat.")
+                return
             pasangan = self.voting_system.get_pasangan_by_index(idx)
-            self.voting_system.tambah_suara(pasangan)
-            self.voting_system.log_voting(user.username, pasangan.nama_pasangan)
-            user.set_sudah_memilih(True)
             messagebox.showinfo("Sukses", f"Terima kasih sudah memilih pasangan: {pasangan.nama_pasangan}! 🎊")
             self.show_voter_menu(user, True)
 
-        self.styled_button(self.main_frame, "Vote", submit_vote, icon="✅").pack(pady=10)
-        self.styled_button(self.main_frame, "Kembali", lambda: self.show_voter_menu(user, user.sudah_memilih()), icon="⬅️").pack()
+        self.styled_button(frame, "Vote", submit_vote, icon="✅").pack(pady=10)
+        self.styled_button(frame, "Kembali", lambda: self.show_voter_menu(state["user"], state["user"].sudah_memilih()), icon="⬅️").pack()
+
+        def perbarui(user):
+            state["user"] = user
+            var.set(-1)
+            for v in var_tambahan:
+                v.set(-1)
+            perbarui_kartu()
+        return perbarui
 
     # --- Hasil Voting (Card Style) ---
     def show_hasil(self):
-        self.clear_frame()
-        tk.Label(self.main_frame, text="Hasil Voting", font=("Poppins", 14, "bold"), bg="#ffffff").pack(pady=18)
-        hasil, pemenang = self.voting_system.get_hasil()
-        kandidat_list = self.voting_system.get_kandidat_list()
-        self.kandidat_imgs = []
-
-        if not hasil:
-            tk.Label(self.main_frame, text="Belum ada suara masuk.", bg="#ffffff").pack()
-        else:
-            for nama, jumlah, persen in hasil:
-                pasangan = next((k for k in kandidat_list if k.nama_pasangan == nama), None)
-                card = tk.Frame(self.main_frame, bg="#f4f8fb", bd=1, relief="solid", highlightbackground="#dfe6e9", highlightthickness=1)
+        self.layar.tampilkan("hasil")
+
+    def _bangun_hasil(self, frame):
+        tk.Label(frame, text="Hasil Voting", font=("Poppins", 14, "bold"), bg="#ffffff").pack(pady=18)
+        wadah = tk.Frame(frame, bg="#ffffff")
+        wadah.pack(fill="x")
+        gambar = []
+        baris = {}
+
+        # Widget dibuat sekali; selanjutnya hanya teks label dan lebar bar yang diperbarui
+        def bangun_baris():
+            gambar.clear()
+            baris.clear()
+            for i, pasangan in enumerate(self.voting_system.get_kandidat_list()):
+                card = tk.Frame(wadah, bg="#f4f8fb", bd=1, relief="solid", highlightbackground="#dfe6e9", highlightthickness=1)
                 card.pack(anchor="w", padx=30, pady=4, fill="x")
-                if pasangan and pasangan.gambar_path and os.path.exists(pasangan.gambar_path):
-                    img = Image.open(pasangan.gambar_path).resize((60, 60))
-                    img_tk = ImageTk.PhotoImage(img)
-                    self.kandidat_imgs.append(img_tk)
+                img_tk = self.thumbnail_cache.get(pasangan.gambar_path, (60, 60))
+                if img_tk:
+                    gambar.append(img_tk)
                     tk.Label(card, image=img_tk, bg="#f4f8fb").pack(side="left", padx=6)
                 else:
                     tk.Label(card, text="🧑‍🤝‍🧑", font=("Segoe UI", 28), bg="#f4f8fb").pack(side="left", padx=6)
-                tk.Label(card, text=f"{nama}: {jumlah} suara ({persen:.2f}%)", bg="#f4f8fb", font=("Segoe UI", 12)).pack(side="left", padx=8)
-
-            winner_frame = tk.Frame(self.main_frame, bg="#ffffff")
-            winner_frame.pack(pady=(18, 0))
-            winner_label = tk.Label(
-                winner_frame,
-                text=f"🏆 Pemenang: {pemenang}",
-                font=("Segoe UI", 13, "bold"),
-                fg="#d35400",
-                bg="#ffffff"
-            )
-            winner_label.pack()
-
-            def blink(count=0):
-                if count < 8:
-                    fg = "#d35400" if count % 2 == 0 else "#ffffff"
-                    if winner_label.winfo_exists():
-                        winner_label.config(fg=fg)
-                        self.after(500, lambda: blink(count + 1))
-                else:
-                    if winner_label.winfo_exists():
-                        winner_label.config(fg="#d35400")
-            blink()
+                info = tk.Frame(card, bg="#f4f8fb")
+                info.pack(side="left", padx=8)
+                label = tk.Label(info, bg="#f4f8fb", font=("Segoe UI", 12))
+                label.pack(anchor="w")
+                track = tk.Frame(info, bg="#dfe6e9", width=360, height=8)
+                track.pack(anchor="w", pady=(4, 0))
+                bar = tk.Frame(track, bg="#2980b9")
+                bar.place(x=0, y=0, relheight=1, relwidth=0)
+                baris[i] = (label, bar)
+        perbarui_baris = self._perbarui_jika_kandidat_berubah(wadah, bangun_baris)
+
+        winner_frame = tk.Frame(frame, bg="#ffffff")
+        winner_frame.pack(pady=(18, 0))
+        winner_label = tk.Label(
+            winner_frame,
+            font=("Segoe UI", 13, "bold"),
+            fg="#d35400",
+            bg="#ffffff"
+        )
+        winner_label.pack()
+        label_tambahan = []
+        for kontes in self.voting_system.get_kontes_tambahan():
+            label = tk.Label(winner_frame, font=("Segoe UI", 11), bg="#ffffff")
+            label.pack()
+            label_tambahan.append((kontes, label))
+
+        def perbarui_angka():
+            # Angka dan pemenang resmi menurut mesin penghitung kontes (IRV: putaran terakhir,
+            # persetujuan: persen dari jumlah pemilih), bukan sekadar pilihan pertama terbanyak
+            hasil, pemenang = self.voting_system.get_hasil()
+            nilai = {i: (n, persen) for i, _, n, persen in hasil}
+            for i, (label, bar) in baris.items():
+                n, persen = nilai.get(i, (0, 0.0))
+                teks = f"{self.voting_system.get_pasangan_by_index(i).nama_pasangan}: {n} suara ({persen:.2f}%)"
+                if not self.voting_system.pasangan_aktif(i):
+                    teks += " (ditarik)"
+                if label.cget("text") != teks:
+                    label.config(text=teks)
+                    bar.place_configure(relwidth=persen / 100)
+            teks = self.teks_pemenang(pemenang) if pemenang else "Belum ada suara masuk."
+            if winner_label.cget("text") != teks:
+                winner_label.config(text=teks)
+            for kontes, label in label_tambahan:
+                pemenang = kontes.get_hasil()[1]
+                teks = f"{kontes.nama}: " + (self.teks_pemenang(pemenang, kontes) if pemenang else "belum ada suara")
+                if label.cget("text") != teks:
+                    label.config(text=teks)
+
+        # Suara bisa masuk dari thread lain: pendengar hanya menandai, redraw di thread Tk
+        # paling banyak HASIL_REDRAW_PER_DETIK kali per detik
+        ada_perubahan = set()
+        def pada_suara(index):
+            ada_perubahan.add(index)
+        def tick():
+            if ada_perubahan:
+                ada_perubahan.clear()
+                perbarui_angka()
+
+        count = [0]
+        def blink():
+            count[0] += 1
+            if count[0] < 8:
+                winner_label.config(fg="#d35400" if count[0] % 2 == 0 else "#ffffff")
+                return True
+            winner_label.config(fg="#d35400")
+            return False
 
-        self.styled_button(self.main_frame, "Kembali", lambda: self.current_user.menu(self), icon="⬅️").pack(pady=14)
+        self.styled_button(frame, "Kembali", lambda: self.current_user.menu(self), icon="⬅️").pack(pady=14)
+
+        def perbarui():
+            # Pendengar dan timer hanya hidup selama layar tampil (dilepas di _sembunyikan_layar)
+            perbarui_baris()
+            ada_perubahan.clear()
+            perbarui_angka()
+            self.voting_system.tambah_pendengar(pada_suara)
+            self._saat_bersih.append(lambda: self.voting_system.hapus_pendengar(pada_suara))
+            self.animasi.tambah(1000 // self.HASIL_REDRAW_PER_DETIK, tick)
+            winner_label.config(fg="#d35400")
+            if self.voting_system.get_total_suara():
+                count[0] = 0
+                self.animasi.tambah(500, blink)
+        return perbarui
+
+    # --- Kelola Kandidat (Admin) ---
+    def show_kelola_kandidat(self):
+        if self.remote:
+            messagebox.showinfo("Info", "Kandidat dikelola di komputer koordinator (data/kandidat.json).")
+            return
+        self.layar.tampilkan("kelola_kandidat")
+
+    def _bangun_kelola_kandidat(self, frame):
+        tk.Label(frame, text="Kelola Kandidat", font=("Poppins", 14, "bold"), bg="#ffffff").pack(pady=18)
+        wadah = tk.Frame(frame, bg="#ffffff")
+        wadah.pack(fill="x")
+
+        def bangun_baris():
+            for i, pasangan in enumerate(self.voting_system.get_kandidat_list()):
+                aktif = self.voting_system.pasangan_aktif(i)
+                card = tk.Frame(wadah, bg="#f4f8fb", highlightbackground="#dfe6e9", highlightthickness=1)
+                card.pack(anchor="w", padx=30, pady=4, fill="x")
+                tk.Label(card, text=f"{i + 1}. {pasangan.nama_pasangan}" + ("" if aktif else " (ditarik)"),
+                         bg="#f4f8fb", fg="#2d3436" if aktif else "#b2bec3", anchor="w", font=("Segoe UI", 12)).pack(side="left", padx=8, pady=6)
+                tk.Button(card, text="Aktifkan" if not aktif else "Tarik", font=("Segoe UI", 10), bd=0, bg="#dfe6e9", cursor="hand2",
+                          command=lambda i=i, aktif=aktif: self._tarik_kandidat(i, aktif)).pack(side="right", padx=4)
+                tk.Button(card, text="Ubah", font=("Segoe UI", 10), bd=0, bg="#dfe6e9", cursor="hand2",
+                          command=lambda i=i: self.show_form_kandidat(i)).pack(side="right", padx=4)
+
+        self.styled_button(frame, "Tambah Pasangan", self.show_form_kandidat, icon="➕").pack(pady=(14, 6))
+        self.styled_button(frame, "Kembali", lambda: self.current_user.menu(self), icon="⬅️").pack()
+        return self._perbarui_jika_kandidat_berubah(wadah, bangun_baris)
+
+    def _tarik_kandidat(self, id_pasangan, ditarik):
+        nama = self.voting_system.get_pasangan_by_index(id_pasangan).nama_pasangan
+        if ditarik and not messagebox.askyesno("Konfirmasi", f"Tarik pasangan {nama}? Suara yang sudah masuk tetap dihitung."):
+            return
+        self.voting_system.tarik_pasangan(id_pasangan, ditarik)
+        simpan_kandidat(self.voting_system, os.path.join(self.data_dir, "kandidat.json"))
+        self.show_kelola_kandidat()
+
+    def show_form_kandidat(self, id_pasangan=None):
+        self.layar.tampilkan("form_kandidat", id_pasangan)
+
+    def _bangun_form_kandidat(self, frame):
+        judul = tk.Label(frame, font=("Poppins", 14, "bold"), bg="#ffffff")
+        judul.pack(pady=18)
+        form = tk.Frame(frame, bg="#ffffff")
+        form.pack(padx=30)
+        isian = {}
+        for baris, kolom in enumerate(["Ketua", "Wakil", "Visi", "Gambar"]):
+            tk.Label(form, text=kolom, bg="#ffffff", font=("Segoe UI", 11), anchor="w").grid(row=baris, column=0, sticky="w", pady=4)
+            entry = tk.Entry(form, font=("Segoe UI", 11), width=36)
+            entry.grid(row=baris, column=1, padx=(10, 0), pady=4)
+            isian[kolom] = entry
+        state = {"id": None}
+
+        def simpan():
+            id_pasangan = state["id"]
+            ketua, wakil, visi, gambar = (isian[k].get().strip() for k in ("Ketua", "Wakil", "Visi", "Gambar"))
+            if not ketua or not wakil:
+                messagebox.showwarning("Peringatan", "Nama ketua dan wakil harus diisi.")
+                return
+            if gambar and cari_gambar(gambar) is None:
+                messagebox.showerror("Gagal", f"File gambar '{gambar}' tidak ditemukan.")
+                return
+            pasangan = PasanganKandidat(Ketua(ketua), Wakil(wakil), visi, gambar or None)
+            if id_pasangan is None:
+                self.voting_system.tambah_pasangan(pasangan)
+            else:
+                self.voting_system.ubah_pasangan(id_pasangan, pasangan)
+            simpan_kandidat(self.voting_system, os.path.join(self.data_dir, "kandidat.json"))
+            messagebox.showinfo("Sukses", f"Pasangan {pasangan.nama_pasangan} disimpan.")
+            self.show_kelola_kandidat()
+
+        self.styled_button(frame, "Simpan", simpan, icon="💾").pack(pady=(14, 6))
+        self.styled_button(frame, "Kembali", self.show_kelola_kandidat, icon="⬅️").pack()
+
+        def perbarui(id_pasangan=None):
+            state["id"] = id_pasangan
+            lama = None if id_pasangan is None else self.voting_system.get_pasangan_by_index(id_pasangan)
+            judul.config(text="Tambah Pasangan" if lama is None else f"Ubah Pasangan {id_pasangan + 1}")
+            awal = {"Ketua": lama.ketua.nama, "Wakil": lama.wakil.nama, "Visi": lama.visi,
+                    "Gambar": lama.gambar_path or ""} if lama else {}
+            for kolom, entry in isian.items():
+                entry.delete(0, tk.END)
+                entry.insert(0, awal.get(kolom, ""))
+        return perbarui
+
+    def teks_pemenang(self, pemenang, kontes=None):
+        kontes = kontes if kontes is not None else self.voting_system
+        nama = [kontes.get_pasangan_by_index(i).nama_pasangan for i in pemenang]
+        if len(nama) == 1:
+            return f"🏆 Pemenang: {nama[0]}"
+        return f"🤝 Seri: {', '.join(nama)}"
 
     # --- Log Voting (Card Style) ---
     def show_log(self):
-        self.clear_frame()
-        tk.Label(self.main_frame, text="Log Voting", font=("Poppins", 14, "bold"), bg="#ffffff").pack(pady=18)
-        log = self.voting_system.get_log_voting()
-        if not log:
-            tk.Label(self.main_frame, text="😅 Belum ada data voting. Yuk, ramaikan dengan suara kamu!", bg="#ffffff", fg="#e17055", font=("Segoe UI", 12, "italic")).pack()
-        else:
-            for username, pilihan in log.items():
-                card = tk.Frame(self.main_frame, bg="#f4f8fb", bd=1, relief="solid", highlightbackground="#dfe6e9", highlightthickness=1)
-                card.pack(anchor="w", padx=30, pady=4, fill="x")
-                tk.Label(card, text=f"👤 {username} memilih {pilihan} 🎉", bg="#f4f8fb", font=("Segoe UI", 12, "bold"), fg="#0984e3").pack(anchor="w", padx=8)
-        self.styled_button(self.main_frame, "Kembali", lambda: self.current_user.menu(self), icon="⬅️").pack(pady=14)
+        self.layar.tampilkan("log")
+
+    def _bangun_log(self, frame):
+        tk.Label(frame, text="Log Voting", font=("Poppins", 14, "bold"), bg="#ffffff").pack(pady=(18, 8))
+        kosong = tk.Label(frame, text="😅 Belum ada data voting. Yuk, ramaikan dengan suara kamu!", bg="#ffffff", fg="#e17055", font=("Segoe UI", 12, "italic"))
+        isi = tk.Frame(frame, bg="#ffffff")
+
+        # Filter: awalan username + pasangan
+        filter_frame = tk.Frame(isi, bg="#ffffff")
+        filter_frame.pack(padx=30, fill="x")
+        entry_cari = self.entry_with_placeholder(filter_frame, "Cari username")
+        entry_cari.pack(side="left", fill="x", expand=True)
+        semua = "Semua pasangan"
+        pilihan_pasangan = tk.StringVar(value=semua)
+        # Label bernomor agar pasangan bernama sama tetap bisa dibedakan; filter memakai ID
+        id_per_label = {}
+        opsi = tk.OptionMenu(filter_frame, pilihan_pasangan, semua)
+        opsi.config(font=("Segoe UI", 10), bg="#f4f8fb", bd=0, highlightthickness=0)
+        opsi.pack(side="left", padx=(8, 0))
+
+        # Hanya JUMLAH_BARIS label yang dibuat; isinya diganti saat scroll/pindah halaman
+        JUMLAH_BARIS = 10
+        list_frame = tk.Frame(isi, bg="#f4f8fb", highlightbackground="#dfe6e9", highlightthickness=1)
+        list_frame.pack(padx=30, pady=8, fill="x")
+        scrollbar = tk.Scrollbar(list_frame, orient="vertical")
+        scrollbar.pack(side="right", fill="y")
+        rows = []
+        for _ in range(JUMLAH_BARIS):
+            row = tk.Label(list_frame, bg="#f4f8fb", font=("Segoe UI", 11, "bold"), fg="#0984e3", anchor="w")
+            row.pack(fill="x", padx=8, pady=1)
+            rows.append(row)
+
+        nav_frame = tk.Frame(isi, bg="#ffffff")
+        nav_frame.pack(padx=30, fill="x")
+        info_label = tk.Label(nav_frame, bg="#ffffff", fg="#636e72", font=("Segoe UI", 10))
+
+        state = {"view": None, "offset": 0, "versi": None}
+
+        def render():
+            view = state["view"]
+            total = len(view)
+            offset = state["offset"] = max(0, min(state["offset"], total - JUMLAH_BARIS))
+            entri = view.ambil(offset, JUMLAH_BARIS)
+            for i, row in enumerate(rows):
+                if i < len(entri):
+                    username, pilihan = entri[i]
+                    row.config(text=f"👤 {username} memilih {pilihan} 🎉")
+                elif i == 0:
+                    row.config(text="Tidak ada entri yang cocok.")
+                else:
+                    row.config(text="")
+            if total:
+                scrollbar.set(offset / total, min(1.0, (offset + JUMLAH_BARIS) / total))
+                halaman = offset // JUMLAH_BARIS + 1
+                info_label.config(text=f"{offset + 1}-{offset + len(entri)} dari {total} • Halaman {halaman}/{(total - 1) // JUMLAH_BARIS + 1}")
+            else:
+                scrollbar.set(0, 1)
+                info_label.config(text="0 entri")
+
+        def terapkan_filter(*_):
+            awalan = entry_cari.get()
+            if awalan == "Cari username":
+                awalan = ""
+            state["view"] = self.voting_system.cari_log(awalan, id_per_label.get(pilihan_pasangan.get()))
+            state["offset"] = 0
+            render()
+
+        def geser(jumlah):
+            state["offset"] += jumlah
+            render()
+
+        def on_scrollbar(aksi, nilai, satuan=None):
+            if aksi == "moveto":
+                state["offset"] = int(float(nilai) * len(state["view"]))
+                render()
+            elif aksi == "scroll":
+                geser(int(nilai) * (JUMLAH_BARIS if satuan == "pages" else 1))
+
+        def on_wheel(event):
+            if getattr(event, "num", None) == 4 or event.delta > 0:
+                geser(-3)
+            else:
+                geser(3)
+
+        scrollbar.config(command=on_scrollbar)
+        for widget in [list_frame] + rows:
+            widget.bind("<MouseWheel>", on_wheel)
+            widget.bind("<Button-4>", on_wheel)
+            widget.bind("<Button-5>", on_wheel)
+        entry_cari.bind("<KeyRelease>", terapkan_filter, add="+")
+        pilihan_pasangan.trace_add("write", terapkan_filter)
+
+        tk.Button(nav_frame, text="◀ Sebelumnya", font=("Segoe UI", 10), bd=0, bg="#dfe6e9", cursor="hand2",
+                  command=lambda: geser(-JUMLAH_BARIS)).pack(side="left")
+        tk.Button(nav_frame, text="Berikutnya ▶", font=("Segoe UI", 10), bd=0, bg="#dfe6e9", cursor="hand2",
+                  command=lambda: geser(JUMLAH_BARIS)).pack(side="right")
+        info_label.pack(side="left", expand=True)
+
+        btn_kembali = self.styled_button(frame, "Kembali", lambda: self.current_user.menu(self), icon="⬅️")
+        btn_kembali.pack(pady=10)
+
+        def perbarui_opsi():
+            # Item menu pasangan hanya diganti jika registri kandidat berubah
+            versi = self._versi_kandidat()
+            if versi == state["versi"]:
+                return
+            state["versi"] = versi
+            id_per_label.clear()
+            id_per_label.update((f"{i + 1}. {p.nama_pasangan}", i) for i, p in enumerate(self.voting_system.get_kandidat_list()))
+            menu = opsi["menu"]
+            menu.delete(0, "end")
+            for label in [semua, *id_per_label]:
+                menu.add_command(label=label, command=tk._setit(pilihan_pasangan, label))
+
+        def perbarui():
+            if not len(self.voting_system.cari_log()):
+                isi.pack_forget()
+                kosong.pack(before=btn_kembali)
+                return
+            kosong.pack_forget()
+            isi.pack(fill="x", before=btn_kembali)
+            perbarui_opsi()
+            self.reset_placeholder(entry_cari, "Cari username")
+            pilihan_pasangan.set(semua)  # memicu terapkan_filter lewat trace
+        return perbarui
 
     # --- Logout ---
     def logout(self):
+        if self.remote:
+            self.login_manager.keluar()
         self.current_user = None
         self.show_main_menu()
 
+    def keluar(self):
+        if self._profile_layar:
+            print(self.layar.laporan(), flush=True)
+        self.animasi.berhenti()
+        if self.remote:
+            try:
+                self.login_manager.keluar()  # sesi tidak dibiarkan hidup sampai kedaluwarsa
+            except (OSError, KoordinatorError):
+                pass
+        self.voting_system.close()
+        self.destroy()
+
     # --- Utility ---
-    def clear_frame(self):
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
+    def _sembunyikan_layar(self, nama):
+        # Animasi dan pendengar milik layar hanya hidup selama layar itu tampil
+        self.animasi.batal_layar()
+        while self._saat_bersih:
+            self._saat_bersih.pop()()
+
+    def _versi_kandidat(self):
+        # Berubah jika pasangan ditambah/diubah/ditarik; dipakai untuk membangun ulang kartu seperlunya.
+        # Penghitung revisi, bukan id() objek: memori pasangan yang dibuang bisa dipakai ulang
+        return self.voting_system.get_revisi_kandidat()
+
+    def _perbarui_jika_kandidat_berubah(self, wadah, bangun):
+        # Isi `wadah` dibangun ulang oleh bangun() hanya jika registri kandidat berubah
+        versi = [None]
+        def perbarui():
+            sekarang = self._versi_kandidat()
+            if sekarang != versi[0]:
+                versi[0] = sekarang
+                for widget in wadah.winfo_children():
+                    widget.destroy()
+                bangun()
+        return perbarui
 
     def create_card(self, parent, bg, **kwargs):
         # Card dengan efek shadow dan hover
@@ -475,6 +3629,152 @@ class VotingApp(tk.Tk):
         card.bind("<Leave>", on_leave)
         return card
 
+def main_koordinator(args):
+    store = JurnalSuara(args.data, fsync_batch=args.fsync_batch)
+    try:
+        store.kunci()  # sebelum impor DPT yang lama
+    except DataTerkunci as e:
+        print(e, file=sys.stderr)
+        return 2
+    tersimpan = store.baca_mesin()
+    if args.mesin and tersimpan and tersimpan[0] != args.mesin:
+        print(f"--mesin {args.mesin} tidak cocok dengan data di {args.data} (mesin tersimpan: {tersimpan[0]})",
+              file=sys.stderr)
+        return 2
+    login_manager = LoginManager(buat_akun_bawaan(), admin_password="admin123", iterasi_hash=args.iterasi)
+    path_dpt = args.dpt or os.path.join(args.data, "pemilih.csv")
+    if os.path.exists(path_dpt):
+        diimpor, dilewati = login_manager.import_pemilih_csv(path_dpt, proses=args.proses)
+        print(f"DPT: {diimpor} pemilih diimpor, {dilewati} dilewati", flush=True)
+    voting_system = VotingSystem(store=store, mesin=MESIN_PENGHITUNG[args.mesin or Pluralitas.nama](),
+                                 audit=LogAudit(args.data, fsync_batch=args.fsync_batch, kunci=args.kunci_audit))
+    siapkan_kandidat(voting_system, os.path.join(args.data, "kandidat.json"))
+    engine = VotingEngine(voting_system, login_manager, thread_safe=True)
+    engine.pulihkan()
+    if not voting_system.audit_utuh():
+        print(f"PERINGATAN: {PESAN_AUDIT_PUTUS}", file=sys.stderr, flush=True)
+    token_stasiun = {}
+    if args.token_stasiun:
+        with open(args.token_stasiun, "r", encoding="utf-8") as f:
+            token_stasiun = {token: nama for nama, token in json.load(f).items()}
+    server = jalankan_koordinator(Koordinator(engine, token=args.token, token_stasiun=token_stasiun), args.alamat)
+    print(f"Koordinator siap di {args.alamat}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        voting_system.close()
+    return 0
+
+def _muat_voting_system(args):
+    # Baca data suara tanpa mengubah file, jadi aman dijalankan saat koordinator hidup.
+    # Mesin penghitung diambil dari data (lihat VotingSystem.pulihkan)
+    voting_system = VotingSystem(store=JurnalSuara(args.data, baca_saja=True))
+    if not muat_kandidat(voting_system, os.path.join(args.data, "kandidat.json")):
+        tambah_pasangan_bawaan(voting_system)
+    voting_system.pulihkan()
+    return voting_system
+
+def main_ekspor(args):
+    voting_system = _muat_voting_system(args)
+    format = args.format or ("jsonl" if args.keluaran.endswith((".jsonl", ".json")) else "csv")
+    ekspor = ekspor_log if args.isi == "log" else ekspor_hasil
+    if args.keluaran == "-":
+        jumlah = ekspor(voting_system, sys.stdout, format)
+    else:
+        with open(args.keluaran, "w", encoding="utf-8", newline="") as f:
+            jumlah = ekspor(voting_system, f, format)
+    print(f"{jumlah} baris {args.isi} diekspor", file=sys.stderr)
+    return 0
+
+def main_rekonsiliasi(args):
+    voting_system = _muat_voting_system(args)
+    mulai = time.perf_counter()
+    hitungan, jumlah_baris = hitung_ulang_log(args.log, args.format, args.proses)
+    durasi = time.perf_counter() - mulai
+    baris = rekonsiliasi(voting_system, hitungan)
+    print(f"{'id':>4} {'pasangan':<30} {'tersimpan':>10} {'hitung ulang':>13} {'selisih':>8}")
+    for kunci, nama, tersimpan, hitung_ulang in baris:
+        id_teks = kunci if isinstance(kunci, int) else "-"
+        print(f"{id_teks:>4} {nama:<30} {tersimpan:>10} {hitung_ulang:>13} {hitung_ulang - tersimpan:>+8}")
+    cocok = all(tersimpan == hitung_ulang for _, _, tersimpan, hitung_ulang in baris)
+    print(f"{jumlah_baris} baris log dihitung ulang dalam {durasi:.2f} detik: {'COCOK' if cocok else 'TIDAK COCOK'}")
+    return 0 if cocok else 1
+
+def main_audit(args):
+    audit = LogAudit(args.data, kunci=args.kunci_audit)
+    mulai = time.perf_counter()
+    ok, diperiksa, pesan = audit.verifikasi(penuh=args.penuh)
+    durasi = time.perf_counter() - mulai
+    print(f"{'OK' if ok else 'GAGAL'}: {pesan} ({diperiksa} entri diperiksa dalam {durasi:.2f} detik)")
+    return 0 if ok else 1
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sistem Voting - GUI")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="tampilkan waktu tiap tahap startup sampai frame pertama")
+    parser.add_argument("--profile-layar", action="store_true",
+                        help="saat keluar, tampilkan jumlah widget dan latensi navigasi per layar")
+    parser.add_argument("--koordinator", metavar="ALAMAT",
+                        help="jalankan sebagai terminal klien, mis. unix:/tmp/evote.sock atau 127.0.0.1:8765")
+    parser.add_argument("--token", default=os.environ.get("EVOTE_TOKEN"), help="token bersama koordinator")
+    sub = parser.add_subparsers(dest="perintah")
+    data_default = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+    p = sub.add_parser("koordinator", help="jalankan koordinator multi-stasiun (tanpa GUI)")
+    p.add_argument("--alamat", default="127.0.0.1:8765")
+    p.add_argument("--data", default=data_default)
+    p.add_argument("--dpt", help="CSV DPT (default: <data>/pemilih.csv jika ada)")
+    p.add_argument("--fsync-batch", type=int, default=1,
+                   help="fsync setidaknya tiap N suara; balasan 'cast' tetap menunggu fsync batch-nya")
+    p.add_argument("--mesin", choices=sorted(MESIN_PENGHITUNG),
+                   help="mesin penghitung kontes utama untuk data baru (default: pluralitas); "
+                        "data yang sudah ada memakai mesin yang tersimpan")
+    p.add_argument("--iterasi", type=int, default=None, help="iterasi PBKDF2 untuk registrasi baru")
+    p.add_argument("--proses", type=int, default=None, help="jumlah proses untuk hashing saat impor DPT")
+    p.add_argument("--token", default=os.environ.get("EVOTE_TOKEN"), help="token bersama untuk terminal")
+    p.add_argument("--token-stasiun", metavar="JSON",
+                   help='file {"nama stasiun": "token", ...}: tiap terminal memakai tokennya sendiri (--token) '
+                        "dan dibatasi per nama stasiun itu")
+    p.add_argument("--kunci-audit", default=os.environ.get("EVOTE_KUNCI_AUDIT"),
+                   help="kunci HMAC untuk checkpoint log audit")
+
+    p = sub.add_parser("ekspor", help="ekspor hasil atau log voting ke CSV / JSON Lines")
+    p.add_argument("--data", default=data_default)
+    p.add_argument("--isi", choices=["hasil", "log"], default="hasil")
+    p.add_argument("--format", choices=["csv", "jsonl"], help="default: dari ekstensi --keluaran, atau csv")
+    p.add_argument("--keluaran", default="-", help="path file (default: stdout)")
+
+    p = sub.add_parser("rekonsiliasi", help="hitung ulang ekspor log dan cocokkan dengan hitungan tersimpan")
+    p.add_argument("log", help="hasil 'ekspor --isi log' (CSV atau JSONL)")
+    p.add_argument("--data", default=data_default)
+    p.add_argument("--format", choices=["csv", "jsonl"], help="default: dari ekstensi file log")
+    p.add_argument("--proses", type=int, default=None, help="jumlah proses (default: jumlah CPU)")
+
+    p = sub.add_parser("audit", help="verifikasi rantai hash log audit")
+    p.add_argument("--data", default=data_default)
+    p.add_argument("--penuh", action="store_true", help="periksa dari entri pertama, bukan dari checkpoint terakhir")
+    p.add_argument("--kunci-audit", default=os.environ.get("EVOTE_KUNCI_AUDIT"),
+                   help="kunci HMAC untuk memeriksa tanda tangan checkpoint")
+
+    args = parser.parse_args(argv)
+    if args.perintah == "koordinator":
+        return main_koordinator(args)
+    if args.perintah == "ekspor":
+        return main_ekspor(args)
+    if args.perintah == "rekonsiliasi":
+        return main_rekonsiliasi(args)
+    if args.perintah == "audit":
+        return main_audit(args)
+    try:
+        app = VotingApp(profile_startup=args.profile_startup, koordinator=args.koordinator, token=args.token,
+                        profile_layar=args.profile_layar)
+    except DataTerkunci:
+        return 2  # pesan sudah ditampilkan
+    app.mainloop()
+    return 0
+
 if __name__ == "__main__":
-    app = VotingApp()
-    app.mainloop()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file